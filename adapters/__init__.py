@@ -1,5 +1,5 @@
 """Adapter package exports."""
 
-from .base import connect_db, get_adapter, tracked_call
+from .base import connect_db, flush_api_usage, get_adapter, tracked_call
 
-__all__ = ["tracked_call", "get_adapter", "connect_db"]
+__all__ = ["tracked_call", "flush_api_usage", "get_adapter", "connect_db"]
@@ -11,9 +11,7 @@ import csv
 from io import StringIO
 from typing import Any
 
-import httpx
-
-from .base import tracked_call
+from .base import get_http_client, tracked_call
 
 BASE_URL = "https://data.gov.au/data/api/3/action/package_search"
 
@@ -33,17 +31,17 @@ def _csv_resource_url(payload: dict[str, Any]) -> str | None:
 async def list_new_filings(identifier: str, since: str):
     """Return ASIC register metadata records for the configured identifier."""
     params: dict[str, str | int] = {"q": f"ASIC companies {identifier}", "rows": 5}
-    async with httpx.AsyncClient() as client:
-        async with tracked_call("au", BASE_URL) as log:
-            response = await client.get(BASE_URL, params=params)
+    client = get_http_client()
+    async with tracked_call("au", BASE_URL) as log:
+        response = await client.get(BASE_URL, params=params)
+        log(response)
+    response.raise_for_status()
+    csv_url = _csv_resource_url(response.json())
+    if csv_url:
+        async with tracked_call("au", csv_url) as log:
+            response = await client.get(csv_url)
             log(response)
         response.raise_for_status()
-        csv_url = _csv_resource_url(response.json())
-        if csv_url:
-            async with tracked_call("au", csv_url) as log:
-                response = await client.get(csv_url)
-                log(response)
-            response.raise_for_status()
     return [
         {
             "id": identifier,
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import logging
 import os
+import queue
+import random
 import sqlite3
+import threading
 import time
-from collections.abc import Callable
-from contextlib import asynccontextmanager
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from importlib import import_module
 from types import ModuleType
 from typing import Any, Protocol
 
+import httpx
+
 from config import load_runtime_config
 
 try:
@@ -21,6 +29,20 @@ except ImportError:  # pragma: no cover - optional dependency
 else:  # pragma: no cover - imported above when available
     psycopg = _psycopg
 
+try:
+    from psycopg_pool import ConnectionPool as _ConnectionPool
+except ImportError:  # pragma: no cover - optional dependency
+    ConnectionPool: Any | None = None
+else:  # pragma: no cover - imported above when available
+    ConnectionPool = _ConnectionPool
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
+else:  # pragma: no cover - imported above when available
+    _HTTP2_AVAILABLE = True
+
 logger = logging.getLogger(__name__)
 DEFAULT_SQLITE_DB_PATH = "manager_database.db"
 
@@ -44,6 +66,42 @@ def _db_retry_config(
     return max(0, retries), max(0.0, retry_delay)
 
 
+def _backoff_cap() -> float:
+    try:
+        return max(0.0, float(os.getenv("DB_BACKOFF_CAP", "30")))
+    except ValueError:
+        return 30.0
+
+
+def backoff_delay(base: float, attempt: int) -> float:
+    """Return a full-jitter exponential backoff delay for ``attempt`` (0-based).
+
+    The sleep is drawn uniformly from ``[0, min(cap, base * 2**attempt)]`` so
+    clients recovering from the same outage do not retry in lockstep. The cap
+    comes from ``DB_BACKOFF_CAP`` (seconds, default 30).
+    """
+    return random.uniform(0.0, min(_backoff_cap(), base * (2**attempt)))
+
+
+def _connect_with_retry(
+    connect: Callable[[], Any],
+    errors: type[BaseException] | tuple[type[BaseException], ...],
+    retries: int,
+    retry_delay: float,
+) -> Any:
+    """Call ``connect`` until it succeeds, backing off with jitter between tries."""
+    attempt = 0
+    while True:
+        try:
+            return connect()
+        except errors:
+            # Retry a few times to let the database recover before failing.
+            if attempt >= retries:
+                raise
+            time.sleep(backoff_delay(retry_delay, attempt))
+            attempt += 1
+
+
 def connect_db(
     db_path: str | None = None,
     *,
@@ -55,7 +113,6 @@ def connect_db(
     config = load_runtime_config()
     url = config.db_url
     retries, retry_delay = _db_retry_config(retries, retry_delay)
-    attempt = 0
     if url:
         if not url.startswith("postgres"):
             raise RuntimeError(
@@ -67,34 +124,95 @@ def connect_db(
                 "DB_URL is configured for Postgres, but psycopg is not installed. "
                 "Install psycopg[binary] or unset DB_URL for SQLite."
             )
+        pg = psycopg
         # psycopg connections require autocommit for DDL during tests.
         # Allow health checks to cap connection time.
         connect_kwargs: dict[str, Any] = {"autocommit": True}
         if connect_timeout is not None:
             connect_kwargs["connect_timeout"] = connect_timeout
-        while True:
-            try:
-                return psycopg.connect(url, **connect_kwargs)
-            except psycopg.Error:
-                # Retry a few times to let the database recover before failing.
-                if attempt >= retries:
-                    raise
-                time.sleep(retry_delay * (2**attempt))
-                attempt += 1
-    path = db_path or config.db_path
+        return _connect_with_retry(
+            lambda: pg.connect(url, **connect_kwargs), pg.Error, retries, retry_delay
+        )
+    path = str(db_path or config.db_path)
     # SQLite timeout prevents long waits on locked files during health checks.
     sqlite_kwargs: dict[str, Any] = {}
     if connect_timeout is not None:
         sqlite_kwargs["timeout"] = connect_timeout
-    while True:
+    # Transient filesystem/db startup issues get the same retry budget.
+    return _connect_with_retry(
+        lambda: sqlite3.connect(path, **sqlite_kwargs), sqlite3.Error, retries, retry_delay
+    )
+
+
+# Request handlers borrow Postgres connections from a pool so each request pays
+# for a query rather than a TCP + TLS + auth handshake.
+_DB_POOLS: dict[str, Any] = {}
+_DB_POOL_LOCK = threading.Lock()
+
+
+def _db_pool_max_size() -> int:
+    return max(1, int(os.getenv("DB_POOL_MAX", "8")))
+
+
+def db_pool_timeout() -> float:
+    """Return how long a handler waits to borrow a pooled connection, in seconds.
+
+    ``DB_POOL_TIMEOUT`` overrides it. By default it matches the worst-case
+    backoff ``connect_db`` sleeps through its retries, so an unreachable
+    database fails about as fast through the pool as it did without one.
+    """
+    raw = os.getenv("DB_POOL_TIMEOUT")
+    if raw:
         try:
-            return sqlite3.connect(str(path), **sqlite_kwargs)
-        except sqlite3.Error:
-            # Retry a few times to allow transient filesystem/db startup issues.
-            if attempt >= retries:
-                raise
-            time.sleep(retry_delay * (2**attempt))
-            attempt += 1
+            return max(0.1, float(raw))
+        except ValueError:
+            logger.warning("Invalid DB_POOL_TIMEOUT value: %s", raw)
+    retries, retry_delay = _db_retry_config(None, None)
+    budget = sum(min(_backoff_cap(), retry_delay * (2**attempt)) for attempt in range(retries))
+    # Keep a floor so ordinary contention for a busy pool is not reported as an outage.
+    return max(1.0, budget)
+
+
+def get_pool() -> Any | None:
+    """Return the shared Postgres connection pool for ``DB_URL``.
+
+    Returns ``None`` when ``DB_URL`` is unset or not Postgres, or when
+    ``psycopg_pool`` is not installed; callers then fall back to ``connect_db``.
+    """
+    url = load_runtime_config().db_url
+    if not url or not url.startswith("postgres") or ConnectionPool is None:
+        return None
+    pool = _DB_POOLS.get(url)
+    if pool is not None:
+        return pool
+    with _DB_POOL_LOCK:
+        pool = _DB_POOLS.get(url)
+        if pool is None:
+            # Match connect_db: handlers rely on autocommit for writes and DDL.
+            pool = ConnectionPool(
+                url,
+                min_size=1,
+                max_size=_db_pool_max_size(),
+                kwargs={"autocommit": True},
+                open=True,
+            )
+            _DB_POOLS[url] = pool
+    return pool
+
+
+def close_db_pools() -> None:
+    """Close every request-handler connection pool; the next request reopens one."""
+    with _DB_POOL_LOCK:
+        pools = list(_DB_POOLS.values())
+        _DB_POOLS.clear()
+    for pool in pools:
+        try:
+            pool.close()
+        except Exception:
+            logger.warning("Failed to close database connection pool", exc_info=True)
+
+
+atexit.register(close_db_pools)
 
 
 def is_sqlite(conn: Any) -> bool:
@@ -206,37 +324,388 @@ def _ensure_postgres_usage_schema(conn: Any) -> None:
             cost_usd NUMERIC(10,4)
         )""")
     conn.execute("SELECT to_regclass('api_usage')")
-    conn.execute("""
-        DO $$
-        BEGIN
-          IF NOT EXISTS (
-            SELECT 1 FROM pg_matviews
-            WHERE schemaname = current_schema() AND matviewname = 'monthly_usage'
-          ) THEN
-            EXECUTE $mv$
-              CREATE MATERIALIZED VIEW monthly_usage AS
-              SELECT date_trunc('month', ts) AS month,
-                     source,
-                     count(*)        AS calls,
-                     sum(bytes)      AS mb,
-                     sum(cost_usd)   AS cost
-              FROM api_usage
-              GROUP BY 1, 2
-            $mv$;
-          END IF;
-        END
-        $$;
-        """)
 
 
 def ensure_api_usage_schema(conn: Any) -> None:
-    """Ensure the api_usage table and monthly_usage view exist for the active dialect."""
+    """Ensure the api_usage table exists for the active dialect.
+
+    SQLite also gets its plain ``monthly_usage`` view. The Postgres materialized
+    view is left to :func:`init_usage_schema` (and the canonical migrations) so
+    usage writes never plan its DDL.
+    """
     if is_sqlite(conn):
         _ensure_sqlite_usage_schema(conn)
         return
     _ensure_postgres_usage_schema(conn)
 
 
+def init_usage_schema(conn: Any) -> None:
+    """Idempotent setup for API usage tables and the monthly rollup.
+
+    Every statement is idempotent, so the daily diff flow runs it before each
+    refresh; deployments using the Alembic migrations or ``schema.sql`` already
+    have ``monthly_usage`` and only pay the refresh.
+    """
+    ensure_api_usage_schema(conn)
+    if is_sqlite(conn):
+        return
+    conn.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS monthly_usage AS
+        SELECT date_trunc('month', ts) AS month,
+               source,
+               count(*)        AS calls,
+               sum(bytes)      AS mb,
+               sum(cost_usd)   AS cost
+        FROM api_usage
+        GROUP BY 1, 2
+        """)
+    refresh_usage_view(conn)
+
+
+def refresh_usage_view(conn: Any) -> None:
+    """Refresh the ``monthly_usage`` materialized view (Postgres only).
+
+    Scheduled flows call this instead of recomputing the rollup on usage writes.
+    """
+    if not is_postgres(conn):
+        return
+    try:
+        # CONCURRENTLY needs a unique index so readers are not blocked.
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS monthly_usage_idx ON monthly_usage (month, source)"
+        )
+        conn.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY monthly_usage")
+    except Exception as exc:
+        # Fresh environments without the migration applied have no view yet.
+        if "does not exist" in str(exc).lower():
+            logger.debug("monthly_usage refresh skipped (view does not exist)")
+        else:
+            raise
+
+
+# Usage logging runs on every adapter HTTP call, so connections are reused
+# instead of paying a connect handshake (and schema DDL) per call.
+_USAGE_POOLS: dict[str, Any] = {}
+_USAGE_POOL_LOCK = threading.Lock()
+_USAGE_SQLITE_LOCAL = threading.local()
+# Targets (DB URL or SQLite path) whose usage schema has been ensured by a
+# reused connection in this process.
+_SCHEMA_READY: set[str] = set()
+_SCHEMA_LOCK = threading.Lock()
+
+
+def _get_usage_pool(url: str) -> Any:
+    pool = _USAGE_POOLS.get(url)
+    if pool is not None:
+        return pool
+    pool_cls = ConnectionPool
+    if pool_cls is None:
+        raise RuntimeError(
+            "Pooled usage logging requires psycopg_pool; install psycopg_pool or "
+            "unset DB_URL for SQLite."
+        )
+    with _USAGE_POOL_LOCK:
+        pool = _USAGE_POOLS.get(url)
+        if pool is None:
+            pool = pool_cls(
+                url,
+                min_size=1,
+                max_size=_db_pool_max_size(),
+                open=True,
+            )
+            _USAGE_POOLS[url] = pool
+    return pool
+
+
+def _sqlite_usage_connections() -> dict[str, sqlite3.Connection]:
+    connections = getattr(_USAGE_SQLITE_LOCAL, "connections", None)
+    if connections is None:
+        connections = {}
+        _USAGE_SQLITE_LOCAL.connections = connections
+    return connections
+
+
+def _close_sqlite_usage_connections() -> None:
+    cached = _sqlite_usage_connections()
+    for conn in cached.values():
+        try:
+            conn.close()
+        except sqlite3.Error:
+            logger.warning("Failed to close API usage SQLite connection", exc_info=True)
+    cached.clear()
+
+
+_SQLITE_JOURNAL_MODES = frozenset({"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"})
+_SQLITE_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+
+
+def _sqlite_pragma_env(name: str, default: str, allowed: frozenset[str]) -> str:
+    value = os.getenv(name, default).strip().upper()
+    if value in allowed:
+        return value
+    logger.warning("Invalid %s; using default", name, extra={"value": value})
+    return default
+
+
+def _configure_sqlite_usage_connection(conn: sqlite3.Connection) -> None:
+    # api_usage is an append-only log read by offline analytics. WAL lets those
+    # readers proceed without blocking on (or blocking) the writer, and with
+    # synchronous=NORMAL commits skip the per-transaction fsync; the trade-off
+    # is that the last few commits may be lost on power failure.
+    journal_mode = _sqlite_pragma_env("SQLITE_JOURNAL_MODE", "WAL", _SQLITE_JOURNAL_MODES)
+    synchronous = _sqlite_pragma_env("SQLITE_SYNCHRONOUS", "NORMAL", _SQLITE_SYNCHRONOUS_MODES)
+    conn.execute(f"PRAGMA journal_mode={journal_mode}")
+    conn.execute(f"PRAGMA synchronous={synchronous}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+
+
+@contextmanager
+def _usage_connection(db_path: str | None) -> Iterator[tuple[Any, str | None]]:
+    """Yield a connection for usage logging and the schema key it is reused under.
+
+    Postgres connections come from a process-wide ``psycopg_pool`` pool and SQLite
+    connections are cached per thread (in WAL mode unless ``SQLITE_JOURNAL_MODE``
+    says otherwise). Any other connection is opened through
+    ``connect_db`` and closed afterwards; its key is ``None`` so schema DDL is not
+    skipped for it.
+    """
+    config = load_runtime_config()
+    url = config.db_url
+    if url and url.startswith("postgres") and ConnectionPool is not None:
+        with _get_usage_pool(url).connection() as conn:
+            yield conn, url
+        return
+    if not url:
+        path = str(db_path or config.db_path)
+        key = path if path == ":memory:" else os.path.abspath(path)
+        cached = _sqlite_usage_connections()
+        conn = cached.get(key)
+        if conn is None:
+            conn = connect_db(db_path)
+            if is_sqlite(conn):
+                _configure_sqlite_usage_connection(conn)
+                cached[key] = conn
+                _SCHEMA_READY.discard(key)
+        if is_sqlite(conn):
+            try:
+                yield conn, key
+            except BaseException:
+                conn.rollback()
+                raise
+            return
+    else:
+        conn = connect_db(db_path)
+    try:
+        yield conn, None
+    finally:
+        conn.close()
+
+
+def _ensure_usage_schema_once(conn: Any, key: str | None) -> None:
+    """Run the usage schema DDL at most once per reused connection target."""
+    if key is None:
+        ensure_api_usage_schema(conn)
+        return
+    if key in _SCHEMA_READY:
+        return
+    with _SCHEMA_LOCK:
+        if key not in _SCHEMA_READY:
+            ensure_api_usage_schema(conn)
+            _SCHEMA_READY.add(key)
+
+
+_UsageRow = tuple[str, str, int, int, int, float]
+
+# Usage rows are written by a single background thread in batches so the
+# request path never blocks on an INSERT + commit. A thread (rather than an
+# asyncio task) survives the per-flow event loops that Prefect creates.
+_USAGE_FLUSH = "flush"
+_USAGE_CLOSE = "close"
+_USAGE_QUEUE: queue.Queue[tuple[str | None, _UsageRow] | str] = queue.Queue()
+_USAGE_FLUSHER: threading.Thread | None = None
+_USAGE_FLUSHER_LOCK = threading.Lock()
+
+
+def _usage_batch_size() -> int:
+    return max(1, int(os.getenv("API_USAGE_BATCH_SIZE", "500")))
+
+
+def _usage_flush_seconds() -> float:
+    return max(0.0, float(os.getenv("API_USAGE_FLUSH_MS", "200"))) / 1000
+
+
+# Below this many rows a COPY round-trip is not worth it; plain INSERTs are used.
+_USAGE_COPY_MIN_ROWS = 10
+_USAGE_COPY_SQL = (
+    "COPY api_usage (source, endpoint, status, bytes, latency_ms, cost_usd) FROM STDIN"
+)
+_INSERT_USAGE_SQL_SQLITE = (
+    "INSERT INTO api_usage(source, endpoint, status, bytes, latency_ms, cost_usd)"
+    " VALUES (?,?,?,?,?,?)"
+)
+_INSERT_USAGE_SQL_POSTGRES = (
+    "INSERT INTO api_usage(source, endpoint, status, bytes, latency_ms, cost_usd)"
+    " VALUES (%s,%s,%s,%s,%s,%s)"
+)
+
+
+def _insert_usage_rows(conn: Any, rows: list[_UsageRow]) -> None:
+    if is_sqlite(conn):
+        conn.executemany(_INSERT_USAGE_SQL_SQLITE, rows)
+        return
+    if len(rows) >= _USAGE_COPY_MIN_ROWS:
+        with conn.cursor() as cur, cur.copy(_USAGE_COPY_SQL) as copy:
+            for row in rows:
+                copy.write_row(row)
+        return
+    with conn.cursor() as cur:
+        cur.executemany(_INSERT_USAGE_SQL_POSTGRES, rows)
+
+
+def _write_usage_batch(batch: list[tuple[str | None, _UsageRow]]) -> None:
+    grouped: dict[str | None, list[_UsageRow]] = {}
+    for db_path, row in batch:
+        grouped.setdefault(db_path, []).append(row)
+    for db_path, rows in grouped.items():
+        try:
+            with _usage_connection(db_path) as (conn, schema_key):
+                _ensure_usage_schema_once(conn, schema_key)
+                _insert_usage_rows(conn, rows)
+                conn.commit()
+        except Exception:
+            logger.warning(
+                "Failed to record API usage metrics",
+                extra={"rows": len(rows), "source": rows[0][0], "endpoint": rows[0][1]},
+                exc_info=True,
+            )
+
+
+def _collect_usage_batch(
+    first: tuple[str | None, _UsageRow],
+    batch_size: int,
+    flush_seconds: float,
+) -> tuple[list[tuple[str | None, _UsageRow]], str | None]:
+    """Gather queued rows until the batch is full, the flush window ends, or a command arrives."""
+    batch = [first]
+    deadline = time.monotonic() + flush_seconds
+    while len(batch) < batch_size:
+        remaining = deadline - time.monotonic()
+        try:
+            if remaining > 0:
+                item = _USAGE_QUEUE.get(timeout=remaining)
+            else:
+                item = _USAGE_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+        if isinstance(item, str):
+            return batch, item
+        batch.append(item)
+    return batch, None
+
+
+def _run_usage_flusher(batch_size: int, flush_seconds: float) -> None:
+    while True:
+        item = _USAGE_QUEUE.get()
+        command = item if isinstance(item, str) else None
+        batch: list[tuple[str | None, _UsageRow]] = []
+        if not isinstance(item, str):
+            batch, command = _collect_usage_batch(item, batch_size, flush_seconds)
+        try:
+            if batch:
+                _write_usage_batch(batch)
+            if command == _USAGE_CLOSE:
+                _close_sqlite_usage_connections()
+        finally:
+            for _ in range(len(batch) + (command is not None)):
+                _USAGE_QUEUE.task_done()
+        if command == _USAGE_CLOSE:
+            return
+
+
+def _ensure_usage_flusher() -> None:
+    global _USAGE_FLUSHER
+    if _USAGE_FLUSHER is not None and _USAGE_FLUSHER.is_alive():
+        return
+    with _USAGE_FLUSHER_LOCK:
+        if _USAGE_FLUSHER is None or not _USAGE_FLUSHER.is_alive():
+            _USAGE_FLUSHER = threading.Thread(
+                target=_run_usage_flusher,
+                args=(_usage_batch_size(), _usage_flush_seconds()),
+                name="api-usage-flusher",
+                daemon=True,
+            )
+            _USAGE_FLUSHER.start()
+
+
+def _enqueue_usage(db_path: str | None, row: _UsageRow) -> None:
+    _ensure_usage_flusher()
+    _USAGE_QUEUE.put((db_path, row))
+
+
+def flush_api_usage() -> None:
+    """Block until every queued ``api_usage`` row has been written (or dropped on error)."""
+    flusher = _USAGE_FLUSHER
+    if flusher is None or not flusher.is_alive():
+        return
+    _USAGE_QUEUE.put(_USAGE_FLUSH)
+    _USAGE_QUEUE.join()
+
+
+def close_usage_connections() -> None:
+    """Flush queued usage rows, then close every usage-logging connection.
+
+    Stops the background flusher (the next tracked call restarts it) and forgets
+    which schemas were ensured, so the next write re-runs the DDL.
+    """
+    flusher = _USAGE_FLUSHER
+    if flusher is not None and flusher.is_alive():
+        # SQLite connections are cached per thread; the flusher closes its own
+        # after writing everything queued ahead of the close command, then exits.
+        _USAGE_QUEUE.put(_USAGE_CLOSE)
+        _USAGE_QUEUE.join()
+        flusher.join()
+    with _USAGE_POOL_LOCK:
+        pools = list(_USAGE_POOLS.values())
+        _USAGE_POOLS.clear()
+    for pool in pools:
+        try:
+            pool.close()
+        except Exception:
+            logger.warning("Failed to close API usage connection pool", exc_info=True)
+    _close_sqlite_usage_connections()
+    _SCHEMA_READY.clear()
+
+
+atexit.register(close_usage_connections)
+
+
+def _response_size(resp: Any) -> int:
+    """Return the decoded body size for usage metrics without reading the body.
+
+    A body the caller already read is measured directly, as ``len(content)``
+    always was. For unread streams an identity-encoded ``Content-Length`` is the
+    decoded size too; compressed streams fall back to ``num_bytes_downloaded``,
+    which counts wire bytes because the decoded size is not known.
+    """
+    if resp is None:
+        return 0
+    try:
+        content = getattr(resp, "content", None)
+    except httpx.ResponseNotRead:
+        content = None
+    if content is not None:
+        return len(content)
+    headers = getattr(resp, "headers", None)
+    # Content-Length is the encoded size, so it only matches for identity bodies.
+    if headers is not None and headers.get("content-encoding", "identity") in ("", "identity"):
+        try:
+            return max(0, int(headers.get("content-length", "")))
+        except (TypeError, ValueError):
+            pass
+    return int(getattr(resp, "num_bytes_downloaded", 0) or 0)
+
+
 @asynccontextmanager
 async def tracked_call(
     source: str,
@@ -247,6 +716,11 @@ async def tracked_call(
 ):
     """Record API usage metrics in the ``api_usage`` table.
 
+    Rows are queued and written in batches by a background thread; call
+    :func:`flush_api_usage` when they must be visible immediately. The recorded
+    ``bytes`` are measured by :func:`_response_size`, so streamed bodies are
+    never read just to be measured.
+
     Parameters
     ----------
     source:
@@ -282,8 +756,7 @@ async def tracked_call(
         resp = container.get("resp")
         latency = int((time.perf_counter() - start) * 1000)
         status = getattr(resp, "status_code", 0)
-        size = len(getattr(resp, "content", b""))
-        conn: Any | None = None
+        size = _response_size(resp)
         try:
             if callable(cost_usd):
                 computed_cost = float(cost_usd(resp)) if resp is not None else 0.0
@@ -291,40 +764,102 @@ async def tracked_call(
                 computed_cost = float(cost_usd)
             else:
                 computed_cost = 0.0
-            conn = connect_db(db_path)
-            ensure_api_usage_schema(conn)
-            placeholder = get_placeholder(conn)
-            values_clause = ",".join([placeholder] * 6)
-            sql = (
-                "INSERT INTO api_usage(source, endpoint, status, bytes, latency_ms, cost_usd)"
-                f" VALUES ({values_clause})"
-            )
-            conn.execute(sql, (source, endpoint, status, size, latency, computed_cost))
-            conn.commit()
+            _enqueue_usage(db_path, (source, endpoint, status, size, latency, computed_cost))
         except Exception:
             logger.warning(
                 "Failed to record API usage metrics",
                 extra={"source": source, "endpoint": endpoint},
                 exc_info=True,
             )
-        finally:
-            if conn is not None:
-                try:
-                    conn.close()
-                except Exception:
-                    logger.warning(
-                        "Failed to close API usage metrics connection",
-                        extra={"source": source, "endpoint": endpoint},
-                        exc_info=True,
-                    )
+
+
+# Adapters share one keep-alive client per event loop so repeated requests to
+# the same host reuse TCP/TLS connections. httpx clients are bound to the loop
+# that opened their connections, and Prefect runs flows under separate loops.
+_HTTP_CLIENTS: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+# Sized for batched downloads; HTTP/2 multiplexes them over fewer connections
+# when the optional ``h2`` package is installed.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_HTTP_TIMEOUT = 30.0
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared adapter HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _HTTP_CLIENTS.get(loop)
+    if client is None or getattr(client, "is_closed", False):
+        # Clients of loops that have since closed cannot be awaited; drop them.
+        for stale_loop in [known for known in _HTTP_CLIENTS if known.is_closed()]:
+            del _HTTP_CLIENTS[stale_loop]
+        client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+        )
+        _HTTP_CLIENTS[loop] = client
+    return client
+
+
+async def aclose_http_client() -> None:
+    """Close the running event loop's shared adapter HTTP client, if any."""
+    client = _HTTP_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+_EXHAUSTED = object()
+
+
+async def iter_downloads(
+    download: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    *,
+    window: int = 1,
+) -> AsyncGenerator[tuple[Any, Any], None]:
+    """Yield ``(item, await download(item))`` in input order, prefetching ahead.
+
+    At most ``window`` downloads are in flight or waiting to be consumed, so
+    memory stays bounded by the window rather than the number of items; a window
+    of 1 is plain sequential downloading. A failure is raised in input order and
+    cancels every download still pending, as does closing the generator early.
+    """
+    window = max(1, window)
+    iterator = iter(items)
+    pending: deque[tuple[Any, asyncio.Future[Any]]] = deque()
+
+    def _fill() -> None:
+        while len(pending) < window:
+            item = next(iterator, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return
+            pending.append((item, asyncio.ensure_future(download(item))))
+
+    try:
+        _fill()
+        while pending:
+            item, future = pending.popleft()
+            result = await future
+            yield item, result
+            # Refill only once the caller is done with this result.
+            _fill()
+    finally:
+        for _item, future in pending:
+            future.cancel()
+        if pending:
+            await asyncio.gather(*(future for _item, future in pending), return_exceptions=True)
 
 
 ADAPTERS: dict[str, AdapterProtocol] = {}
 
 
 def get_adapter(jurisdiction: str) -> AdapterProtocol:
-    """Return an adapter module for the given jurisdiction."""
-    if jurisdiction not in ADAPTERS:
-        module = import_module(f"adapters.{jurisdiction}")
-        ADAPTERS[jurisdiction] = module  # type: ignore[assignment]
-    return ADAPTERS[jurisdiction]
+    """Return an adapter module for the given jurisdiction.
+
+    Cached adapters are returned without locking. On a miss the module is
+    resolved through ``import_module``, which waits for an import still running
+    in another thread, and ``ADAPTERS.setdefault`` keeps whichever result is
+    cached first, so concurrent first calls all get the same adapter.
+    """
+    adapter = ADAPTERS.get(jurisdiction)
+    if adapter is not None:
+        return adapter
+    module = import_module(f"adapters.{jurisdiction}")
+    return ADAPTERS.setdefault(jurisdiction, module)  # type: ignore[arg-type]
@@ -7,20 +7,30 @@ import logging
 import os
 import re
 from collections.abc import Iterable, Mapping
+from datetime import UTC, datetime
 from decimal import Decimal
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from io import BytesIO
 from time import monotonic
 from typing import Any
-from xml.etree import ElementTree as ET
 
 import httpx
+from lxml import etree
 
 from utils.numeric import parse_finite_float
 
-from .base import tracked_call
+from .base import backoff_delay, get_http_client, tracked_call
 
 USER_AGENT = os.getenv("EDGAR_UA", "manager-intel/0.1")
 BASE_URL = "https://data.sec.gov"
 EFTS_URL = "https://efts.sec.gov/LATEST/search-index"
+ARCHIVES_URL = "https://www.sec.gov"
+# Bound str.format templates, built once at import rather than per request.
+_SUBMISSIONS_URL = (BASE_URL + "/submissions/CIK{cik:0>10}.json").format
+_FILING_DOCUMENT_URL = (
+    ARCHIVES_URL + "/Archives/edgar/data/{cik}/{accession}/primary_doc.xml"
+).format
 DEFAULT_FORM_TYPES = ["13F-HR"]
 THIRTEEN_F_FORMS = {"13F-HR", "13F-HR/A", "13-F"}
 ACTIVISM_FORMS = {"SC 13D", "SC 13D/A", "SC 13G", "SC 13G/A"}
@@ -48,6 +58,42 @@ _last_edgar_request_at: float | None = None
 _edgar_request_lock = asyncio.Lock()
 
 
+async def _wait_for_request_slot() -> None:
+    """Pace outbound SEC requests to ``EDGAR_MIN_REQUEST_INTERVAL``."""
+    global _last_edgar_request_at
+
+    async with _edgar_request_lock:
+        if _last_edgar_request_at is not None and EDGAR_MIN_REQUEST_INTERVAL > 0:
+            elapsed = monotonic() - _last_edgar_request_at
+            if elapsed < EDGAR_MIN_REQUEST_INTERVAL:
+                await asyncio.sleep(EDGAR_MIN_REQUEST_INTERVAL - elapsed)
+        _last_edgar_request_at = monotonic()
+
+
+# 4xx responses worth retrying; any other client error fails immediately.
+_RETRYABLE_CLIENT_STATUSES = frozenset({408, 425, 429})
+# Upper bound on a server-provided Retry-After so one response cannot stall a flow.
+_MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Return the ``Retry-After`` delay in seconds (delta or HTTP-date), if any."""
+    value = response.headers.get("retry-after", "").strip()
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        seconds = (when - datetime.now(UTC)).total_seconds()
+    return min(max(0.0, seconds), _MAX_RETRY_AFTER_SECONDS)
+
+
 async def _request_with_retry(
     client: httpx.AsyncClient,
     url: str,
@@ -57,14 +103,7 @@ async def _request_with_retry(
     max_retries: int = 3,
     params: dict[str, str] | None = None,
 ) -> httpx.Response:
-    global _last_edgar_request_at
-
-    async with _edgar_request_lock:
-        if _last_edgar_request_at is not None and EDGAR_MIN_REQUEST_INTERVAL > 0:
-            elapsed = monotonic() - _last_edgar_request_at
-            if elapsed < EDGAR_MIN_REQUEST_INTERVAL:
-                await asyncio.sleep(EDGAR_MIN_REQUEST_INTERVAL - elapsed)
-        _last_edgar_request_at = monotonic()
+    await _wait_for_request_slot()
 
     for attempt in range(1, max_retries + 1):
         try:
@@ -77,6 +116,19 @@ async def _request_with_retry(
             response.raise_for_status()
             return response
         except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+            error_response = exc.response if isinstance(exc, httpx.HTTPStatusError) else None
+            status = error_response.status_code if error_response is not None else None
+            if (
+                status is not None
+                and 400 <= status < 500
+                and status not in _RETRYABLE_CLIENT_STATUSES
+            ):
+                logger.error(
+                    "EDGAR request failed with non-retryable status",
+                    extra={"url": url, "status": status, "attempts": attempt},
+                    exc_info=exc,
+                )
+                raise
             if attempt >= max_retries:
                 logger.error(
                     "EDGAR request failed after retries",
@@ -84,7 +136,11 @@ async def _request_with_retry(
                     exc_info=exc,
                 )
                 raise
-            wait = 0.5 * attempt
+            # Honour the server's Retry-After (429/503) before falling back to jitter.
+            retry_after = (
+                _retry_after_seconds(error_response) if error_response is not None else None
+            )
+            wait = retry_after if retry_after is not None else backoff_delay(0.5, attempt - 1)
             logger.warning(
                 "EDGAR request failed; retrying",
                 extra={"url": url, "attempt": attempt, "max_retries": max_retries},
@@ -93,6 +149,8 @@ async def _request_with_retry(
     raise RuntimeError("EDGAR request retry loop ended unexpectedly")
 
 
+# Submissions payloads repeat a small vocabulary of form types thousands of times.
+@lru_cache(maxsize=256)
 def _normalize_form_type(form_type: str) -> str:
     normalized = re.sub(r"\s+", " ", form_type.strip().upper())
     if normalized == "13-F":
@@ -170,18 +228,49 @@ def _normalize_13f_rows_from_table(table: Any) -> list[dict[str, int | str]]:
     return rows
 
 
-def _legacy_parse_13f(raw: str) -> list[dict[str, int | str]]:
-    root = ET.fromstring(raw)
+def _legacy_parse_13f(raw: str | bytes) -> list[dict[str, int | str]]:
+    # Stream infoTable rows (namespaced or not) rather than building the full tree.
+    data = raw.encode("utf-8") if isinstance(raw, str) else raw
     rows: list[dict[str, int | str]] = []
-    for info in root.findall(".//infoTable"):
-        rows.append(
+    add_row = rows.append
+    for _event, info in etree.iterparse(
+        BytesIO(data),
+        events=("end",),
+        tag="{*}infoTable",
+        resolve_entities=False,
+        remove_comments=True,
+        remove_pis=True,
+    ):
+        # One pass over the direct children, matched on local name, instead of a
+        # wildcard findtext() per field: each "{*}" path is re-resolved per call.
+        name = cusip = value = shares = None
+        for child in info:
+            tag = child.tag
+            local = tag[tag.rfind("}") + 1 :]
+            if local == "nameOfIssuer":
+                name = child.text
+            elif local == "cusip":
+                cusip = child.text
+            elif local == "value":
+                value = child.text
+            elif local == "shrsOrPrnAmt":
+                for amount in child:
+                    amount_tag = amount.tag
+                    if amount_tag[amount_tag.rfind("}") + 1 :] == "sshPrnamt":
+                        shares = amount.text
+        # Only call int() on real text; empty or missing amounts are recorded as 0.
+        add_row(
             {
-                "nameOfIssuer": (info.findtext("nameOfIssuer") or ""),
-                "cusip": (info.findtext("cusip") or ""),
-                "value": int(info.findtext("value") or 0),
-                "sshPrnamt": int(info.findtext("shrsOrPrnAmt/sshPrnamt") or 0),
+                "nameOfIssuer": name or "",
+                "cusip": cusip or "",
+                "value": int(value) if value else 0,
+                "sshPrnamt": int(shares) if shares else 0,
             }
         )
+        # Free each subtree once read so large information tables stay bounded.
+        info.clear(keep_tail=True)
+        while info.getprevious() is not None:
+            del info.getparent()[0]
     return rows
 
 
@@ -351,39 +440,38 @@ async def list_new_filings(
     headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
     filings: list[dict[str, str]] = []
 
-    async with httpx.AsyncClient() as client:
-        if any(_is_13f_form(form) for form in requested_forms):
-            url = f"{BASE_URL}/submissions/CIK{cik.zfill(10)}.json"
-            response = await _request_with_retry(client, url, headers, source="edgar")
-            payload = _json_mapping(response.json())
-            filings_data = _json_mapping(payload.get("filings"))
-            recent = _json_mapping(filings_data.get("recent"))
-            forms = _json_iterable(recent.get("form"))
-            dates = _json_iterable(recent.get("filingDate"))
-            accessions = _json_iterable(recent.get("accessionNumber"))
-            for form, filed, accession in zip(forms, dates, accessions, strict=False):
-                normalized = _normalize_form_type(str(form))
-                if normalized in requested_forms and str(filed) > since:
-                    filings.append(
-                        {
-                            "accession": str(accession),
-                            "cik": cik,
-                            "filed": str(filed),
-                        }
-                    )
+    client = get_http_client()
+    if any(_is_13f_form(form) for form in requested_forms):
+        url = _SUBMISSIONS_URL(cik=cik)
+        response = await _request_with_retry(client, url, headers, source="edgar")
+        payload = _json_mapping(response.json())
+        filings_data = _json_mapping(payload.get("filings"))
+        recent = _json_mapping(filings_data.get("recent"))
+        forms = _json_iterable(recent.get("form"))
+        dates = _json_iterable(recent.get("filingDate"))
+        accessions = _json_iterable(recent.get("accessionNumber"))
+        wanted = frozenset(requested_forms)
+        normalize = _normalize_form_type
+        # Check the cheap date comparison first so older history skips form
+        # normalization entirely.
+        filings.extend(
+            {"accession": str(accession), "cik": cik, "filed": filed_date}
+            for form, filed, accession in zip(forms, dates, accessions, strict=False)
+            if (filed_date := str(filed)) > since and normalize(str(form)) in wanted
+        )
 
-        activism_forms = [form for form in requested_forms if _is_activism_form(form)]
-        if activism_forms:
-            filings.extend(
-                await _search_efts_filings(
-                    client,
-                    cik=cik,
-                    since=since,
-                    headers=headers,
-                    manager_name=manager_name,
-                    form_types=activism_forms,
-                )
+    activism_forms = [form for form in requested_forms if _is_activism_form(form)]
+    if activism_forms:
+        filings.extend(
+            await _search_efts_filings(
+                client,
+                cik=cik,
+                since=since,
+                headers=headers,
+                manager_name=manager_name,
+                form_types=activism_forms,
             )
+        )
 
     filings = _unique_filings(filings)
     if not filings:
@@ -391,21 +479,54 @@ async def list_new_filings(
     return filings
 
 
-async def download(filing: dict[str, str]) -> str:
-    """Download a filing's primary document."""
+def _filing_document_url(filing: dict[str, str]) -> str:
     url = filing.get("url")
     if url:
-        if url.startswith("/"):
-            url = f"https://www.sec.gov{url}"
-    else:
-        accession = filing["accession"].replace("-", "")
-        cik = filing["cik"].zfill(10)
-        url = f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{accession}/primary_doc.xml"
+        return ARCHIVES_URL + url if url.startswith("/") else url
+    # Archive paths use the unpadded CIK and the accession number without dashes.
+    return _FILING_DOCUMENT_URL(
+        cik=int(filing["cik"]), accession=filing["accession"].replace("-", "")
+    )
+
 
+async def download(filing: dict[str, str]) -> str:
+    """Download a filing's primary document."""
+    url = _filing_document_url(filing)
     headers = {"User-Agent": USER_AGENT}
-    async with httpx.AsyncClient() as client:
-        response = await _request_with_retry(client, url, headers, source="edgar")
-        return response.text
+    client = get_http_client()
+    response = await _request_with_retry(client, url, headers, source="edgar")
+    return response.text
+
+
+# Downloads kept in flight by ``download_many`` and the ingest flows' prefetch window.
+DOWNLOAD_CONCURRENCY = 8
+
+
+async def download_many(
+    filings: Iterable[dict[str, str]],
+    *,
+    concurrency: int = DOWNLOAD_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Download several filings concurrently, returning bodies in input order.
+
+    At most ``concurrency`` downloads are in flight at once; request starts are
+    still spaced by ``EDGAR_MIN_REQUEST_INTERVAL`` so the SEC rate limit holds.
+    With ``return_exceptions`` a failed download is returned in its slot instead
+    of being raised.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _download_one(filing: dict[str, str]) -> str:
+        async with semaphore:
+            return await download(filing)
+
+    return list(
+        await asyncio.gather(
+            *(_download_one(filing) for filing in filings),
+            return_exceptions=return_exceptions,
+        )
+    )
 
 
 def _extract_label_value(raw_text: str, label: str) -> str | None:
@@ -551,18 +672,27 @@ def parse_13g(raw_text: str) -> dict[str, object]:
     }
 
 
+def _decode_filing(raw: str | bytes) -> str:
+    return raw if isinstance(raw, str) else raw.decode("utf-8", errors="replace")
+
+
 async def parse(
-    raw: str,
+    raw: str | bytes,
     form_type: str | None = None,
 ) -> list[dict[str, int | str]] | dict[str, object]:
-    """Parse a filing payload into holdings rows or activism metadata."""
+    """Parse a filing payload into holdings rows or activism metadata.
+
+    ``raw`` may be the decoded text from :func:`download` or the undecoded body;
+    the legacy 13F parser reads bytes directly.
+    """
     if form_type and _is_activism_form(form_type):
+        text = _decode_filing(raw)
         if "13D" in _normalize_form_type(form_type):
-            return parse_13d(raw)
-        return parse_13g(raw)
+            return parse_13d(text)
+        return parse_13g(text)
 
     try:
-        return _parse_13f_with_edgartools(raw)
+        return _parse_13f_with_edgartools(_decode_filing(raw))
     except _EdgartoolsSetupError:
         logger.warning(
             "Falling back to legacy 13F parser after edgartools setup failure", exc_info=True
@@ -8,9 +8,7 @@ returns deterministic unsupported statuses instead of silent success.
 
 from __future__ import annotations
 
-import httpx
-
-from .base import tracked_call
+from .base import get_http_client, tracked_call
 
 BASE_URL = "https://eservices.mas.gov.sg/api/action/datastore/search.json"
 
@@ -23,12 +21,12 @@ async def list_new_filings(identifier: str, since: str):
     """
     url = BASE_URL
     params = {"q": identifier, "since": since}
-    async with httpx.AsyncClient() as client:
-        async with tracked_call("sg", url) as log:
-            response = await client.get(url, params=params)
-            log(response)
-        response.raise_for_status()
-        payload = response.json()
+    client = get_http_client()
+    async with tracked_call("sg", url) as log:
+        response = await client.get(url, params=params)
+        log(response)
+    response.raise_for_status()
+    payload = response.json()
     records = payload.get("result", {}).get("records", [])
     return [
         {
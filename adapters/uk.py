@@ -12,18 +12,107 @@ Parsed fields:
 
 from __future__ import annotations
 
+import asyncio
+import binascii
 import os
 import re
+import threading
 import zlib
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate, starmap
+from typing import Any
 
-import httpx
+import numpy as np
 
-from .base import tracked_call
+from .base import get_http_client, tracked_call
+
+try:
+    from isal import isal_zlib as _isal_zlib
+except ImportError:  # pragma: no cover - optional dependency
+    _zlib: Any = zlib
+else:  # pragma: no cover - imported above when available
+    # ISA-L inflates the same zlib/deflate formats roughly 2-3x faster.
+    _zlib = _isal_zlib
 
 BASE_URL = "https://api.company-information.service.gov.uk"
 API_KEY_ENV = "COMPANIES_HOUSE_API_KEY"
 
+# Patterns are compiled once at import; parse() applies them to every stream and line.
+_PDF_LITERAL_STRING_RE = re.compile(rb"\((?:\\.|[^\\)])*\)")
+_PDF_HEX_STRING_RE = re.compile(rb"(?<!<)<([0-9A-Fa-f\s]+)>")
+_INFLATE_CHUNK_SIZE = 64 * 1024
+_PARALLEL_INFLATE_MIN_BYTES = 256 * 1024
+_PARALLEL_INFLATE_WORKERS = 4
+_PARSE_WORKERS = min(8, os.cpu_count() or 2)
+# Parsing gets its own pool so bulk ingest cannot starve the loop's default executor.
+# Large documents inflate their streams on a second, shared pool; parse workers
+# wait on it, so it cannot be the parse pool itself. Both are created on first use
+# and dropped by close_parse_executor().
+_PARSE_EXECUTOR: ThreadPoolExecutor | None = None
+_INFLATE_EXECUTOR: ThreadPoolExecutor | None = None
+_PARSE_EXECUTOR_LOCK = threading.Lock()
+# Bytes matched by ``\s`` in a bytes regex, used when walking back from "stream".
+_PDF_WHITESPACE_BYTES = b" \t\n\r\f\v"
+_PDF_WHITESPACE = frozenset(_PDF_WHITESPACE_BYTES)
+_PDF_FILTER_LIST_RE = re.compile(rb"/Filter\s*\[(?P<filters>.*?)\]", re.DOTALL)
+_PDF_FILTER_SINGLE_RE = re.compile(rb"/Filter\s*/([A-Za-z0-9]+)")
+_PDF_NAME_RE = re.compile(rb"/([A-Za-z0-9]+)")
+_PDF_PREDICTOR_RE = re.compile(rb"/Predictor\s+(\d+)")
+_PDF_COLUMNS_RE = re.compile(rb"/Columns\s+(\d+)")
+_LINE_SPLIT_RE = re.compile(r"[\r\n]+")
+_COMPANY_NUMBER_TOKEN_RE = re.compile(r"\b[A-Z0-9]{6,8}\b")
+_COMPANY_NUMBER_DISQUALIFIER_RE = re.compile(
+    r"\b(reference|ref|form|document|submission|payment)\b", re.IGNORECASE
+)
+_ISO_DATE_RE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_SLASH_DATE_RE = re.compile(r"\b(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})\b")
+_DMY_DATE_RE = re.compile(r"\b(\d{1,2})\s+([A-Za-z]{3,9})\s+(\d{4})\b")
+_MDY_DATE_RE = re.compile(r"\b([A-Za-z]{3,9})\s+(\d{1,2}),?\s+(\d{4})\b")
+# Every date format above needs a digit, so one cheap search rules most lines out.
+_DIGIT_RE = re.compile(r"\d")
+# Checked in order, so a confirmation statement wins when a filing mentions both.
+# Plain substring tests on the lowered text outrun a combined regex or a
+# multi-pattern automaton for a handful of keywords.
+_FILING_TYPE_KEYWORDS = (
+    ("confirmation_statement", ("confirmation statement", "cs01")),
+    ("annual_return", ("annual return", "ar01")),
+)
+# Companies House forms often use "Company name in full".
+_COMPANY_NAME_LABELS = ("company name in full", "company name", "name of company")
+_COMPANY_NUMBER_LABELS = ("company number", "company no", "company no.", "registration number")
+# Include label variants seen on CS01/AR01 forms.
+_FILING_DATE_LABELS = (
+    "date of filing",
+    "filing date",
+    "made up to",
+    "made up date",
+    "statement date",
+    "date of registration",
+    "confirmation date",
+    "date of this return",
+)
+# Every field's labels in one alternation, run over lower-cased text so the scan
+# needs no IGNORECASE (which makes CPython's matcher far slower than plain
+# substring checks). No label is a prefix of another field's label, so a single
+# match per start position is enough to see every field.
+_LABEL_SCAN_RE = re.compile(
+    "|".join(
+        f"(?P<{field}>{'|'.join(re.escape(label) for label in labels)})"
+        for field, labels in (
+            ("company_name", _COMPANY_NAME_LABELS),
+            ("company_number", _COMPANY_NUMBER_LABELS),
+            ("filing_date", _FILING_DATE_LABELS),
+        )
+    )
+)
+# A backslash followed by up to three octal digits, any other character, or nothing.
+_PDF_ESCAPE_RE = re.compile(r"\\(?:([0-9]{1,3})|(.))?", re.DOTALL)
+_PDF_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", "b": "\b", "f": "\f"}
+
 
 class CompaniesHouseConfigError(RuntimeError):
     """Raised when live Companies House requests lack required credentials."""
@@ -43,42 +132,126 @@ async def list_new_filings(company_number: str, since: str):
     url = f"{BASE_URL}/company/{company_number}/filing-history"
     params = {"category": "annual-return", "since": since}
     auth = _companies_house_auth()
-    async with httpx.AsyncClient() as client:
-        async with tracked_call("uk", url) as log:
-            r = await client.get(url, params=params, auth=auth)
-            log(r)
-        r.raise_for_status()
-        data = r.json()
+    client = get_http_client()
+    async with tracked_call("uk", url) as log:
+        r = await client.get(url, params=params, auth=auth)
+        log(r)
+    r.raise_for_status()
+    data = r.json()
     items = data.get("items", [])
+    # Look up and trim each date once; a missing date trims to "" and never passes.
     return [
         {
             "transaction_id": i.get("transaction_id"),
             "company_number": company_number,
-            "date": i.get("date")[:10],
+            "date": date,
         }
         for i in items
-        if i.get("date") and i.get("date")[:10] > since
+        if (date := (i.get("date") or "")[:10]) and date > since
     ]
 
 
-async def download(filing: dict[str, str]):
-    """Download the filing document."""
+async def download(filing: dict[str, str], *, chunk_size: int = 64 * 1024) -> bytearray:
+    """Download the filing document.
+
+    The body is streamed into a single growing buffer that is returned as is, so
+    large PDFs are held once rather than as chunks or a joined ``bytes`` copy.
+    """
     url = f"{BASE_URL}/filing-history/{filing['transaction_id']}/document?format=pdf"
     auth = _companies_house_auth()
-    async with httpx.AsyncClient() as client:
-        async with tracked_call("uk", url) as log:
-            r = await client.get(url, auth=auth)
-            log(r)
-        r.raise_for_status()
-        return r.content
+    client = get_http_client()
+    buf = bytearray()
+    async with tracked_call("uk", url) as log:
+        async with client.stream("GET", url, auth=auth) as r:
+            try:
+                r.raise_for_status()
+                async for chunk in r.aiter_bytes(chunk_size):
+                    buf.extend(chunk)
+            finally:
+                log(r)
+    return buf
+
+
+# Downloads kept in flight by ``download_many`` and the ingest flows' prefetch window.
+DOWNLOAD_CONCURRENCY = 16
+
+
+async def download_many(
+    filings: Iterable[dict[str, str]],
+    *,
+    concurrency: int = DOWNLOAD_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """Download several filing documents concurrently, returning them in input order.
+
+    At most ``concurrency`` downloads are in flight at once over the shared
+    client. With ``return_exceptions`` a failed download is returned in its slot
+    instead of being raised.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _download_one(filing: dict[str, str]) -> bytearray:
+        async with semaphore:
+            return await download(filing)
+
+    return list(
+        await asyncio.gather(
+            *(_download_one(filing) for filing in filings),
+            return_exceptions=return_exceptions,
+        )
+    )
 
 
-async def parse(raw: bytes):
+async def parse(raw: bytes | bytearray):
     """Parse a UK Companies House filing PDF into key metadata.
 
     Returns a list of dicts to match the adapter contract used elsewhere.
     Results include a status field ("ok" or "error") alongside any errors.
+    Parsing is CPU-bound, so it runs on a dedicated worker pool to keep the event
+    loop responsive without tying up the loop's default executor.
     """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_parse_executor(), _parse_sync, raw)
+
+
+def _get_parse_executor() -> ThreadPoolExecutor:
+    """Return the parse executor, creating it on first use or after a close."""
+    global _PARSE_EXECUTOR
+    executor = _PARSE_EXECUTOR
+    if executor is not None:
+        return executor
+    with _PARSE_EXECUTOR_LOCK:
+        if _PARSE_EXECUTOR is None:
+            _PARSE_EXECUTOR = ThreadPoolExecutor(_PARSE_WORKERS, thread_name_prefix="uk-parse")
+        return _PARSE_EXECUTOR
+
+
+def _get_inflate_executor() -> ThreadPoolExecutor:
+    """Return the shared stream-inflate executor, creating it on first use."""
+    global _INFLATE_EXECUTOR
+    executor = _INFLATE_EXECUTOR
+    if executor is not None:
+        return executor
+    with _PARSE_EXECUTOR_LOCK:
+        if _INFLATE_EXECUTOR is None:
+            _INFLATE_EXECUTOR = ThreadPoolExecutor(
+                _PARALLEL_INFLATE_WORKERS, thread_name_prefix="uk-inflate"
+            )
+        return _INFLATE_EXECUTOR
+
+
+def close_parse_executor() -> None:
+    """Shut down the parse and inflate executors; the next parse() starts fresh ones."""
+    global _PARSE_EXECUTOR, _INFLATE_EXECUTOR
+    with _PARSE_EXECUTOR_LOCK:
+        executors = (_PARSE_EXECUTOR, _INFLATE_EXECUTOR)
+        _PARSE_EXECUTOR = _INFLATE_EXECUTOR = None
+    for executor in executors:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _parse_sync(raw: bytes | bytearray) -> list[dict[str, Any]]:
     if not raw:
         # Keep adapter output consistent: always return list-of-dicts.
         return [_error_result("empty_pdf")]
@@ -88,27 +261,45 @@ async def parse(raw: bytes):
         # Keep adapter output consistent: always return list-of-dicts.
         return [_error_result("unreadable_pdf")]
 
-    text = _extract_pdf_text(raw)
-    if not text:
+    # Text-bearing filings usually carry every field in top-level literal strings.
+    # When they do, skip inflating and scanning the content streams altogether.
+    # Only the highest-precedence filing type is final here: stream text could
+    # still turn an annual return into a confirmation statement.
+    top_level_lines = _chunk_lines(_extract_strings_from_bytes(raw))
+    top_level_lowered = "\n".join(top_level_lines).lower()
+    if top_level_lines:
+        filing_type = _detect_filing_type(top_level_lowered)
+        fields = _resolve_labeled_fields(top_level_lines, top_level_lowered)
+        if filing_type == _FILING_TYPE_KEYWORDS[0][0] and all(fields):
+            return [_build_result(filing_type, *fields)]
+
+    # Split each extracted chunk directly instead of joining everything into one
+    # text blob first; the blob is only rebuilt if the filing date needs it.
+    stream_lines = _chunk_lines(_extract_stream_chunks(raw))
+    lines = top_level_lines + stream_lines
+    if not lines:
         # Keep adapter output consistent: always return list-of-dicts.
         return [_error_result("unreadable_pdf")]
 
-    filing_type = _detect_filing_type(text)
-    lines = _split_lines(text)
-    company_name = _find_labeled_value(
-        lines,
-        # Companies House forms often use "Company name in full".
-        labels=("company name in full", "company name", "name of company"),
+    # Extend the lower-cased top-level text rather than lowering it a second time.
+    lowered = "\n".join(
+        part for part in (top_level_lowered, "\n".join(stream_lines).lower()) if part
     )
-    company_number = _find_company_number(lines)
-    filing_date = _find_filing_date(lines, text)
+    filing_type = _detect_filing_type(lowered)
+    company_name, company_number, filing_date = _find_labeled_fields(lines, lowered)
+    # Return a list for parity with other adapters and the ETL flow.
+    return [_build_result(filing_type, company_name, company_number, filing_date)]
 
+
+def _build_result(
+    filing_type: str, company_name: str, company_number: str, filing_date: str | None
+) -> dict[str, Any]:
     errors: list[str] = []
     if filing_type == "unsupported":
         errors.append("unsupported_filing_type")
 
     status = "error" if errors else "ok"
-    result = {
+    return {
         "company_name": company_name or None,
         "filing_date": filing_date,
         "filing_type": filing_type,
@@ -116,8 +307,6 @@ async def parse(raw: bytes):
         "errors": errors,
         "status": status,
     }
-    # Return a list for parity with other adapters and the ETL flow.
-    return [result]
 
 
 def _error_result(reason: str) -> dict[str, str | None | list[str]]:
@@ -131,80 +320,151 @@ def _error_result(reason: str) -> dict[str, str | None | list[str]]:
     }
 
 
-def _looks_like_pdf(raw: bytes) -> bool:
+def _looks_like_pdf(raw: bytes | bytearray) -> bool:
     # PDF files should start with a %PDF header near the beginning of the byte stream.
-    return b"%PDF" in raw[:1024]
+    # Readers tolerate up to 1024 bytes of leading junk; search that window in place.
+    return raw.startswith(b"%PDF") or raw.find(b"%PDF", 0, 1024) != -1
 
 
 def _extract_pdf_text(raw: bytes) -> str:
     """Extract rough text from PDF bytes by parsing literal and hex strings."""
-    chunks: list[str] = []
-    chunks.extend(_extract_strings_from_bytes(raw))
+    return "\n".join(_extract_pdf_chunks(raw)).strip()
 
-    for stream_dict, stream_data in _iter_pdf_streams(raw):
-        decoded = _decode_pdf_stream(stream_dict, stream_data)
-        if decoded is None:
-            continue
-        if _is_obj_stream(stream_dict) or _is_flate_stream(stream_dict):
-            chunks.extend(_extract_strings_from_bytes(decoded))
 
-    combined = "\n".join(chunk for chunk in chunks if chunk)
-    return combined.strip()
+def _extract_pdf_chunks(raw: bytes) -> list[str]:
+    """Return the non-empty literal and hex strings found in the PDF bytes."""
+    return [*_extract_strings_from_bytes(raw), *_extract_stream_chunks(raw)]
 
 
-def _extract_strings_from_bytes(raw: bytes) -> list[str]:
-    try:
-        # Use latin-1 to preserve byte values without throwing decode errors.
-        decoded = raw.decode("latin-1", errors="ignore")
-    except Exception:
-        return []
-    matches = re.findall(r"\((?:\\.|[^\\)])*\)", decoded)
-    chunks = [_unescape_pdf_string(match[1:-1]) for match in matches]
-    chunks.extend(_extract_hex_strings(raw))
-    return [chunk for chunk in chunks if chunk]
-
-
-def _extract_hex_strings(raw: bytes) -> list[str]:
-    chunks: list[str] = []
-    for match in re.finditer(rb"(?<!<)<([0-9A-Fa-f\s]+)>", raw):
-        hex_bytes = re.sub(rb"\s+", b"", match.group(1))
+def _extract_stream_chunks(raw: bytes | bytearray) -> Iterator[str]:
+    """Yield the strings found inside decodable object and Flate streams."""
+    streams = [
+        (stream_dict, stream_data)
+        for stream_dict, stream_data in _iter_pdf_streams(raw)
+        if _is_obj_stream(stream_dict) or _is_flate_stream(stream_dict)
+    ]
+    for decoded in _decode_pdf_streams(streams):
+        if decoded is not None:
+            yield from _extract_strings_from_bytes(decoded)
+
+
+def _decode_pdf_streams(streams: list[tuple[bytes, bytes]]) -> Iterable[bytes | None]:
+    """Decode ``streams`` in order, inflating large batches on worker threads.
+
+    zlib releases the GIL while inflating, so documents carrying several sizeable
+    Flate streams decode in parallel on the shared inflate pool. Small documents
+    stay serial, where handing work to another thread would cost more than it saves.
+    """
+    workers = min(_PARALLEL_INFLATE_WORKERS, len(streams), os.cpu_count() or 1)
+    if workers < 2 or sum(len(data) for _, data in streams) < _PARALLEL_INFLATE_MIN_BYTES:
+        return starmap(_decode_pdf_stream, streams)
+    return list(_get_inflate_executor().map(lambda stream: _decode_pdf_stream(*stream), streams))
+
+
+def _extract_strings_from_bytes(raw: bytes | bytearray) -> Iterator[str]:
+    """Yield the non-empty literal strings, then the non-empty hex strings."""
+    # Scan the bytes directly and decode only the matched string bodies; latin-1
+    # maps every byte value, so no decode can fail.
+    for match in _PDF_LITERAL_STRING_RE.findall(raw):
+        body = match[1:-1].decode("latin-1")
+        if b"\\" in match:
+            body = _unescape_pdf_string(body)
+        if body:
+            yield body
+    yield from _extract_hex_strings(raw)
+
+
+def _extract_hex_strings(raw: bytes | bytearray) -> Iterator[str]:
+    for body in _PDF_HEX_STRING_RE.findall(raw):
+        # Deleting whitespace with translate is a single C pass; no regex needed.
+        hex_bytes = body.translate(None, _PDF_WHITESPACE_BYTES)
         if not hex_bytes:
             continue
         if len(hex_bytes) % 2 == 1:
             hex_bytes += b"0"
         try:
-            raw_bytes = bytes.fromhex(hex_bytes.decode("ascii"))
-        except (ValueError, UnicodeDecodeError):
+            raw_bytes = binascii.unhexlify(hex_bytes)
+        except binascii.Error:
             continue
-        chunks.append(_decode_pdf_hex_bytes(raw_bytes))
-    return [chunk for chunk in chunks if chunk]
+        if text := _decode_pdf_hex_bytes(raw_bytes):
+            yield text
 
 
 def _decode_pdf_hex_bytes(value: bytes) -> str:
+    # errors="ignore" drops undecodable code units instead of raising, and latin-1
+    # maps every byte, so none of these decodes can fail.
     if value.startswith(b"\xfe\xff"):
-        try:
-            return value[2:].decode("utf-16-be", errors="ignore")
-        except UnicodeDecodeError:
-            return ""
+        return value[2:].decode("utf-16-be", errors="ignore")
     if value.startswith(b"\xff\xfe"):
-        try:
-            return value[2:].decode("utf-16-le", errors="ignore")
-        except UnicodeDecodeError:
-            return ""
-    return value.decode("latin-1", errors="ignore")
+        return value[2:].decode("utf-16-le", errors="ignore")
+    return value.decode("latin-1")
 
 
-def _iter_pdf_streams(raw: bytes) -> list[tuple[bytes, bytes]]:
+def _iter_pdf_streams(raw: bytes | bytearray) -> list[tuple[bytes, bytes]]:
+    """Return ``(dictionary, data)`` for every ``<<...>> stream ... endstream``.
+
+    Streams are located with ``bytes.find`` on the keywords rather than a DOTALL
+    regex, whose lazy scans from every ``<<`` go quadratic on malformed files.
+    """
     streams: list[tuple[bytes, bytes]] = []
-    pattern = re.compile(
-        rb"<<(?P<dict>.*?)>>\s*stream(?:\r\n|\r|\n)(?P<data>.*?)(?:\r\n|\r|\n)?endstream",
-        re.DOTALL,
-    )
-    for match in pattern.finditer(raw):
-        streams.append((match.group("dict"), match.group("data")))
+    floor = 0
+    pos = 0
+    while (keyword := raw.find(b"stream", pos)) != -1:
+        pos = keyword + 6
+        # The keyword must follow a dictionary close, optionally after whitespace;
+        # this also skips the tail of "endstream".
+        close = keyword
+        while close > floor and raw[close - 1] in _PDF_WHITESPACE:
+            close -= 1
+        if raw[close - 2 : close] != b">>" or close - 2 < floor:
+            continue
+        data_start = _skip_pdf_eol(raw, pos)
+        if data_start == pos:
+            continue
+        end = raw.find(b"endstream", data_start)
+        if end == -1:
+            break
+        opening = _pdf_dict_start(raw, floor, close - 2)
+        if opening == -1:
+            continue
+        data_end = end
+        if raw[end - 2 : end] == b"\r\n" and end - 2 >= data_start:
+            data_end = end - 2
+        elif end > data_start and raw[end - 1] in b"\r\n":
+            data_end = end - 1
+        # bytes() is a no-op for bytes input and keeps bytearray slices from
+        # leaking into the stream decoders, which only handle immutable bytes.
+        streams.append((bytes(raw[opening + 2 : close - 2]), bytes(raw[data_start:data_end])))
+        pos = floor = end + 9
     return streams
 
 
+def _skip_pdf_eol(raw: bytes | bytearray, pos: int) -> int:
+    if raw[pos : pos + 2] == b"\r\n":
+        return pos + 2
+    if raw[pos : pos + 1] in (b"\r", b"\n"):
+        return pos + 1
+    return pos
+
+
+def _pdf_dict_start(raw: bytes | bytearray, floor: int, close: int) -> int:
+    """Return the offset of the ``<<`` balancing the ``>>`` at ``close``, or -1."""
+    depth = 1
+    pos = close
+    while depth:
+        opening = raw.rfind(b"<<", floor, pos)
+        if opening == -1:
+            return -1
+        nested = raw.rfind(b">>", opening + 2, pos)
+        if nested != -1:
+            depth += 1
+            pos = nested
+        else:
+            depth -= 1
+            pos = opening
+    return pos
+
+
 def _decode_pdf_stream(stream_dict: bytes, stream_data: bytes) -> bytes | None:
     filters = _parse_filters(stream_dict)
     if filters:
@@ -227,9 +487,8 @@ def _decode_pdf_stream(stream_dict: bytes, stream_data: bytes) -> bytes | None:
 
 
 def _is_flate_stream(stream_dict: bytes) -> bool:
-    return b"/FlateDecode" in stream_dict or any(
-        flt == b"/FlateDecode" for flt in _parse_filters(stream_dict)
-    )
+    # Both the single-name and array forms of /Filter spell the name out in full.
+    return b"/FlateDecode" in stream_dict
 
 
 def _is_obj_stream(stream_dict: bytes) -> bool:
@@ -237,36 +496,54 @@ def _is_obj_stream(stream_dict: bytes) -> bool:
 
 
 def _parse_filters(stream_dict: bytes) -> list[bytes]:
-    list_match = re.search(rb"/Filter\s*\[(?P<filters>.*?)\]", stream_dict, re.DOTALL)
+    list_match = _PDF_FILTER_LIST_RE.search(stream_dict)
     if list_match:
-        return [
-            b"/" + name for name in re.findall(rb"/([A-Za-z0-9]+)", list_match.group("filters"))
-        ]
-    single_match = re.search(rb"/Filter\s*/([A-Za-z0-9]+)", stream_dict)
+        return [b"/" + name for name in _PDF_NAME_RE.findall(list_match.group("filters"))]
+    single_match = _PDF_FILTER_SINGLE_RE.search(stream_dict)
     if single_match:
         return [b"/" + single_match.group(1)]
     return []
 
 
 def _flate_decode(data: bytes, stream_dict: bytes) -> bytes | None:
-    try:
-        decoded = zlib.decompress(data)
-    except zlib.error:
-        try:
-            decoded = zlib.decompress(data, wbits=-zlib.MAX_WBITS)
-        except zlib.error:
+    decoded = _inflate(data, zlib.MAX_WBITS)
+    if decoded is None:
+        decoded = _inflate(data, -zlib.MAX_WBITS)
+        if decoded is None:
             return None
     predictor, columns = _parse_decode_params(stream_dict)
     return _apply_predictor(decoded, predictor, columns)
 
 
+def _inflate(data: bytes, wbits: int) -> bytes | None:
+    """Inflate ``data`` incrementally into one buffer, or return ``None``.
+
+    Like ``zlib.decompress``, a truncated or corrupt stream is a failure and any
+    bytes after the end of the stream are ignored.
+    """
+    decompressor = _zlib.decompressobj(wbits)
+    out = bytearray()
+    view = memoryview(data)
+    try:
+        for start in range(0, len(view), _INFLATE_CHUNK_SIZE):
+            out += decompressor.decompress(view[start : start + _INFLATE_CHUNK_SIZE])
+            if decompressor.eof:
+                break
+        out += decompressor.flush()
+    except _zlib.error:
+        return None
+    if not decompressor.eof:
+        return None
+    return bytes(out)
+
+
 def _parse_decode_params(stream_dict: bytes) -> tuple[int | None, int | None]:
     predictor = None
     columns = None
-    predictor_match = re.search(rb"/Predictor\s+(\d+)", stream_dict)
+    predictor_match = _PDF_PREDICTOR_RE.search(stream_dict)
     if predictor_match:
         predictor = int(predictor_match.group(1))
-    columns_match = re.search(rb"/Columns\s+(\d+)", stream_dict)
+    columns_match = _PDF_COLUMNS_RE.search(stream_dict)
     if columns_match:
         columns = int(columns_match.group(1))
     return predictor, columns
@@ -285,202 +562,287 @@ def _apply_predictor(data: bytes, predictor: int | None, columns: int | None) ->
 
 
 def _apply_tiff_predictor(data: bytes, columns: int) -> bytes:
-    output = bytearray()
-    for offset in range(0, len(data), columns):
-        row = bytearray(data[offset : offset + columns])
-        for idx in range(1, len(row)):
-            row[idx] = (row[idx] + row[idx - 1]) % 256
-        output.extend(row)
-    return bytes(output)
+    # Each row is a running sum of byte deltas; uint8 arithmetic wraps mod 256.
+    full_rows = len(data) // columns
+    values = np.frombuffer(data, dtype=np.uint8)
+    body = values[: full_rows * columns].reshape(full_rows, columns)
+    output = np.cumsum(body, axis=1, dtype=np.uint8).tobytes()
+    if len(values) > body.size:
+        output += np.cumsum(values[body.size :], dtype=np.uint8).tobytes()
+    return output
 
 
 def _apply_png_predictor(data: bytes, columns: int) -> bytes:
+    if not data:
+        return data
     row_length = columns + 1
-    output = bytearray()
-    prev_row = bytearray(columns)
-    for offset in range(0, len(data), row_length):
-        row = data[offset : offset + row_length]
-        if not row:
-            break
-        filter_type = row[0]
-        raw = bytearray(row[1:])
-        recon = bytearray(raw)
-        if filter_type == 0:
-            pass
-        elif filter_type == 1:
-            for i in range(len(raw)):
-                left = recon[i - 1] if i > 0 else 0
-                recon[i] = (raw[i] + left) % 256
+    row_count = -(-len(data) // row_length)
+    # Zero-pad a short final row; each byte depends only on earlier bytes, so the
+    # padding never changes real output and is trimmed off at the end.
+    padded = np.zeros(row_count * row_length, dtype=np.uint8)
+    padded[: len(data)] = np.frombuffer(data, dtype=np.uint8)
+    rows = padded.reshape(row_count, row_length)
+    filters = rows[:, 0]
+    if (filters > 4).any():
+        return data
+    recon = rows[:, 1:].copy()
+    output_length = len(data) - row_count
+
+    if (filters == filters[0]).all() and filters[0] <= 2:
+        # Uniform None/Sub/Up streams (typical of xref streams) reduce to one
+        # wrapping cumulative sum across the whole table.
+        if filters[0] == 1:
+            np.cumsum(recon, axis=1, dtype=np.uint8, out=recon)
+        elif filters[0] == 2:
+            np.cumsum(recon, axis=0, dtype=np.uint8, out=recon)
+        return recon.tobytes()[:output_length]
+
+    prev_row = np.zeros(columns, dtype=np.uint8)
+    for index, filter_type in enumerate(filters.tolist()):
+        row = recon[index]
+        if filter_type == 1:
+            np.cumsum(row, dtype=np.uint8, out=row)
         elif filter_type == 2:
-            for i in range(len(raw)):
-                recon[i] = (raw[i] + prev_row[i]) % 256
+            row += prev_row
         elif filter_type == 3:
-            for i in range(len(raw)):
-                left = recon[i - 1] if i > 0 else 0
-                up = prev_row[i]
-                recon[i] = (raw[i] + ((left + up) // 2)) % 256
+            row[:] = _png_average_row(row.tolist(), prev_row.tolist())
         elif filter_type == 4:
-            for i in range(len(raw)):
-                left = recon[i - 1] if i > 0 else 0
-                up = prev_row[i]
-                up_left = prev_row[i - 1] if i > 0 else 0
-                recon[i] = (raw[i] + _paeth_predictor(left, up, up_left)) % 256
+            row[:] = _png_paeth_row(row.tolist(), prev_row.tolist())
+        prev_row = row
+    return recon.tobytes()[:output_length]
+
+
+def _png_average_row(raw: list[int], up: list[int]) -> list[int]:
+    # Average depends on the reconstructed left byte, so it stays sequential.
+    recon: list[int] = []
+    left = 0
+    for value, above in zip(raw, up, strict=True):
+        left = (value + ((left + above) >> 1)) & 0xFF
+        recon.append(left)
+    return recon
+
+
+def _png_paeth_row(raw: list[int], up: list[int]) -> list[int]:
+    # Paeth picks whichever of left/up/up-left is closest to left + up - up_left.
+    # The distances reduce to |up - up_left|, |left - up_left| and
+    # |left + up - 2 * up_left|, so the predictor is inlined without temporaries.
+    recon: list[int] = []
+    append = recon.append
+    left = up_left = 0
+    for value, above in zip(raw, up, strict=True):
+        dist_left = abs(above - up_left)
+        dist_up = abs(left - up_left)
+        dist_up_left = abs(left + above - up_left - up_left)
+        if dist_left <= dist_up and dist_left <= dist_up_left:
+            predicted = left
+        elif dist_up <= dist_up_left:
+            predicted = above
         else:
-            return data
-        output.extend(recon)
-        prev_row = recon
-    return bytes(output)
+            predicted = up_left
+        left = (value + predicted) & 0xFF
+        append(left)
+        up_left = above
+    return recon
 
 
-def _paeth_predictor(left: int, up: int, up_left: int) -> int:
-    p = left + up - up_left
-    pa = abs(p - left)
-    pb = abs(p - up)
-    pc = abs(p - up_left)
-    if pa <= pb and pa <= pc:
-        return left
-    if pb <= pc:
-        return up
-    return up_left
+def _replace_pdf_escape(match: re.Match[str]) -> str:
+    octal, char = match.group(1), match.group(2)
+    if octal:
+        try:
+            return chr(int(octal, 8))
+        except ValueError:
+            # Digits 8/9 are not octal; drop the malformed escape.
+            return ""
+    if char is None:
+        # A trailing lone backslash escapes nothing.
+        return ""
+    return _PDF_ESCAPES.get(char, char)
 
 
 def _unescape_pdf_string(value: str) -> str:
-    result: list[str] = []
-    i = 0
-    while i < len(value):
-        ch = value[i]
-        if ch != "\\":
-            result.append(ch)
-            i += 1
-            continue
-        i += 1
-        if i >= len(value):
-            break
-        nxt = value[i]
-        if nxt in "nrtbf":
-            mapping = {
-                "n": "\n",
-                "r": "\r",
-                "t": "\t",
-                "b": "\b",
-                "f": "\f",
-            }
-            result.append(mapping.get(nxt, nxt))
-            i += 1
-            continue
-        if nxt in "\\()":
-            result.append(nxt)
-            i += 1
-            continue
-        if nxt.isdigit():
-            octal = nxt
-            i += 1
-            for _ in range(2):
-                if i < len(value) and value[i].isdigit():
-                    octal += value[i]
-                    i += 1
-                else:
-                    break
-            try:
-                result.append(chr(int(octal, 8)))
-            except ValueError:
-                pass
-            continue
-        result.append(nxt)
-        i += 1
-    return "".join(result)
+    if "\\" not in value:
+        return value
+    return _PDF_ESCAPE_RE.sub(_replace_pdf_escape, value)
 
 
 def _split_lines(text: str) -> list[str]:
-    return [segment.strip() for segment in re.split(r"[\r\n]+", text) if segment.strip()]
+    # Strip each segment once and keep the non-empty results.
+    return [line for segment in _LINE_SPLIT_RE.split(text) if (line := segment.strip())]
 
 
-def _detect_filing_type(text: str) -> str:
-    lowered = text.lower()
-    if "confirmation statement" in lowered or "cs01" in lowered:
-        return "confirmation_statement"
-    if "annual return" in lowered or "ar01" in lowered:
-        return "annual_return"
+def _chunk_lines(chunks: Iterable[str]) -> list[str]:
+    return [line for chunk in chunks for line in _split_lines(chunk)]
+
+
+def _detect_filing_type(lowered: str) -> str:
+    """Return the filing type named in ``lowered`` (text already lower-cased)."""
+    for filing_type, keywords in _FILING_TYPE_KEYWORDS:
+        if any(keyword in lowered for keyword in keywords):
+            return filing_type
     return "unsupported"
 
 
-def _find_labeled_value(lines: list[str], labels: tuple[str, ...]) -> str:
-    for idx, line in enumerate(lines):
+def _iter_label_lines(lowered: str) -> Iterator[tuple[str, int]]:
+    """Yield ``(field, line index)`` for each labelled line, in document order.
+
+    ``lowered`` is the newline-joined, lower-cased lines. It is scanned once
+    instead of testing every label against every line for each field, and
+    lazily so callers can stop as soon as they have what they need.
+    """
+    # Offset at which each following line starts, for mapping matches back to lines.
+    line_starts = list(accumulate(len(line) + 1 for line in lowered.split("\n")))
+    last_seen: dict[str, int] = {}
+    pos = 0
+    while (match := _LABEL_SCAN_RE.search(lowered, pos)) is not None:
+        field = match.lastgroup
+        assert field is not None
+        line_no = bisect_right(line_starts, match.start())
+        if last_seen.get(field) != line_no:
+            last_seen[field] = line_no
+            yield field, line_no
+        # Step one character so labels overlapping this match are still found.
+        pos = match.start() + 1
+
+
+def _find_labeled_fields(lines: list[str], lowered: str) -> tuple[str, str, str | None]:
+    """Return company name, company number and filing date for the filing.
+
+    Fields not found on labelled lines use the usual whole-document fallbacks.
+    """
+    company_name, company_number, filing_date = _resolve_labeled_fields(lines, lowered)
+    if not company_number:
+        # ``lowered`` is the lines joined by newlines, so splitting it lines up with ``lines``.
+        company_number = _find_company_number(
+            lines, candidates=(), lowered_lines=lowered.split("\n")
+        )
+    if filing_date is None:
+        filing_date = _find_filing_date(lines, candidates=())
+    return company_name, company_number, filing_date
+
+
+def _resolve_labeled_fields(lines: list[str], lowered: str) -> tuple[str, str, str | None]:
+    """Return the fields found on labelled lines alone, without any fallbacks.
+
+    Each field takes the first labelled line that yields a value, and the scan
+    stops once all three are known.
+    """
+    company_name = ""
+    company_number = ""
+    filing_date: str | None = None
+    for field, idx in _iter_label_lines(lowered):
+        if field == "company_name":
+            if not company_name:
+                company_name = _find_labeled_value(lines, _COMPANY_NAME_LABELS, candidates=(idx,))
+        elif field == "company_number":
+            if not company_number:
+                company_number = _find_labeled_value(
+                    lines, _COMPANY_NUMBER_LABELS, candidates=(idx,)
+                )
+        elif filing_date is None:
+            filing_date = _find_filing_date_on_lines(lines, (idx,))
+        if company_name and company_number and filing_date:
+            break
+    return company_name, company_number, filing_date
+
+
+def _find_labeled_value(
+    lines: list[str],
+    labels: tuple[str, ...],
+    *,
+    candidates: Sequence[int] | None = None,
+) -> str:
+    """Return the value for the first line carrying one of ``labels``.
+
+    ``candidates`` limits the search to known labelled line indices (see
+    :func:`_iter_label_lines`); by default every line is checked.
+    """
+    pattern = _labels_value_pattern(labels)
+    for idx in range(len(lines)) if candidates is None else candidates:
+        line = lines[idx]
         lowered = line.lower()
-        for label in labels:
-            if label in lowered:
-                value = _value_after_label(line, label)
-                if value:
-                    return value
-                for next_line in lines[idx + 1 :]:
-                    if next_line.strip():
-                        return next_line.strip()
+        if not any(label in lowered for label in labels):
+            continue
+        match = pattern.search(line)
+        if match and (value := match.group(1).strip()):
+            return value
+        for next_line in lines[idx + 1 :]:
+            if next_line.strip():
+                return next_line.strip()
     return ""
 
 
-def _value_after_label(line: str, label: str) -> str:
-    pattern = re.compile(re.escape(label) + r"\s*[:\-]\s*(.+)", re.IGNORECASE)
-    match = pattern.search(line)
-    if match:
-        return match.group(1).strip()
-    return ""
+@lru_cache(maxsize=16)
+def _labels_value_pattern(labels: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile one ``label: value`` pattern covering every label in ``labels``."""
+    alternation = "|".join(re.escape(label) for label in labels)
+    return re.compile(rf"(?:{alternation})\s*[:\-]\s*(.+)", re.IGNORECASE)
 
 
-def _find_company_number(lines: list[str]) -> str:
-    label_value = _find_labeled_value(
-        lines,
-        labels=("company number", "company no", "company no.", "registration number"),
-    )
+def _find_company_number(
+    lines: list[str],
+    *,
+    candidates: Sequence[int] | None = None,
+    lowered_lines: Iterable[str] | None = None,
+) -> str:
+    """Return the company number, preferring labelled values over bare tokens.
+
+    ``lowered_lines`` may carry the already lower-cased ``lines`` so they are not
+    lowered a second time.
+    """
+    label_value = _find_labeled_value(lines, _COMPANY_NUMBER_LABELS, candidates=candidates)
     if label_value:
         return label_value.strip()
-    token_pattern = re.compile(r"\b[A-Z0-9]{6,8}\b")
-    disqualifier_pattern = re.compile(
-        r"\b(reference|ref|form|document|submission|payment)\b", re.IGNORECASE
-    )
-    for line in lines:
-        lowered = line.lower()
-        if "company" in lowered and "number" in lowered:
-            if disqualifier_pattern.search(line):
-                continue
-            for match in token_pattern.finditer(line):
-                return match.group(0)
-    fallback_matches: list[str] = []
-    for line in lines:
-        if disqualifier_pattern.search(line):
+    if lowered_lines is None:
+        lowered_lines = map(str.lower, lines)
+    # One pass serves all three fallbacks, in order of preference: a token on an
+    # unlabelled "company ... number" line, then a line that is just a token,
+    # then the first token anywhere.
+    standalone: str | None = None
+    first_token: str | None = None
+    for line, lowered in zip(lines, lowered_lines, strict=True):
+        match = _COMPANY_NUMBER_TOKEN_RE.search(line)
+        if match is None or _COMPANY_NUMBER_DISQUALIFIER_RE.search(line):
             continue
-        stripped = line.strip()
-        # Prefer standalone tokens to avoid capturing unrelated identifiers.
-        if token_pattern.fullmatch(stripped):
-            return stripped
-        for match in token_pattern.finditer(line):
-            fallback_matches.append(match.group(0))
-    return fallback_matches[0] if fallback_matches else ""
-
-
-def _find_filing_date(lines: list[str], text: str) -> str | None:
-    # Include label variants seen on CS01/AR01 forms.
-    labels = (
-        "date of filing",
-        "filing date",
-        "made up to",
-        "made up date",
-        "statement date",
-        "date of registration",
-        "confirmation date",
-        "date of this return",
+        if "company" in lowered and "number" in lowered:
+            return match.group(0)
+        if standalone is None:
+            stripped = line.strip()
+            # Prefer standalone tokens to avoid capturing unrelated identifiers.
+            if _COMPANY_NUMBER_TOKEN_RE.fullmatch(stripped):
+                standalone = stripped
+        if first_token is None:
+            first_token = match.group(0)
+    return standalone or first_token or ""
+
+
+def _find_filing_date(
+    lines: list[str], text: str | None = None, *, candidates: Sequence[int] | None = None
+) -> str | None:
+    parsed = _find_filing_date_on_lines(
+        lines, range(len(lines)) if candidates is None else candidates
     )
-    for line in lines:
+    if parsed:
+        return parsed
+    # Only join the lines for the whole-text fallback when no labelled date parsed.
+    return _parse_date_from_line("\n".join(lines) if text is None else text)
+
+
+def _find_filing_date_on_lines(lines: list[str], candidates: Iterable[int]) -> str | None:
+    for idx in candidates:
+        line = lines[idx]
         lowered = line.lower()
-        if any(label in lowered for label in labels):
+        if any(label in lowered for label in _FILING_DATE_LABELS):
             parsed = _parse_date_from_line(line)
             if parsed:
                 return parsed
-    return _parse_date_from_line(text)
+    return None
 
 
 def _parse_date_from_line(line: str) -> str | None:
     line = line.strip()
-    iso_match = re.search(r"\b(\d{4})-(\d{2})-(\d{2})\b", line)
+    if not _DIGIT_RE.search(line):
+        return None
+    iso_match = _ISO_DATE_RE.search(line)
     if iso_match:
         year, month, day = iso_match.groups()
         year = _normalize_year(year)
@@ -488,7 +850,7 @@ def _parse_date_from_line(line: str) -> str | None:
             return None
         return _format_date(day, month, year)
 
-    slash_match = re.search(r"\b(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})\b", line)
+    slash_match = _SLASH_DATE_RE.search(line)
     if slash_match:
         day, month, year = slash_match.groups()
         year = _normalize_year(year)
@@ -496,7 +858,7 @@ def _parse_date_from_line(line: str) -> str | None:
             return None
         return _format_date(day, month, year)
 
-    dmy_match = re.search(r"\b(\d{1,2})\s+([A-Za-z]{3,9})\s+(\d{4})\b", line)
+    dmy_match = _DMY_DATE_RE.search(line)
     if dmy_match:
         day, month_name, year = dmy_match.groups()
         year = _normalize_year(year)
@@ -504,7 +866,7 @@ def _parse_date_from_line(line: str) -> str | None:
             return None
         return _format_named_date(day, month_name, year)
 
-    mdy_match = re.search(r"\b([A-Za-z]{3,9})\s+(\d{1,2}),?\s+(\d{4})\b", line)
+    mdy_match = _MDY_DATE_RE.search(line)
     if mdy_match:
         month_name, day, year = mdy_match.groups()
         year = _normalize_year(year)
@@ -528,6 +890,9 @@ def _normalize_year(year: str) -> str | None:
     return None
 
 
+# Filings repeat the same few dates across lines and labels; cache the conversions
+# so strptime/datetime construction runs once per distinct date.
+@lru_cache(maxsize=4096)
 def _format_date(day: str, month: str, year: str) -> str | None:
     try:
         parsed = datetime(int(year), int(month), int(day))
@@ -536,6 +901,7 @@ def _format_date(day: str, month: str, year: str) -> str | None:
     return parsed.strftime("%Y-%m-%d")
 
 
+@lru_cache(maxsize=4096)
 def _format_named_date(day: str, month_name: str, year: str) -> str | None:
     try:
         parsed = datetime.strptime(f"{day} {month_name} {year}", "%d %B %Y")
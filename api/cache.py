@@ -5,13 +5,16 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import math
+import time
+from collections import OrderedDict
 from collections.abc import Callable
-from dataclasses import dataclass
-from functools import wraps
+from dataclasses import dataclass, field
+from functools import cache, lru_cache, wraps
 from threading import Lock
 from typing import Any
 
-from cachetools import TTLCache  # type: ignore[import-untyped]
+import orjson
 from prometheus_client import Counter, Gauge
 
 from config import load_runtime_config
@@ -21,12 +24,34 @@ CACHE_MISSES = Counter("cache_misses_total", "Cache misses by namespace.", ("nam
 CACHE_HIT_RATIO = Gauge("cache_hit_ratio", "Cache hit ratio by namespace.", ("namespace",))
 
 _CACHE_LOCK = Lock()
-_CACHE_BACKEND: _CacheBackend | None = None
-_METRICS_LOCK = Lock()
-_CACHE_METRICS: dict[str, dict[str, int]] = {}
+_REDIS_DELETE_BATCH = 500
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(value: Any, *, sort_keys: bool = False) -> bytes:
+    """Serialize ``value`` to UTF-8 JSON, close to ``json.dumps(default=str)``.
+
+    Two deliberate differences from the stdlib: NaN and +/-Infinity become
+    ``null`` (valid JSON, and what the orjson API responses send anyway), and
+    plain ``Enum`` members encode as their value rather than ``str(member)``.
+    """
+    # Route datetimes and dataclasses through ``default=str`` as the stdlib
+    # encoder does, so cached payloads keep the same shape either way.
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    option |= orjson.OPT_PASSTHROUGH_DATACLASS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(value, default=str, option=option)
+    except TypeError:
+        # orjson rejects e.g. integers wider than 64 bits; the stdlib copes.
+        return json.dumps(value, sort_keys=sort_keys, default=str).encode("utf-8")
+
+
+def _json_loads(payload: str | bytes) -> Any:
+    return orjson.loads(payload)
+
+
 def _cache_ttl_seconds() -> int:
     return load_runtime_config().cache_ttl_seconds
 
@@ -49,11 +74,8 @@ class _CacheBackend:
     delete_prefix: Callable[[str], None]
 
 
+@cache
 def _get_backend() -> _CacheBackend:
-    global _CACHE_BACKEND
-    if _CACHE_BACKEND is not None:
-        return _CACHE_BACKEND
-
     redis_url = load_runtime_config().redis_url
     if redis_url:
         try:
@@ -73,78 +95,184 @@ def _get_backend() -> _CacheBackend:
                 client.setex(key, ttl, payload)
 
             def _redis_delete_prefix(prefix: str) -> None:
-                keys = list(client.scan_iter(f"{prefix}*"))
-                if keys:
-                    client.delete(*keys)
-
-            _CACHE_BACKEND = _CacheBackend(
-                get=_redis_get, set=_redis_set, delete_prefix=_redis_delete_prefix
-            )
-            return _CACHE_BACKEND
-
-    cache = TTLCache(maxsize=_cache_max_items(), ttl=_cache_ttl_seconds())
-    cache_lock = Lock()
+                # Stream matches in batches and UNLINK each batch as it fills, so
+                # client memory stays bounded by the batch size and Redis frees
+                # the values off its main thread instead of blocking on one DEL.
+                batch: list[Any] = []
+                for key in client.scan_iter(f"{prefix}*", count=_REDIS_DELETE_BATCH):
+                    batch.append(key)
+                    if len(batch) >= _REDIS_DELETE_BATCH:
+                        client.unlink(*batch)
+                        batch.clear()
+                if batch:
+                    client.unlink(*batch)
+
+            return _CacheBackend(get=_redis_get, set=_redis_set, delete_prefix=_redis_delete_prefix)
+
+    # Entries are (expires_at, payload) pairs kept in least-recently-used order.
+    # Reads skip the lock: each OrderedDict lookup and move_to_end is a single C
+    # call, and the lock is only taken to write, drop an expired entry or delete.
+    entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+    max_items = _cache_max_items()
+    entries_lock = Lock()
 
     def _memory_get(key: str) -> Any:
-        with cache_lock:
-            return cache.get(key)
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at > time.monotonic():
+            try:
+                entries.move_to_end(key)
+            except KeyError:
+                # Evicted or invalidated by a writer since the lookup.
+                pass
+            return payload
+        with entries_lock:
+            if entries.get(key) is entry:
+                del entries[key]
+        return None
 
     def _memory_set(key: str, payload: str, ttl: int) -> None:
-        # TTLCache uses the ttl configured at initialization.
-        with cache_lock:
-            cache[key] = payload
+        entry = (time.monotonic() + ttl, payload)
+        with entries_lock:
+            if key in entries:
+                entries[key] = entry
+                entries.move_to_end(key)
+                return
+            # Expired entries are dropped lazily on read; at capacity the least
+            # recently used entry goes, whether or not it has expired yet.
+            if len(entries) >= max_items:
+                entries.popitem(last=False)
+            entries[key] = entry
 
     def _memory_delete_prefix(prefix: str) -> None:
-        with cache_lock:
-            keys = [key for key in cache.keys() if str(key).startswith(prefix)]
+        with entries_lock:
+            # Snapshot the keys in one C call: lock-free reads reorder entries.
+            keys = [key for key in list(entries) if key.startswith(prefix)]
             for key in keys:
-                cache.pop(key, None)
+                entries.pop(key, None)
 
-    _CACHE_BACKEND = _CacheBackend(
-        get=_memory_get, set=_memory_set, delete_prefix=_memory_delete_prefix
-    )
-    return _CACHE_BACKEND
+    return _CacheBackend(get=_memory_get, set=_memory_set, delete_prefix=_memory_delete_prefix)
 
 
 def reset_cache_backend() -> None:
     """Reset the cached backend (useful for tests)."""
-    global _CACHE_BACKEND
-    _CACHE_BACKEND = None
+    _get_backend.cache_clear()
 
 
 def reset_cache_stats() -> None:
     """Reset in-process cache statistics (useful for tests)."""
-    with _METRICS_LOCK:
-        _CACHE_METRICS.clear()
+    for metric in (CACHE_HITS, CACHE_MISSES, CACHE_HIT_RATIO):
+        metric.clear()
+    _namespace_metrics.cache_clear()
+
+
+# Argument types whose JSON form is fully determined by (type, value). Tagging
+# each value with its type keeps 1, 1.0 and True apart in the memoized path.
+_SCALAR_KEY_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 def _make_cache_key(namespace: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
-    raw = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True, default=str)
-    digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    hashable = _hashable_key_parts(args, kwargs)
+    if hashable is None:
+        return _digest_cache_key(namespace, args, kwargs)
+    return _key_from_hashable(namespace, hashable)
+
+
+def _hashable_key_parts(
+    args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[tuple[Any, ...], tuple[Any, ...]] | None:
+    """Return a type-tagged tuple for scalar-only calls, otherwise ``None``."""
+    for value in (*args, *kwargs.values()):
+        if type(value) not in _SCALAR_KEY_TYPES:
+            return None
+    return (
+        tuple((type(value), value) for value in args),
+        tuple(sorted((name, type(value), value) for name, value in kwargs.items())),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _key_from_hashable(namespace: str, hashable: tuple[tuple[Any, ...], tuple[Any, ...]]) -> str:
+    tagged_args, tagged_kwargs = hashable
+    args = tuple(value for _type, value in tagged_args)
+    kwargs = {name: value for name, _type, value in tagged_kwargs}
+    return _digest_cache_key(namespace, args, kwargs)
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    if isinstance(value, dict):
+        return any(
+            _has_non_finite_float(key) or _has_non_finite_float(item) for key, item in value.items()
+        )
+    return False
+
+
+def _digest_cache_key(namespace: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    payload = {"args": args, "kwargs": kwargs}
+    if _has_non_finite_float(payload):
+        # orjson writes NaN and +/-Infinity as null; encode those keys with the
+        # stdlib so they do not share a key with None.
+        raw = json.dumps(payload, sort_keys=True, default=str).encode()
+    else:
+        raw = _json_dumps(payload, sort_keys=True)
+    # Keys only need to be well spread, not tamper-proof; 128-bit BLAKE2b is
+    # cheaper than SHA-256 and still collision-free at any realistic cache size.
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
     return f"{namespace}:{digest}"
 
 
+@dataclass(slots=True)
+class _NamespaceMetrics:
+    """Prometheus children for one namespace plus plain hit/miss counts.
+
+    The ratio and ``get_cache_stats`` read the plain integers, so nothing depends
+    on ``prometheus_client`` internals. The lock is per namespace, not global.
+    """
+
+    hits_counter: Any
+    misses_counter: Any
+    ratio_gauge: Any
+    hits: int = 0
+    misses: int = 0
+    lock: Lock = field(default_factory=Lock)
+
+
+@cache
+def _namespace_metrics(namespace: str) -> _NamespaceMetrics:
+    # ``.labels()`` takes the metric's lock; resolve each child once per namespace.
+    return _NamespaceMetrics(
+        CACHE_HITS.labels(namespace=namespace),
+        CACHE_MISSES.labels(namespace=namespace),
+        CACHE_HIT_RATIO.labels(namespace=namespace),
+    )
+
+
 def _record_cache_metric(namespace: str, hit: bool) -> None:
-    with _METRICS_LOCK:
-        stats = _CACHE_METRICS.setdefault(namespace, {"hits": 0, "misses": 0})
+    metrics = _namespace_metrics(namespace)
+    with metrics.lock:
         if hit:
-            stats["hits"] += 1
-            CACHE_HITS.labels(namespace=namespace).inc()
+            metrics.hits += 1
         else:
-            stats["misses"] += 1
-            CACHE_MISSES.labels(namespace=namespace).inc()
-        total = stats["hits"] + stats["misses"]
-        if total:
-            CACHE_HIT_RATIO.labels(namespace=namespace).set(stats["hits"] / total)
+            metrics.misses += 1
+        ratio = metrics.hits / (metrics.hits + metrics.misses)
+        metrics.ratio_gauge.set(ratio)
+    (metrics.hits_counter if hit else metrics.misses_counter).inc()
 
 
 def get_cache_stats(namespace: str) -> dict[str, int | float]:
     """Return cache hit/miss counts and ratio for a namespace."""
-    with _METRICS_LOCK:
-        stats = _CACHE_METRICS.get(namespace, {"hits": 0, "misses": 0}).copy()
-    total = stats["hits"] + stats["misses"]
-    ratio = (stats["hits"] / total) if total else 0.0
-    return {"hits": stats["hits"], "misses": stats["misses"], "hit_ratio": ratio}
+    metrics = _namespace_metrics(namespace)
+    with metrics.lock:
+        hit_count, miss_count = metrics.hits, metrics.misses
+    total = hit_count + miss_count
+    ratio = (hit_count / total) if total else 0.0
+    return {"hits": hit_count, "misses": miss_count, "hit_ratio": ratio}
 
 
 def cache_get(namespace: str, key: str) -> Any | None:
@@ -156,7 +284,7 @@ def cache_get(namespace: str, key: str) -> Any | None:
     if isinstance(payload, bytes):
         payload = payload.decode("utf-8")
     try:
-        value = json.loads(payload)
+        value = _json_loads(payload)
     except (TypeError, json.JSONDecodeError):
         value = payload
     _record_cache_metric(namespace, hit=True)
@@ -165,7 +293,7 @@ def cache_get(namespace: str, key: str) -> Any | None:
 
 def cache_set(key: str, value: Any, *, ttl: int | None = None) -> None:
     backend = _get_backend()
-    payload = json.dumps(value, default=str)
+    payload = _json_dumps(value).decode("utf-8")
     backend.set(key, payload, ttl or _cache_ttl_seconds())
 
 
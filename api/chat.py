@@ -6,20 +6,23 @@ import asyncio
 import hashlib
 import hmac
 import importlib
+import inspect
 import json
 import logging
 import os
 import time
 import uuid
 from collections import defaultdict, deque
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from threading import Lock
 from typing import Any, cast
 
 import boto3
+import orjson
 from botocore.config import Config as BotoConfig
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.exceptions import RequestValidationError
@@ -27,10 +30,19 @@ from fastapi.responses import JSONResponse, Response
 from prometheus_client import CONTENT_TYPE_LATEST, Histogram, generate_latest
 from pydantic import BaseModel, ConfigDict, Field
 
-from adapters.base import connect_db, get_placeholder, is_sqlite, manager_id_column, table_exists
+from adapters.base import (
+    close_db_pools,
+    connect_db,
+    get_placeholder,
+    get_pool,
+    is_sqlite,
+    manager_id_column,
+    table_exists,
+)
 from api.activism import router as activism_router
 from api.alerts import router as alerts_router
 from api.data import router as data_router
+from api.health_interceptor import HealthCheckInterceptor
 from api.managers import router as managers_router
 from api.memory_profiler import start_memory_profiler, stop_memory_profiler
 from api.search import SearchEntityType, SearchResult, universal_search
@@ -44,6 +56,28 @@ from llm.langsmith_fleet import (
 )
 from llm.tracing import maybe_enable_langsmith_tracing
 
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content)
+        except TypeError:
+            # Fall back to the stdlib encoder for anything orjson rejects.
+            return super().render(content)
+
+
+class ValidationErrorResponse(ORJSONResponse):
+    """Error list published under both "errors" and the legacy "error" key."""
+
+    def render(self, content: Any) -> bytes:
+        # Clients still read either key, so the list appears twice in the body;
+        # encode it once and splice the same bytes into both slots.
+        encoded = super().render(content)
+        return b'{"errors":%s,"error":%s}' % (encoded, encoded)
+
+
 app = FastAPI()
 # Tag manager endpoints so they group clearly in the Swagger UI.
 app.include_router(managers_router, tags=["Managers"])
@@ -51,9 +85,10 @@ app.include_router(data_router, tags=["Data"])
 app.include_router(alerts_router, tags=["Alerts"])
 app.include_router(activism_router, tags=["Activism"])
 app.include_router(signals_router, tags=["Signals"])
-_APP_EXECUTOR = ThreadPoolExecutor(max_workers=4)
-# Allow concurrent health checks without serializing every dependency probe.
-_HEALTH_EXECUTOR = ThreadPoolExecutor(max_workers=3)
+# Allow concurrent health checks without serializing every dependency probe. Pings
+# get a small dedicated pool: a thread stuck on a hung dependency keeps its slot
+# until the ping returns, so hung pings can never pile up more than 3 threads.
+_HEALTH_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="health-ping")
 
 
 @dataclass(frozen=True)
@@ -62,10 +97,13 @@ class HealthClock:
 
     perf_counter: Callable[[], float]
     monotonic: Callable[[], float]
-    sleep: Callable[[float], None]
+    sleep: Callable[[float], Awaitable[None] | None]
+    # Integer nanoseconds keep latency math in ints: one subtraction and a floor
+    # division per measurement instead of float scaling and truncation.
+    perf_counter_ns: Callable[[], int] = time.perf_counter_ns
 
 
-HEALTH_CLOCK = HealthClock(time.perf_counter, time.monotonic, time.sleep)
+HEALTH_CLOCK = HealthClock(time.perf_counter, time.monotonic, asyncio.sleep, time.perf_counter_ns)
 APP_START_TIME = HEALTH_CLOCK.monotonic()
 HEALTH_CHECK_DURATION = Histogram(
     "health_check_duration_seconds",
@@ -75,14 +113,6 @@ HEALTH_CHECK_DURATION = Histogram(
 logger = logging.getLogger(__name__)
 
 
-def get_health_executor():
-    """Return a working health executor, creating a new one if needed."""
-    global _HEALTH_EXECUTOR
-    if _HEALTH_EXECUTOR._shutdown:
-        _HEALTH_EXECUTOR = ThreadPoolExecutor(max_workers=3)
-    return _HEALTH_EXECUTOR
-
-
 class CircuitBreaker:
     """Track consecutive failures and open after a threshold."""
 
@@ -102,6 +132,9 @@ class CircuitBreaker:
 
     def is_open(self) -> bool:
         """Return True when the breaker is open and requests should be skipped."""
+        # Attribute reads are atomic, so the common closed case needs no lock.
+        if self._opened_at is None:
+            return False
         with self._lock:
             if self._opened_at is None:
                 return False
@@ -113,6 +146,9 @@ class CircuitBreaker:
 
     def record_success(self) -> None:
         """Reset the breaker after a successful call."""
+        if self._consecutive_failures == 0 and self._opened_at is None:
+            # Already reset; skip the lock on the healthy path.
+            return
         with self._lock:
             self._consecutive_failures = 0
             self._opened_at = None
@@ -126,6 +162,7 @@ class CircuitBreaker:
                     self._opened_at = self._monotonic()
 
 
+@lru_cache(maxsize=1)
 def _circuit_breaker_reset_seconds() -> float:
     """Return the circuit breaker reset timeout in seconds."""
     return max(float(os.getenv("HEALTH_CIRCUIT_RESET_S", "30")), 1.0)
@@ -136,10 +173,6 @@ _REDIS_CIRCUIT = CircuitBreaker(reset_timeout_s=_circuit_breaker_reset_seconds()
 _HEALTH_RETRY_BACKOFFS = (0.1, 0.2, 0.4)
 
 
-# Keep APP_EXECUTOR for backwards compatibility
-APP_EXECUTOR = _APP_EXECUTOR
-
-
 class ChatResponse(BaseModel):
     """Response payload for chat responses."""
 
@@ -255,23 +288,39 @@ def _format_validation_errors(exc: RequestValidationError) -> list[dict[str, str
 @app.exception_handler(RequestValidationError)
 async def _validation_exception_handler(
     _request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ValidationErrorResponse:
     # Return 400s with field-level messages for API clients.
     errors = _format_validation_errors(exc)
-    return JSONResponse(status_code=400, content={"errors": errors, "error": errors})
+    return ValidationErrorResponse(status_code=400, content=errors)
+
 
+@lru_cache(maxsize=1)
+def _get_search_documents() -> Callable[..., list[dict[str, Any]]]:
+    """Return embeddings.search_documents, importing it on first use only."""
+    # Import lazily to avoid loading embedding models during unrelated endpoints/tests.
+    from embeddings import search_documents
+
+    return search_documents
+
+
+def _search_documents(q: str) -> list[dict[str, Any]]:
+    """Run document search, resolving the lazy import on the calling thread."""
+    return _get_search_documents()(q)
 
-# OpenAPI metadata keeps /docs clear about chat behavior.
+
+# OpenAPI metadata keeps /docs clear about chat behavior. The payload is built
+# here with every field set, so it is documented via `responses` rather than
+# re-validated through a response_model on each request.
 @app.get(
     "/chat",
-    response_model=ChatResponse,
     summary="Answer a chat query",
     description=(
         "Search stored documents using the provided question and return a concise "
         "answer composed from the matching context."
     ),
+    responses={200: {"model": ChatResponse, "description": "Successful Response"}},
 )
-def chat(
+async def chat(
     q: str = Query(
         ...,
         description="User question",
@@ -287,29 +336,33 @@ def chat(
     ),
 ):
     """Return a naive answer built from stored documents."""
-    # Import here to avoid loading embedding models during unrelated endpoints/tests.
-    from embeddings import search_documents
-
-    hits = search_documents(q)
+    # Document search hits the database, and the first call imports embeddings;
+    # keep both off the event loop.
+    hits = await asyncio.to_thread(_search_documents, q)
     if not hits:
         answer = "No documents found."
     else:
-        snippets = []
+        # Seed the parts with the prefix so the answer is built by a single join.
+        parts = ["Context:"]
         for hit in hits:
             kind = hit.get("kind") or "note"
             filename = hit.get("filename") or "unknown"
             manager_name = hit.get("manager_name") or "unassigned"
-            snippets.append(f"[{kind} | {filename} | manager: {manager_name}] {hit['content']}")
-        answer = "Context: " + " ".join(snippets)
-    return {
-        "answer": answer,
-        "latency_ms": 0,
-        "chain_used": "legacy_search",
-        "sources": [],
-        "sql": None,
-        "trace_url": None,
-        "response_id": str(uuid.uuid4()),
-    }
+            parts.append(f"[{kind} | {filename} | manager: {manager_name}] {hit['content']}")
+        answer = " ".join(parts)
+    # Keep ChatResponse's field order and defaults so the body is unchanged.
+    return ORJSONResponse(
+        content={
+            "answer": answer,
+            "chain_used": "legacy_search",
+            "sources": [],
+            "sql": None,
+            "trace_url": None,
+            "latency_ms": 0,
+            "response_id": str(uuid.uuid4()),
+            "chat_disabled": False,
+        }
+    )
 
 
 _SEARCH_ENTITY_TYPE_QUERY = Query(
@@ -1216,11 +1269,26 @@ async def submit_feedback(feedback: FeedbackRequest, raw_request: Request) -> di
     return {"ok": True, "feedback_id": feedback_id}
 
 
-def _health_payload() -> dict[str, int | bool]:
-    """Build the base app health payload."""
+def _uptime_seconds() -> int:
+    """Return whole seconds since the app module was loaded."""
     # Use monotonic time to avoid issues if the system clock changes.
-    uptime_s = int(HEALTH_CLOCK.monotonic() - APP_START_TIME)
-    return {"healthy": True, "uptime_s": uptime_s}
+    return int(HEALTH_CLOCK.monotonic() - APP_START_TIME)
+
+
+# Uptime only changes once a second; callers treat the payload as read-only.
+_LAST_HEALTH_PAYLOAD: tuple[int, dict[str, int | bool]] | None = None
+
+
+def _health_payload() -> dict[str, int | bool]:
+    """Return the base app health payload, rebuilt only when uptime ticks over."""
+    global _LAST_HEALTH_PAYLOAD
+    uptime_s = _uptime_seconds()
+    cached = _LAST_HEALTH_PAYLOAD
+    if cached is not None and cached[0] == uptime_s:
+        return cached[1]
+    payload: dict[str, int | bool] = {"healthy": True, "uptime_s": uptime_s}
+    _LAST_HEALTH_PAYLOAD = (uptime_s, payload)
+    return payload
 
 
 def _format_dependency_error(exc: Exception) -> str:
@@ -1229,6 +1297,7 @@ def _format_dependency_error(exc: Exception) -> str:
     return (message or exc.__class__.__name__)[:200]
 
 
+@lru_cache(maxsize=1)
 def _health_summary_timeout_seconds() -> float:
     """Return the timeout budget for /health dependency checks."""
     timeout = float(os.getenv("HEALTH_SUMMARY_TIMEOUT_S", "0.2"))
@@ -1255,6 +1324,19 @@ def _chat_chain_health_payload() -> tuple[dict[str, int | bool], str | None]:
     return {"healthy": True, "available": True, "fallback_enabled": False}, None
 
 
+@dataclass
+class _InflightCheck:
+    """A dependency check shared by every caller that asked for it concurrently."""
+
+    task: asyncio.Task[tuple[dict[str, int | bool], str | None]]
+    waiters: int = 0
+
+
+# Concurrent /health probes would otherwise queue one ping each on the three
+# health workers; callers asking for the same check share the in-flight one.
+_INFLIGHT_CHECKS: dict[tuple[Any, ...], _InflightCheck] = {}
+
+
 async def _run_dependency_check(
     func,
     timeout_seconds: float,
@@ -1274,11 +1356,61 @@ async def _run_dependency_check(
         if include_enabled:
             payload["enabled"] = True
         return payload, "circuit_open"
-    start = HEALTH_CLOCK.perf_counter()
+    key = (func, timeout_seconds, args, circuit_breaker, include_enabled)
+    inflight = _INFLIGHT_CHECKS.get(key)
+    if inflight is None or inflight.task.get_loop() is not asyncio.get_running_loop():
+        inflight = _InflightCheck(
+            asyncio.create_task(
+                _check_dependency(
+                    func,
+                    timeout_seconds,
+                    *args,
+                    circuit_breaker=circuit_breaker,
+                    include_enabled=include_enabled,
+                )
+            )
+        )
+        _INFLIGHT_CHECKS[key] = inflight
+        inflight.task.add_done_callback(lambda _task: _forget_inflight_check(key, inflight))
+        if circuit_breaker:
+            # A ping cancelled because every caller gave up is one failure, however
+            # many callers were waiting on it; waiters themselves record nothing.
+            inflight.task.add_done_callback(_record_failure_if_cancelled(circuit_breaker))
+    inflight.waiters += 1
+    try:
+        # Shield the shared check so one caller's timeout doesn't fail the others.
+        return await asyncio.shield(inflight.task)
+    finally:
+        inflight.waiters -= 1
+        if not inflight.waiters and not inflight.task.done():
+            # The last caller gave up (e.g. the summary budget expired); stop the ping.
+            # Unregister it first so a probe arriving before the cancellation lands
+            # starts a fresh check instead of joining one that is being torn down.
+            _forget_inflight_check(key, inflight)
+            inflight.task.cancel()
+
+
+def _forget_inflight_check(key: tuple[Any, ...], inflight: _InflightCheck) -> None:
+    """Drop a finished check so the next probe starts a fresh one."""
+    if _INFLIGHT_CHECKS.get(key) is inflight:
+        del _INFLIGHT_CHECKS[key]
+
+
+async def _check_dependency(
+    func,
+    timeout_seconds: float,
+    *args,
+    circuit_breaker: CircuitBreaker | None,
+    include_enabled: bool,
+) -> tuple[dict[str, int | bool], str | None]:
+    """Ping a dependency with retries and record the outcome on its breaker."""
+    # Bind the clock once; the latency math below reads it on every exit path.
+    perf_counter_ns = HEALTH_CLOCK.perf_counter_ns
+    start_ns = perf_counter_ns()
     try:
         # Keep retries inside the per-check timeout budget for responsiveness.
         await _run_health_check_with_retries(func, timeout_seconds, *args)
-        latency_ms = int((HEALTH_CLOCK.perf_counter() - start) * 1000)
+        latency_ms = (perf_counter_ns() - start_ns) // 1_000_000
         if circuit_breaker:
             circuit_breaker.record_success()
         payload = {"healthy": True, "latency_ms": latency_ms}
@@ -1286,7 +1418,7 @@ async def _run_dependency_check(
             payload["enabled"] = True
         return payload, None
     except TimeoutError:
-        latency_ms = int(min(timeout_seconds, HEALTH_CLOCK.perf_counter() - start) * 1000)
+        latency_ms = min(int(timeout_seconds * 1000), (perf_counter_ns() - start_ns) // 1_000_000)
         if circuit_breaker:
             circuit_breaker.record_failure()
         payload = {"healthy": False, "latency_ms": latency_ms}
@@ -1294,7 +1426,7 @@ async def _run_dependency_check(
             payload["enabled"] = True
         return payload, "timeout"
     except Exception as exc:
-        latency_ms = int((HEALTH_CLOCK.perf_counter() - start) * 1000)
+        latency_ms = (perf_counter_ns() - start_ns) // 1_000_000
         if circuit_breaker:
             circuit_breaker.record_failure()
         payload = {"healthy": False, "latency_ms": latency_ms}
@@ -1303,6 +1435,18 @@ async def _run_dependency_check(
         return payload, _format_dependency_error(exc)
 
 
+def _record_failure_if_cancelled(
+    circuit_breaker: CircuitBreaker,
+) -> Callable[[asyncio.Task[Any]], None]:
+    """Return a task done-callback that counts cancellation as a breaker failure."""
+
+    def _callback(task: asyncio.Task[Any]) -> None:
+        if task.cancelled():
+            circuit_breaker.record_failure()
+
+    return _callback
+
+
 async def _run_health_summary_checks(
     timeout_budget: float,
     db_timeout_seconds: float,
@@ -1311,61 +1455,60 @@ async def _run_health_summary_checks(
     redis_url: str | None,
 ) -> dict[str, tuple[dict[str, int | bool], str | None]]:
     """Run summary dependency checks with an overall time budget."""
-    tasks = {
-        "database": asyncio.create_task(
-            _run_dependency_check(_ping_db, db_timeout_seconds, db_timeout_seconds)
-        ),
-        "minio": asyncio.create_task(
-            _run_dependency_check(
-                _ping_minio,
-                minio_timeout_seconds,
-                minio_timeout_seconds,
-                circuit_breaker=_MINIO_CIRCUIT,
-            )
-        ),
-        "redis": asyncio.create_task(
-            _run_dependency_check(
-                _ping_redis,
-                redis_timeout_seconds,
-                redis_url,
-                redis_timeout_seconds,
-                circuit_breaker=_REDIS_CIRCUIT,
-                enabled=bool(redis_url),
-                include_enabled=True,
-            )
-        ),
-    }
-    task_names = {task: name for name, task in tasks.items()}
-    start = HEALTH_CLOCK.perf_counter()
+    start_ns = HEALTH_CLOCK.perf_counter_ns()
     # Allow a small buffer beyond the budget to avoid false timeouts in the executor.
     overall_timeout = min(timeout_budget + 0.05, 0.2)
-    done, pending = await asyncio.wait(tasks.values(), timeout=overall_timeout)
-    elapsed_ms = int(min(overall_timeout, HEALTH_CLOCK.perf_counter() - start) * 1000)
-    for task in pending:
-        task.cancel()
-        name = task_names.get(task)
-        if name == "minio":
-            _MINIO_CIRCUIT.record_failure()
-        elif name == "redis" and redis_url:
-            _REDIS_CIRCUIT.record_failure()
-    if pending:
-        await asyncio.gather(*pending, return_exceptions=True)
+    checks: dict[str, asyncio.Task[tuple[dict[str, int | bool], str | None]]] = {}
+    try:
+        # On expiry the task group cancels whatever is still running; an abandoned
+        # ping then counts against its breaker from the shared task's done-callback.
+        async with asyncio.timeout(overall_timeout), asyncio.TaskGroup() as group:
+            checks["database"] = group.create_task(
+                _run_dependency_check(_ping_db, db_timeout_seconds, db_timeout_seconds)
+            )
+            checks["minio"] = group.create_task(
+                _run_dependency_check(
+                    _ping_minio,
+                    minio_timeout_seconds,
+                    minio_timeout_seconds,
+                    circuit_breaker=_MINIO_CIRCUIT,
+                )
+            )
+            # Without a Redis URL there is nothing to probe, so don't spend a task on it.
+            if redis_url:
+                checks["redis"] = group.create_task(
+                    _run_dependency_check(
+                        _ping_redis,
+                        redis_timeout_seconds,
+                        redis_url,
+                        redis_timeout_seconds,
+                        circuit_breaker=_REDIS_CIRCUIT,
+                        include_enabled=True,
+                    )
+                )
+    except TimeoutError:
+        pass
+    elapsed_ms = min(
+        int(overall_timeout * 1000), (HEALTH_CLOCK.perf_counter_ns() - start_ns) // 1_000_000
+    )
     results: dict[str, tuple[dict[str, int | bool], str | None]] = {}
-    for name, task in tasks.items():
-        if task in done:
+    for name, task in checks.items():
+        if not task.cancelled():
             results[name] = task.result()
         else:
             payload = {"healthy": False, "latency_ms": elapsed_ms}
             if name == "redis":
-                payload["enabled"] = bool(redis_url)
+                payload["enabled"] = True
             results[name] = (payload, "timeout")
+    if not redis_url:
+        results["redis"] = ({"healthy": True, "latency_ms": 0, "enabled": False}, None)
     return results
 
 
 @app.get("/health")
 async def health_app():
     """Return application health and dependency status."""
-    start = HEALTH_CLOCK.perf_counter()
+    start_ns = HEALTH_CLOCK.perf_counter_ns()
     try:
         app_payload = _health_payload()
         timeout_budget = _health_summary_timeout_seconds()
@@ -1415,46 +1558,67 @@ async def health_app():
             "failed_checks": failed_checks,
         }
         status_code = 200 if healthy else 503
-        return JSONResponse(status_code=status_code, content=payload)
+        return ORJSONResponse(status_code=status_code, content=payload)
     finally:
         # Track summary health latency for dashboards and alerts.
-        HEALTH_CHECK_DURATION.labels(endpoint="health").observe(HEALTH_CLOCK.perf_counter() - start)
+        HEALTH_CHECK_DURATION.labels(endpoint="health").observe(
+            (HEALTH_CLOCK.perf_counter_ns() - start_ns) / 1e9
+        )
 
 
 @app.get("/health/live")
-def health_live():
+async def health_live():
     """Alias liveness endpoint for standard probes."""
     return _health_payload()
 
 
 @app.get("/healthz")
-def healthz():
+async def healthz():
     """Alias liveness endpoint for common probe conventions."""
     # Keep probe aliases routed through the same liveness payload.
     return _health_payload()
 
 
 @app.get("/livez")
-def health_livez():
+async def health_livez():
     """Alias live probe endpoint for common probe conventions."""
     return _health_payload()
 
 
+# Probes are answered by the interceptor before routing; the routes above keep
+# the liveness endpoints documented in the OpenAPI schema.
+app.add_middleware(HealthCheckInterceptor, uptime_seconds=_uptime_seconds)
+
+
 @app.on_event("startup")
-async def _configure_default_executor() -> None:
-    """Install a known-good default executor for sync endpoints."""
-    asyncio.get_running_loop().set_default_executor(_APP_EXECUTOR)
+async def _start_memory_profiler() -> None:
+    """Start the optional memory profiler task."""
     await start_memory_profiler(app)
 
 
+@lru_cache(maxsize=1)
 def _db_timeout_seconds() -> float:
     """Return the DB health timeout in seconds."""
     # Cap health checks to 5s so monitoring calls never stall longer.
     return min(float(os.getenv("DB_HEALTH_TIMEOUT_S", "5")), 5.0)
 
 
+@lru_cache(maxsize=1)
+def _db_health_ttl_seconds() -> float:
+    """Return how long a database health result is reused, in seconds."""
+    # Keep this below the probe interval so each probe still sees fresh status.
+    return max(float(os.getenv("DB_HEALTH_TTL_S", "2")), 0.0)
+
+
 def _ping_db(timeout_seconds: float) -> None:
     """Run a lightweight DB query to verify connectivity."""
+    pool = get_pool()
+    if pool is not None:
+        # A pooled connection skips the connect handshake; the timeout caps the
+        # wait for a free (or freshly opened) connection.
+        with pool.connection(timeout=timeout_seconds) as conn:
+            conn.execute("SELECT 1")
+        return
     # Pass a connect timeout so the ping doesn't hang on slow networks.
     conn = connect_db(connect_timeout=timeout_seconds)
     try:
@@ -1463,13 +1627,34 @@ def _ping_db(timeout_seconds: float) -> None:
         conn.close()
 
 
+@lru_cache(maxsize=1)
 def _minio_timeout_seconds() -> float:
     """Return the MinIO health timeout in seconds."""
     return min(float(os.getenv("MINIO_HEALTH_TIMEOUT_S", "5")), 5.0)
 
 
 def _minio_client(timeout_seconds: float):
-    """Create a MinIO client with aggressive timeouts for health checks."""
+    """Return a MinIO client with aggressive timeouts for health checks."""
+    # Key on the exact timeout so pings never outlive the health budget; the
+    # configured timeout is fixed, so probes still share one client and pool.
+    return _cached_minio_client(
+        timeout_seconds,
+        os.getenv("MINIO_ENDPOINT", "http://localhost:9000"),
+        os.getenv("MINIO_ROOT_USER", "minio"),
+        os.getenv("MINIO_ROOT_PASSWORD", "minio123"),
+        os.getenv("MINIO_REGION", "us-east-1"),
+    )
+
+
+@lru_cache(maxsize=4)
+def _cached_minio_client(
+    timeout_seconds: float,
+    endpoint_url: str,
+    access_key: str,
+    secret_key: str,
+    region_name: str,
+):
+    """Build the boto3 S3 client once per timeout and connection settings."""
     config = BotoConfig(
         connect_timeout=timeout_seconds,
         read_timeout=timeout_seconds,
@@ -1477,26 +1662,46 @@ def _minio_client(timeout_seconds: float):
     )
     return boto3.client(
         "s3",
-        endpoint_url=os.getenv("MINIO_ENDPOINT", "http://localhost:9000"),
-        aws_access_key_id=os.getenv("MINIO_ROOT_USER", "minio"),
-        aws_secret_access_key=os.getenv("MINIO_ROOT_PASSWORD", "minio123"),
-        region_name=os.getenv("MINIO_REGION", "us-east-1"),
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region_name,
         config=config,
     )
 
 
+@lru_cache(maxsize=1)
 def _redis_timeout_seconds() -> float:
     """Return the Redis health timeout in seconds."""
     return min(float(os.getenv("REDIS_HEALTH_TIMEOUT_S", "2")), 5.0)
 
 
+def _clear_timeout_caches() -> None:
+    """Forget memoized health timeouts so changed env vars apply (useful for tests)."""
+    # The timeouts are read from the environment once; it does not change at runtime.
+    for helper in (
+        _circuit_breaker_reset_seconds,
+        _health_summary_timeout_seconds,
+        _db_timeout_seconds,
+        _db_health_ttl_seconds,
+        _minio_timeout_seconds,
+        _redis_timeout_seconds,
+    ):
+        helper.cache_clear()
+
+
 def _ping_redis(redis_url: str, timeout_seconds: float) -> None:
     """Run a lightweight Redis ping to verify cache connectivity."""
+    _redis_client(redis_url, timeout_seconds).ping()
+
+
+@lru_cache(maxsize=4)
+def _redis_client(redis_url: str, timeout_seconds: float):
+    """Return a pooled Redis client so repeated pings reuse their connection."""
     # Import lazily so Redis remains optional outside of cache deployments.
     import redis
 
-    client = redis.Redis.from_url(redis_url, socket_timeout=timeout_seconds)
-    client.ping()
+    return redis.Redis.from_url(redis_url, socket_timeout=timeout_seconds)
 
 
 def _ping_minio(timeout_seconds: float) -> None:
@@ -1509,40 +1714,44 @@ async def _run_health_check_with_retries(
     func,
     timeout_seconds: float,
     *args,
-    sleep_fn: Callable[[float], None] | None = None,
+    sleep_fn: Callable[[float], Awaitable[None] | None] | None = None,
     perf_counter_fn: Callable[[], float] | None = None,
 ) -> None:
     """Run a health check with exponential backoff for flaky dependencies."""
-
-    def _run_with_retries_sync() -> None:
-        # Resolve injected timing functions once so retries stay consistent.
-        resolved_sleep = sleep_fn or HEALTH_CLOCK.sleep
-        resolved_perf_counter = perf_counter_fn or HEALTH_CLOCK.perf_counter
+    # Only the blocking ping runs on a worker thread; backoff sleeps happen on the
+    # event loop so retries never hold one of the limited health slots.
+    resolved_sleep = sleep_fn or HEALTH_CLOCK.sleep
+    resolved_perf_counter = perf_counter_fn or HEALTH_CLOCK.perf_counter
+    async with asyncio.timeout(timeout_seconds):
         deadline = resolved_perf_counter() + timeout_seconds
         for backoff in _HEALTH_RETRY_BACKOFFS:
             try:
-                func(*args)
+                await _run_ping(func, *args)
                 return
             except Exception:
                 if resolved_perf_counter() + backoff >= deadline:
                     raise
-                resolved_sleep(backoff)
-        func(*args)
+                pause = resolved_sleep(backoff)
+                if inspect.isawaitable(pause):
+                    await pause
+        await _run_ping(func, *args)
 
-    await asyncio.wait_for(
-        asyncio.get_running_loop().run_in_executor(get_health_executor(), _run_with_retries_sync),
-        timeout=timeout_seconds,
-    )
+
+async def _run_ping(func, *args) -> None:
+    """Run one blocking ping on the health executor."""
+    # Cancelling the await returns promptly even while a dependency hangs: a queued
+    # ping is dropped, and a running one finishes in the background on its thread.
+    await asyncio.get_running_loop().run_in_executor(_HEALTH_EXECUTOR, func, *args)
 
 
 @app.get(
     "/health/db",
-    response_model=HealthDbResponse,
     summary="Check database connectivity",
     description=(
         "Run a lightweight database ping and return the health status with observed latency."
     ),
     responses={
+        200: {"model": HealthDbResponse, "description": "Successful Response"},
         503: {
             "model": HealthDbResponse,
             "description": "Database unavailable",
@@ -1556,44 +1765,86 @@ async def _run_health_check_with_retries(
                     }
                 }
             },
-        }
+        },
     },
 )
 async def health_db():
     """Return database connectivity status and latency."""
-    start = HEALTH_CLOCK.perf_counter()
+    payload, status_code = await _health_db_payload()
+    return ORJSONResponse(status_code=status_code, content=payload)
+
+
+# /health/db, /health/ready and /readyz all need the same answer; probes and UI
+# pages hitting them together share one ping per TTL window.
+_DB_HEALTH_CACHE: tuple[float, dict[str, int | bool], int] | None = None
+_DB_HEALTH_LOCK = asyncio.Lock()
+
+
+def _reset_db_health_cache() -> None:
+    """Forget the cached database health result (useful for tests)."""
+    global _DB_HEALTH_CACHE, _DB_HEALTH_LOCK
+    _DB_HEALTH_CACHE = None
+    # A fresh lock avoids reusing one bound to a previous event loop.
+    _DB_HEALTH_LOCK = asyncio.Lock()
+
+
+def _cached_db_health() -> tuple[dict[str, int | bool], int] | None:
+    """Return the cached database health result while it is within the TTL."""
+    cached = _DB_HEALTH_CACHE
+    if cached is not None and HEALTH_CLOCK.monotonic() - cached[0] < _db_health_ttl_seconds():
+        return cached[1], cached[2]
+    return None
+
+
+async def _health_db_payload() -> tuple[dict[str, int | bool], int]:
+    """Return the database health payload and status code, pinging at most once per TTL."""
+    # Readiness and detailed checks consume the dict directly instead of
+    # round-tripping it through a JSONResponse body.
+    global _DB_HEALTH_CACHE
+    cached = _cached_db_health()
+    if cached is not None:
+        return cached
+    async with _DB_HEALTH_LOCK:
+        # Another request may have refreshed the result while this one waited.
+        cached = _cached_db_health()
+        if cached is not None:
+            return cached
+        payload, status_code = await _ping_db_health()
+        _DB_HEALTH_CACHE = (HEALTH_CLOCK.monotonic(), payload, status_code)
+        return payload, status_code
+
+
+async def _ping_db_health() -> tuple[dict[str, int | bool], int]:
+    """Ping the database and return the health payload with its status code."""
+    perf_counter_ns = HEALTH_CLOCK.perf_counter_ns
+    start_ns = perf_counter_ns()
     timeout_seconds = _db_timeout_seconds()
     try:
-        # Use a dedicated executor to avoid relying on the loop default executor.
         await _run_health_check_with_retries(_ping_db, timeout_seconds, timeout_seconds)
-        latency_ms = int((HEALTH_CLOCK.perf_counter() - start) * 1000)
-        payload = {"healthy": True, "latency_ms": latency_ms}
-        return JSONResponse(status_code=200, content=payload)
+        latency_ms = (perf_counter_ns() - start_ns) // 1_000_000
+        return {"healthy": True, "latency_ms": latency_ms}, 200
     except TimeoutError:
         # Fail fast to keep the endpoint under the timeout budget.
-        latency_ms = int(min(timeout_seconds, HEALTH_CLOCK.perf_counter() - start) * 1000)
-        payload = {"healthy": False, "latency_ms": latency_ms}
-        return JSONResponse(status_code=503, content=payload)
+        latency_ms = min(int(timeout_seconds * 1000), (perf_counter_ns() - start_ns) // 1_000_000)
+        return {"healthy": False, "latency_ms": latency_ms}, 503
     except Exception:
-        latency_ms = int((HEALTH_CLOCK.perf_counter() - start) * 1000)
-        payload = {"healthy": False, "latency_ms": latency_ms}
-        return JSONResponse(status_code=503, content=payload)
+        latency_ms = (perf_counter_ns() - start_ns) // 1_000_000
+        return {"healthy": False, "latency_ms": latency_ms}, 503
     finally:
         # Record total DB check duration even when the ping fails.
         HEALTH_CHECK_DURATION.labels(endpoint="health_db").observe(
-            HEALTH_CLOCK.perf_counter() - start
+            (perf_counter_ns() - start_ns) / 1e9
         )
 
 
 @app.get("/health/ready")
 async def health_ready():
     """Return readiness status combining app and database checks."""
-    start = HEALTH_CLOCK.perf_counter()
+    start_ns = HEALTH_CLOCK.perf_counter_ns()
     # Reuse the existing health endpoints to keep readiness logic consistent.
     app_payload = _health_payload()
     try:
-        db_response = await health_db()
-        db_payload = json.loads(db_response.body)
+        db_payload, _ = await _health_db_payload()
         healthy = app_payload["healthy"] and db_payload["healthy"]
         payload = {
             "healthy": healthy,
@@ -1601,11 +1852,11 @@ async def health_ready():
             "db_latency_ms": db_payload["latency_ms"],
         }
         status_code = 200 if healthy else 503
-        return JSONResponse(status_code=status_code, content=payload)
+        return ORJSONResponse(status_code=status_code, content=payload)
     finally:
         # Capture readiness latency for alerting dashboards.
         HEALTH_CHECK_DURATION.labels(endpoint="health_ready").observe(
-            HEALTH_CLOCK.perf_counter() - start
+            (HEALTH_CLOCK.perf_counter_ns() - start_ns) / 1e9
         )
 
 
@@ -1618,34 +1869,33 @@ async def health_readyz():
 
 @app.get(
     "/health/detailed",
-    response_model=HealthDetailedResponse,
     summary="Return detailed health status",
     description="Return per-component health status, including database connectivity.",
     responses={
+        200: {"model": HealthDetailedResponse, "description": "Successful Response"},
         503: {
             "model": HealthDetailedResponse,
             "description": "One or more components are unavailable",
-        }
+        },
     },
 )
 async def health_detailed():
     """Return detailed health status for app and database components."""
-    start = HEALTH_CLOCK.perf_counter()
+    start_ns = HEALTH_CLOCK.perf_counter_ns()
     # Reuse existing health payloads to keep liveness logic consistent.
     app_payload = _health_payload()
     try:
-        db_response = await health_db()
-        db_payload = json.loads(db_response.body)
+        db_payload, _ = await _health_db_payload()
         if _MINIO_CIRCUIT.is_open():
             minio_payload = {"healthy": False, "latency_ms": 0, "circuit_open": True}
         else:
-            minio_start = HEALTH_CLOCK.perf_counter()
+            minio_start_ns = HEALTH_CLOCK.perf_counter_ns()
             minio_timeout_seconds = _minio_timeout_seconds()
             try:
                 await _run_health_check_with_retries(
                     _ping_minio, minio_timeout_seconds, minio_timeout_seconds
                 )
-                minio_latency_ms = int((HEALTH_CLOCK.perf_counter() - minio_start) * 1000)
+                minio_latency_ms = (HEALTH_CLOCK.perf_counter_ns() - minio_start_ns) // 1_000_000
                 _MINIO_CIRCUIT.record_success()
                 minio_payload = {"healthy": True, "latency_ms": minio_latency_ms}
             except TimeoutError:
@@ -1653,7 +1903,7 @@ async def health_detailed():
                 _MINIO_CIRCUIT.record_failure()
                 minio_payload = {"healthy": False, "latency_ms": minio_latency_ms}
             except Exception:
-                minio_latency_ms = int((HEALTH_CLOCK.perf_counter() - minio_start) * 1000)
+                minio_latency_ms = (HEALTH_CLOCK.perf_counter_ns() - minio_start_ns) // 1_000_000
                 _MINIO_CIRCUIT.record_failure()
                 minio_payload = {"healthy": False, "latency_ms": minio_latency_ms}
         redis_url = os.getenv("REDIS_URL")
@@ -1666,13 +1916,15 @@ async def health_detailed():
                     "circuit_open": True,
                 }
             else:
-                redis_start = HEALTH_CLOCK.perf_counter()
+                redis_start_ns = HEALTH_CLOCK.perf_counter_ns()
                 redis_timeout_seconds = _redis_timeout_seconds()
                 try:
                     await _run_health_check_with_retries(
                         _ping_redis, redis_timeout_seconds, redis_url, redis_timeout_seconds
                     )
-                    redis_latency_ms = int((HEALTH_CLOCK.perf_counter() - redis_start) * 1000)
+                    redis_latency_ms = (
+                        HEALTH_CLOCK.perf_counter_ns() - redis_start_ns
+                    ) // 1_000_000
                     _REDIS_CIRCUIT.record_success()
                     redis_payload = {
                         "healthy": True,
@@ -1688,7 +1940,9 @@ async def health_detailed():
                         "enabled": True,
                     }
                 except Exception:
-                    redis_latency_ms = int((HEALTH_CLOCK.perf_counter() - redis_start) * 1000)
+                    redis_latency_ms = (
+                        HEALTH_CLOCK.perf_counter_ns() - redis_start_ns
+                    ) // 1_000_000
                     _REDIS_CIRCUIT.record_failure()
                     redis_payload = {
                         "healthy": False,
@@ -1725,26 +1979,55 @@ async def health_detailed():
             "components": components,
         }
         status_code = 200 if healthy else 503
-        return JSONResponse(status_code=status_code, content=payload)
+        return ORJSONResponse(status_code=status_code, content=payload)
     finally:
         # Track full detailed health check latency for dashboards.
         HEALTH_CHECK_DURATION.labels(endpoint="health_detailed").observe(
-            HEALTH_CLOCK.perf_counter() - start
+            (HEALTH_CLOCK.perf_counter_ns() - start_ns) / 1e9
         )
 
 
+# Several scrapers (replicas, sidecars) often hit /metrics within the same second;
+# serve them one rendering instead of walking every collector each time.
+_METRICS_CACHE_TTL_S = 1.0
+_METRICS_CACHE: tuple[float, bytes] | None = None
+_METRICS_LOCK = Lock()
+
+
+def _fresh_metrics(now: float) -> bytes | None:
+    """Return the cached exposition if it is still inside the TTL window."""
+    # The cache is swapped as one tuple, so this unlocked read is always consistent.
+    cached = _METRICS_CACHE
+    if cached is not None and now - cached[0] < _METRICS_CACHE_TTL_S:
+        return cached[1]
+    return None
+
+
+def _metrics_exposition() -> bytes:
+    """Return the encoded registry, re-rendering at most once per TTL window."""
+    global _METRICS_CACHE
+    now = HEALTH_CLOCK.monotonic()
+    body = _fresh_metrics(now)
+    if body is not None:
+        return body
+    with _METRICS_LOCK:
+        body = _fresh_metrics(now)
+        if body is not None:
+            return body
+        body = generate_latest()
+        _METRICS_CACHE = (now, body)
+        return body
+
+
 @app.get("/metrics")
-def metrics() -> Response:
+async def metrics() -> Response:
     """Return Prometheus metrics for scraping."""
+    body = _fresh_metrics(HEALTH_CLOCK.monotonic())
+    if body is None:
+        # generate_latest() walks every collector; keep it off the event loop.
+        body = await asyncio.to_thread(_metrics_exposition)
     # Prometheus expects the text exposition format on this endpoint.
-    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
-
-
-@app.on_event("shutdown")
-def _shutdown_executors() -> None:
-    """Release the health check executors on app shutdown."""
-    _APP_EXECUTOR.shutdown(wait=False, cancel_futures=True)
-    _HEALTH_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    return Response(body, media_type=CONTENT_TYPE_LATEST)
 
 
 @app.on_event("shutdown")
@@ -1753,6 +2036,23 @@ async def _shutdown_memory_profiler() -> None:
     await stop_memory_profiler(app)
 
 
+@app.on_event("shutdown")
+def _shutdown_health_executor() -> None:
+    """Drop queued health pings instead of running them against departing dependencies."""
+    global _HEALTH_EXECUTOR
+    executor = _HEALTH_EXECUTOR
+    # Threads start lazily, so an idle replacement is free and keeps the module
+    # usable if the app is started again in the same process.
+    _HEALTH_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="health-ping")
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+@app.on_event("shutdown")
+async def _close_db_pools() -> None:
+    """Close pooled database connections held by request handlers."""
+    close_db_pools()
+
+
 # Commit-message checklist:
 # - [ ] type is accurate (feat, fix, test)
 # - [ ] scope is clear (health)
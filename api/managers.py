@@ -2,23 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
 import json
 import logging
 import math
 import os
-import re
 import sqlite3
 from datetime import UTC, datetime
 from functools import wraps
-from typing import Annotated, Any, cast
+from typing import Annotated, Any, NoReturn, cast
 
 from fastapi import APIRouter, Body, HTTPException, Path, Query, Request, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
-from adapters.base import connect_db
+from adapters.base import connect_db, db_pool_timeout, get_pool
 from adapters.base import resolve_manager_id_column as shared_manager_id_column
 from api.cache import cache_query, invalidate_cache_prefix
 from api.models import (
@@ -31,6 +31,7 @@ from api.models import (
     ManagerStatsResponse,
     UniverseImportResponse,
 )
+from config import load_runtime_config
 from etl.manager_similarity_flow import ensure_manager_similarity_table
 from utils.identifiers import normalize_cik
 
@@ -51,8 +52,17 @@ REQUIRED_FIELD_ERRORS = {
     "name": "Name is required.",
 }
 DEFAULT_BULK_IMPORT_MAX_BYTES = 2_000_000
-CIK_PATTERN = re.compile(r"^\d{10}$")
 SQLITE_TABLE_INFO_SQL = "SELECT name FROM pragma_table_info(?)"
+_INSERT_MANAGER_COLUMNS = (
+    "INSERT INTO managers(name, cik, lei, aliases, jurisdictions, tags, registry_ids) "
+)
+_INSERT_MANAGER_SQLITE_SQL = _INSERT_MANAGER_COLUMNS + "VALUES (?, ?, ?, ?, ?, ?, ?)"
+# Postgres always keys managers on manager_id (see resolve_manager_id_column).
+_INSERT_MANAGER_POSTGRES_SQL = (
+    _INSERT_MANAGER_COLUMNS + "VALUES (%s, %s, %s, %s, %s, %s, %s::jsonb) RETURNING manager_id"
+)
+# Databases whose managers table has already been created/migrated this process.
+_MANAGER_TABLE_READY: set[str] = set()
 
 
 class ManagerCreate(BaseModel):
@@ -161,6 +171,48 @@ def _ensure_manager_table(conn) -> None:
     )
 
 
+def _db_identity() -> str:
+    """Return the database ``connect_db`` and ``get_pool`` currently resolve to."""
+    config = load_runtime_config()
+    return config.db_url or str(config.db_path)
+
+
+def _ensure_manager_table_once(conn, db_identity: str) -> None:
+    """Run the managers DDL the first time a request touches a database."""
+    if db_identity in _MANAGER_TABLE_READY:
+        return
+    _ensure_manager_table(conn)
+    # Every connection to an in-memory SQLite database starts empty.
+    if db_identity != ":memory:":
+        _MANAGER_TABLE_READY.add(db_identity)
+
+
+def _reset_manager_table_cache() -> None:
+    """Forget which databases have had their managers schema ensured."""
+    _MANAGER_TABLE_READY.clear()
+
+
+def _open_connection() -> tuple[Any, Any]:
+    """Borrow a pooled Postgres connection, or open a SQLite one.
+
+    Returns the connection with the pool it came from (``None`` for SQLite) so
+    ``_close_connection`` hands it back to that pool even if ``DB_URL`` changed.
+    The checkout waits at most ``db_pool_timeout()`` rather than the pool's 30s.
+    """
+    pool = get_pool()
+    if pool is not None:
+        return pool.getconn(timeout=db_pool_timeout()), pool
+    return connect_db(), None
+
+
+def _close_connection(conn, pool) -> None:
+    """Return a connection from ``_open_connection`` to its pool, or close it."""
+    if pool is not None:
+        pool.putconn(conn)
+        return
+    conn.close()
+
+
 def _manager_id_column(conn) -> str:
     """Return the manager primary-key column for the active database backend."""
     return shared_manager_id_column(conn)
@@ -335,10 +387,7 @@ def _insert_manager(conn, payload: ManagerCreate) -> int:
     """Insert a manager record and return the generated id."""
     if isinstance(conn, sqlite3.Connection):
         cursor = conn.execute(
-            (
-                "INSERT INTO managers(name, cik, lei, aliases, jurisdictions, tags, registry_ids) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?)"
-            ),
+            _INSERT_MANAGER_SQLITE_SQL,
             (
                 payload.name,
                 payload.cik,
@@ -352,12 +401,8 @@ def _insert_manager(conn, payload: ManagerCreate) -> int:
         conn.commit()
         lastrowid = cursor.lastrowid
         return int(lastrowid) if lastrowid is not None else 0
-    id_column = _manager_id_column(conn)
     cursor = conn.execute(
-        (
-            "INSERT INTO managers(name, cik, lei, aliases, jurisdictions, tags, registry_ids) "
-            f"VALUES (%s, %s, %s, %s, %s, %s, %s::jsonb) RETURNING {id_column}"
-        ),
+        _INSERT_MANAGER_POSTGRES_SQL,
         (
             payload.name,
             payload.cik,
@@ -572,16 +617,20 @@ def _fetch_manager(conn, db_identity: str, manager_id: int) -> tuple[object, ...
     return cursor.fetchone()
 
 
+def _is_valid_cik(value: str) -> bool:
+    """Return True for a 10-digit, zero-padded ASCII CIK."""
+    # Plain str checks are a fixed-length scan with no regex engine involved;
+    # isascii() keeps other Unicode digits (e.g. Arabic-Indic) out.
+    return len(value) == 10 and value.isascii() and value.isdigit()
+
+
 def _validate_manager_payload(payload: ManagerCreate) -> list[dict[str, str]]:
     """Apply required field checks."""
     errors: list[dict[str, str]] = []
     if not payload.name.strip():
         errors.append({"field": "name", "message": REQUIRED_FIELD_ERRORS["name"]})
-    if (
-        payload.cik is not None
-        and payload.cik.strip()
-        and not CIK_PATTERN.match(payload.cik.strip())
-    ):
+    cik = (payload.cik or "").strip()
+    if cik and not _is_valid_cik(cik):
         errors.append({"field": "cik", "message": "CIK must be a 10-digit zero-padded string."})
     return errors
 
@@ -595,11 +644,8 @@ def _validate_manager_update_payload(payload: ManagerUpdate) -> list[dict[str, s
         return errors
     if payload.name is not None and not payload.name.strip():
         errors.append({"field": "name", "message": REQUIRED_FIELD_ERRORS["name"]})
-    if (
-        payload.cik is not None
-        and payload.cik.strip()
-        and not CIK_PATTERN.match(payload.cik.strip())
-    ):
+    cik = (payload.cik or "").strip()
+    if cik and not _is_valid_cik(cik):
         errors.append({"field": "cik", "message": "CIK must be a 10-digit zero-padded string."})
     return errors
 
@@ -699,8 +745,10 @@ def _require_valid_manager(handler):
     return wrapper
 
 
-def _raise_db_unavailable(exc: BaseException) -> None:
+def _raise_db_unavailable(exc: BaseException) -> NoReturn:
     logger.exception("Database error in managers API.", exc_info=exc)
+    # The table may have been dropped or migrated underneath us; re-check it next time.
+    _MANAGER_TABLE_READY.discard(_db_identity())
     raise HTTPException(status_code=503, detail="Database unavailable") from exc
 
 
@@ -828,6 +876,39 @@ def _bulk_request_payload_too_large(max_bytes: int) -> JSONResponse:
     )
 
 
+def _create_manager_record(payload: ManagerCreate) -> ManagerResponse:
+    """Store a validated manager and return it as read back from the database."""
+    db_identity = _db_identity()
+    conn = pool = None
+    try:
+        conn, pool = _open_connection()
+        # Ensure schema exists before storing the first record in this database.
+        _ensure_manager_table_once(conn, db_identity)
+        manager_id = _insert_manager(conn, payload)
+        row = _fetch_manager(conn, db_identity, manager_id)
+        invalidate_cache_prefix("managers")
+    except DB_ERROR_TYPES as exc:
+        _raise_db_unavailable(exc)
+    finally:
+        if conn is not None:
+            _close_connection(conn, pool)
+    if row is not None:
+        return _to_manager_response(row)
+    return ManagerResponse(
+        manager_id=manager_id,
+        name=payload.name,
+        cik=payload.cik,
+        lei=payload.lei,
+        aliases=payload.aliases,
+        jurisdictions=payload.jurisdictions,
+        tags=payload.tags,
+        registry_ids=payload.registry_ids,
+        quality_flags=[],
+        created_at=None,
+        updated_at=None,
+    )
+
+
 @router.post(
     "/managers",
     status_code=201,
@@ -885,35 +966,45 @@ async def create_manager(
     ],
 ):
     """Create a manager record after validating required fields."""
-    db_identity = os.getenv("DB_URL") or os.getenv("DB_PATH", "dev.db")
-    conn = None
+    # Connecting and writing block, so keep them off the event loop.
+    return await asyncio.to_thread(_create_manager_record, payload)
+
+
+def _list_manager_records(
+    limit: int, offset: int, jurisdiction: str | None, tag: str | None
+) -> ManagerListResponse:
+    """Return one page of managers and the filtered total."""
+    db_identity = _db_identity()
+    conn = pool = None
     try:
-        conn = connect_db()
-        # Ensure schema exists before storing the record.
-        _ensure_manager_table(conn)
-        manager_id = _insert_manager(conn, payload)
-        row = _fetch_manager(conn, db_identity, manager_id)
-        invalidate_cache_prefix("managers")
+        conn, pool = _open_connection()
+        # Ensure the table exists so empty databases still return metadata.
+        _ensure_manager_table_once(conn, db_identity)
+        normalized_jurisdiction = jurisdiction.strip() or None if jurisdiction else None
+        normalized_tag = tag.strip() or None if tag else None
+        total = _count_managers(conn, db_identity, normalized_jurisdiction, normalized_tag)
+        # Default to a 25-row page while preserving the client-requested limit in metadata.
+        remaining = max(total - offset, 0)
+        page_limit = min(limit, remaining)
+        if page_limit:
+            rows = _fetch_managers(
+                conn,
+                db_identity,
+                page_limit,
+                offset,
+                normalized_jurisdiction,
+                normalized_tag,
+            )
+        else:
+            rows = []
+        response_limit = limit
     except DB_ERROR_TYPES as exc:
         _raise_db_unavailable(exc)
     finally:
         if conn is not None:
-            conn.close()
-    if row is not None:
-        return _to_manager_response(row)
-    return ManagerResponse(
-        manager_id=manager_id,
-        name=payload.name,
-        cik=payload.cik,
-        lei=payload.lei,
-        aliases=payload.aliases,
-        jurisdictions=payload.jurisdictions,
-        tags=payload.tags,
-        registry_ids=payload.registry_ids,
-        quality_flags=[],
-        created_at=None,
-        updated_at=None,
-    )
+            _close_connection(conn, pool)
+    items = [_to_manager_response(row) for row in rows]
+    return ManagerListResponse(items=items, total=total, limit=response_limit, offset=offset)
 
 
 @router.get(
@@ -996,37 +1087,47 @@ async def list_managers(
     tag: str | None = Query(None, description="Filter managers by tag"),
 ):
     """Return a paginated list of managers."""
-    db_identity = os.getenv("DB_URL") or os.getenv("DB_PATH", "dev.db")
-    conn = None
+    # Borrowing a connection and querying block, so keep them off the event loop.
+    return await asyncio.to_thread(_list_manager_records, limit, offset, jurisdiction, tag)
+
+
+def _insert_bulk_records(
+    valid_records: list[tuple[int, ManagerCreate]],
+) -> list[BulkImportSuccess]:
+    """Insert validated bulk-import records and describe each stored manager."""
+    conn = pool = None
+    successes: list[BulkImportSuccess] = []
     try:
-        conn = connect_db()
-        # Ensure the table exists so empty databases still return metadata.
-        _ensure_manager_table(conn)
-        normalized_jurisdiction = jurisdiction.strip() or None if jurisdiction else None
-        normalized_tag = tag.strip() or None if tag else None
-        total = _count_managers(conn, db_identity, normalized_jurisdiction, normalized_tag)
-        # Default to a 25-row page while preserving the client-requested limit in metadata.
-        remaining = max(total - offset, 0)
-        page_limit = min(limit, remaining)
-        if page_limit:
-            rows = _fetch_managers(
-                conn,
-                db_identity,
-                page_limit,
-                offset,
-                normalized_jurisdiction,
-                normalized_tag,
-            )
-        else:
-            rows = []
-        response_limit = limit
+        if valid_records:
+            conn, pool = _open_connection()
+            _ensure_manager_table_once(conn, _db_identity())
+            for index, payload in valid_records:
+                manager_id = _insert_manager(conn, payload)
+                successes.append(
+                    BulkImportSuccess(
+                        index=index,
+                        manager=ManagerResponse(
+                            manager_id=manager_id,
+                            name=payload.name,
+                            cik=payload.cik,
+                            lei=payload.lei,
+                            aliases=payload.aliases,
+                            jurisdictions=payload.jurisdictions,
+                            tags=payload.tags,
+                            registry_ids=payload.registry_ids,
+                            quality_flags=[],
+                            created_at=None,
+                            updated_at=None,
+                        ),
+                    )
+                )
+            invalidate_cache_prefix("managers")
     except DB_ERROR_TYPES as exc:
         _raise_db_unavailable(exc)
     finally:
         if conn is not None:
-            conn.close()
-    items = [_to_manager_response(row) for row in rows]
-    return ManagerListResponse(items=items, total=total, limit=response_limit, offset=offset)
+            _close_connection(conn, pool)
+    return successes
 
 
 @router.post(
@@ -1128,38 +1229,8 @@ async def bulk_import_managers(
     # Validate all records before inserting any to satisfy bulk import guarantees.
     valid_records, failures = _validate_bulk_records(raw_records, source)
 
-    conn = None
-    successes: list[BulkImportSuccess] = []
-    try:
-        if valid_records:
-            conn = connect_db()
-            _ensure_manager_table(conn)
-            for index, payload in valid_records:
-                manager_id = _insert_manager(conn, payload)
-                successes.append(
-                    BulkImportSuccess(
-                        index=index,
-                        manager=ManagerResponse(
-                            manager_id=manager_id,
-                            name=payload.name,
-                            cik=payload.cik,
-                            lei=payload.lei,
-                            aliases=payload.aliases,
-                            jurisdictions=payload.jurisdictions,
-                            tags=payload.tags,
-                            registry_ids=payload.registry_ids,
-                            quality_flags=[],
-                            created_at=None,
-                            updated_at=None,
-                        ),
-                    )
-                )
-            invalidate_cache_prefix("managers")
-    except DB_ERROR_TYPES as exc:
-        _raise_db_unavailable(exc)
-    finally:
-        if conn is not None:
-            conn.close()
+    # Borrowing a connection and writing block, so keep them off the event loop.
+    successes = await asyncio.to_thread(_insert_bulk_records, valid_records)
 
     return BulkImportResponse(
         total=len(raw_records),
@@ -1170,32 +1241,14 @@ async def bulk_import_managers(
     )
 
 
-@router.post(
-    "/managers/import/universe",
-    status_code=200,
-    response_model=UniverseImportResponse,
-    summary="Import manager universe records",
-    description=(
-        "Import a JSON array of manager universe records with CIK-based upsert behavior. "
-        "Valid records create or update managers by CIK; invalid records are skipped."
-    ),
-)
-async def import_manager_universe(
-    records: Annotated[Any, Body(..., description="Array of manager records")],
-):
-    """Upsert manager universe records using CIK as the unique key."""
-    if not isinstance(records, list):
-        return _bulk_request_error("body", "Request body must be a JSON array.")
-
-    if not records:
-        return UniverseImportResponse(created=0, updated=0, skipped=0)
-
-    conn = None
+def _import_universe_records(records: list[Any]) -> UniverseImportResponse:
+    """Upsert universe records by CIK, skipping malformed entries."""
+    conn = pool = None
     created = 0
     updated = 0
     skipped = 0
     try:
-        conn = connect_db()
+        conn, pool = _open_connection()
         _ensure_universe_schema(conn)
         for index, record in enumerate(records):
             if not isinstance(record, dict):
@@ -1227,11 +1280,50 @@ async def import_manager_universe(
         _raise_db_unavailable(exc)
     finally:
         if conn is not None:
-            conn.close()
+            _close_connection(conn, pool)
 
     return UniverseImportResponse(created=created, updated=updated, skipped=skipped)
 
 
+@router.post(
+    "/managers/import/universe",
+    status_code=200,
+    response_model=UniverseImportResponse,
+    summary="Import manager universe records",
+    description=(
+        "Import a JSON array of manager universe records with CIK-based upsert behavior. "
+        "Valid records create or update managers by CIK; invalid records are skipped."
+    ),
+)
+async def import_manager_universe(
+    records: Annotated[Any, Body(..., description="Array of manager records")],
+):
+    """Upsert manager universe records using CIK as the unique key."""
+    if not isinstance(records, list):
+        return _bulk_request_error("body", "Request body must be a JSON array.")
+
+    if not records:
+        return UniverseImportResponse(created=0, updated=0, skipped=0)
+
+    return await asyncio.to_thread(_import_universe_records, records)
+
+
+def _manager_stats_record() -> ManagerStatsResponse:
+    """Aggregate manager universe statistics from the database."""
+    conn = pool = None
+    try:
+        conn, pool = _open_connection()
+        _ensure_manager_table_once(conn, _db_identity())
+        rows = _fetch_manager_stats_rows(conn)
+    except DB_ERROR_TYPES as exc:
+        _raise_db_unavailable(exc)
+    finally:
+        if conn is not None:
+            _close_connection(conn, pool)
+
+    return _build_manager_stats(rows)
+
+
 @router.get(
     "/managers/stats",
     response_model=ManagerStatsResponse,
@@ -1243,18 +1335,26 @@ async def import_manager_universe(
 )
 async def get_manager_stats():
     """Return aggregate manager universe statistics."""
-    conn = None
+    return await asyncio.to_thread(_manager_stats_record)
+
+
+def _get_manager_record(manager_id: int) -> ManagerResponse:
+    """Load a manager by id or raise 404."""
+    db_identity = _db_identity()
+    conn = pool = None
     try:
-        conn = connect_db()
-        _ensure_manager_table(conn)
-        rows = _fetch_manager_stats_rows(conn)
+        conn, pool = _open_connection()
+        # Ensure the table exists before attempting the lookup.
+        _ensure_manager_table_once(conn, db_identity)
+        row = _fetch_manager(conn, db_identity, manager_id)
     except DB_ERROR_TYPES as exc:
         _raise_db_unavailable(exc)
     finally:
         if conn is not None:
-            conn.close()
-
-    return _build_manager_stats(rows)
+            _close_connection(conn, pool)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Manager not found")
+    return _to_manager_response(row)
 
 
 @router.get(
@@ -1332,21 +1432,7 @@ async def get_manager(
     id: int = Path(..., ge=1, description="Manager identifier"),
 ):
     """Return a manager by id or raise 404."""
-    db_identity = os.getenv("DB_URL") or os.getenv("DB_PATH", "dev.db")
-    conn = None
-    try:
-        conn = connect_db()
-        # Ensure the table exists before attempting the lookup.
-        _ensure_manager_table(conn)
-        row = _fetch_manager(conn, db_identity, id)
-    except DB_ERROR_TYPES as exc:
-        _raise_db_unavailable(exc)
-    finally:
-        if conn is not None:
-            conn.close()
-    if row is None:
-        raise HTTPException(status_code=404, detail="Manager not found")
-    return _to_manager_response(row)
+    return await asyncio.to_thread(_get_manager_record, id)
 
 
 SIMILARITY_BASES = ("jaccard", "cosine")
@@ -1364,27 +1450,17 @@ def _configured_similarity_basis() -> str:
     return "jaccard"
 
 
-@router.get("/managers/{id}/similar", summary="List similar managers")
-async def get_similar_managers(
-    id: int = Path(..., ge=1, description="Manager identifier"),
-    limit: int = Query(10, ge=1, le=100),
-    basis: str | None = Query(
-        None,
-        pattern="^(jaccard|cosine)$",
-        description="Similarity basis; defaults to MANAGER_SIMILARITY_DEFAULT_BASIS (jaccard).",
-    ),
-):
-    """Return the strongest holding-overlap or embedding-cosine peers for a manager."""
-    basis = basis or _configured_similarity_basis()
-    conn = None
+def _similar_manager_records(manager_id: int, limit: int, basis: str) -> dict[str, Any]:
+    """Load the strongest similarity peers for a manager or raise 404."""
+    conn = pool = None
     try:
-        conn = connect_db()
-        _ensure_manager_table(conn)
+        conn, pool = _open_connection()
+        _ensure_manager_table_once(conn, _db_identity())
         manager_column = _manager_id_column(conn)
         if (
             conn.execute(
                 f"SELECT 1 FROM managers WHERE {manager_column} = {'?' if isinstance(conn, sqlite3.Connection) else '%s'}",
-                (id,),
+                (manager_id,),
             ).fetchone()
             is None
         ):
@@ -1407,7 +1483,7 @@ async def get_similar_managers(
             + " IS NOT NULL ORDER BY "
             + score_column
             + " DESC, overlap_count DESC",
-            (id, id, id),
+            (manager_id, manager_id, manager_id),
         ).fetchall()
         finite_rows = [
             row
@@ -1434,7 +1510,45 @@ async def get_similar_managers(
         _raise_db_unavailable(exc)
     finally:
         if conn is not None:
-            conn.close()
+            _close_connection(conn, pool)
+
+
+@router.get("/managers/{id}/similar", summary="List similar managers")
+async def get_similar_managers(
+    id: int = Path(..., ge=1, description="Manager identifier"),
+    limit: int = Query(10, ge=1, le=100),
+    basis: str | None = Query(
+        None,
+        pattern="^(jaccard|cosine)$",
+        description="Similarity basis; defaults to MANAGER_SIMILARITY_DEFAULT_BASIS (jaccard).",
+    ),
+):
+    """Return the strongest holding-overlap or embedding-cosine peers for a manager."""
+    basis = basis or _configured_similarity_basis()
+    return await asyncio.to_thread(_similar_manager_records, id, limit, basis)
+
+
+def _patch_manager_record(manager_id: int, payload: ManagerUpdate) -> ManagerResponse:
+    """Apply a partial update and return the stored manager, or raise 404."""
+    db_identity = _db_identity()
+    conn = pool = None
+    try:
+        conn, pool = _open_connection()
+        _ensure_manager_table_once(conn, db_identity)
+        updated = _update_manager(conn, manager_id, payload)
+        if not updated:
+            raise HTTPException(status_code=404, detail="Manager not found")
+        row = _fetch_manager(conn, db_identity, manager_id)
+        invalidate_cache_prefix("managers")
+    except DB_ERROR_TYPES as exc:
+        _raise_db_unavailable(exc)
+    finally:
+        if conn is not None:
+            _close_connection(conn, pool)
+
+    if row is None:
+        raise HTTPException(status_code=404, detail="Manager not found")
+    return _to_manager_response(row)
 
 
 @router.patch(
@@ -1474,21 +1588,35 @@ async def patch_manager(
     if errors:
         return JSONResponse(status_code=400, content={"errors": errors, "error": errors})
 
-    db_identity = os.getenv("DB_URL") or os.getenv("DB_PATH", "dev.db")
-    conn = None
+    return await asyncio.to_thread(_patch_manager_record, id, payload)
+
+
+def _patch_manager_tags_record(
+    manager_id: int, add_tags: list[str], remove_tags: list[str]
+) -> ManagerResponse:
+    """Merge tag changes into a manager and return it, or raise 404."""
+    db_identity = _db_identity()
+    conn = pool = None
     try:
-        conn = connect_db()
-        _ensure_manager_table(conn)
-        updated = _update_manager(conn, id, payload)
-        if not updated:
+        conn, pool = _open_connection()
+        _ensure_manager_table_once(conn, db_identity)
+        existing_row = _fetch_manager(conn, db_identity, manager_id)
+        if existing_row is None:
             raise HTTPException(status_code=404, detail="Manager not found")
-        row = _fetch_manager(conn, db_identity, id)
-        invalidate_cache_prefix("managers")
+
+        existing_tags = _json_array(existing_row[6])
+        merged_tags = _merge_tags(existing_tags, add_tags, remove_tags)
+        if merged_tags != existing_tags:
+            _update_manager(conn, manager_id, ManagerUpdate.model_validate({"tags": merged_tags}))
+            invalidate_cache_prefix("managers")
+            row = _fetch_manager(conn, db_identity, manager_id)
+        else:
+            row = existing_row
     except DB_ERROR_TYPES as exc:
         _raise_db_unavailable(exc)
     finally:
         if conn is not None:
-            conn.close()
+            _close_connection(conn, pool)
 
     if row is None:
         raise HTTPException(status_code=404, detail="Manager not found")
@@ -1537,32 +1665,24 @@ async def patch_manager_tags(
         ]
         return JSONResponse(status_code=400, content={"errors": errors, "error": errors})
 
-    db_identity = os.getenv("DB_URL") or os.getenv("DB_PATH", "dev.db")
-    conn = None
+    return await asyncio.to_thread(_patch_manager_tags_record, id, add_tags, remove_tags)
+
+
+def _delete_manager_record(manager_id: int) -> None:
+    """Delete a manager by id, or raise 404."""
+    conn = pool = None
     try:
-        conn = connect_db()
-        _ensure_manager_table(conn)
-        existing_row = _fetch_manager(conn, db_identity, id)
-        if existing_row is None:
+        conn, pool = _open_connection()
+        _ensure_manager_table_once(conn, _db_identity())
+        deleted = _delete_manager(conn, manager_id)
+        if not deleted:
             raise HTTPException(status_code=404, detail="Manager not found")
-
-        existing_tags = _json_array(existing_row[6])
-        merged_tags = _merge_tags(existing_tags, add_tags, remove_tags)
-        if merged_tags != existing_tags:
-            _update_manager(conn, id, ManagerUpdate.model_validate({"tags": merged_tags}))
-            invalidate_cache_prefix("managers")
-            row = _fetch_manager(conn, db_identity, id)
-        else:
-            row = existing_row
+        invalidate_cache_prefix("managers")
     except DB_ERROR_TYPES as exc:
         _raise_db_unavailable(exc)
     finally:
         if conn is not None:
-            conn.close()
-
-    if row is None:
-        raise HTTPException(status_code=404, detail="Manager not found")
-    return _to_manager_response(row)
+            _close_connection(conn, pool)
 
 
 @router.delete(
@@ -1576,19 +1696,7 @@ async def delete_manager(
     id: int = Path(..., ge=1, description="Manager identifier"),
 ):
     """Delete a manager by id."""
-    conn = None
-    try:
-        conn = connect_db()
-        _ensure_manager_table(conn)
-        deleted = _delete_manager(conn, id)
-        if not deleted:
-            raise HTTPException(status_code=404, detail="Manager not found")
-        invalidate_cache_prefix("managers")
-    except DB_ERROR_TYPES as exc:
-        _raise_db_unavailable(exc)
-    finally:
-        if conn is not None:
-            conn.close()
+    await asyncio.to_thread(_delete_manager_record, id)
     return Response(status_code=204)
 
 
@@ -13,6 +13,7 @@ from prefect.schedules import Cron
 from adapters import edgar
 from adapters.base import (
     DEFAULT_SQLITE_DB_PATH,
+    aclose_http_client,
     connect_db,
     get_placeholder,
     is_postgres,
@@ -357,7 +358,12 @@ async def fetch_all_managers(since: str) -> list[dict[str, object]]:
 
 @flow(name="activism-ingestion")
 async def activism_flow(since: str = "2024-01-01") -> list[dict[str, object]]:
-    rows = await fetch_all_managers.fn(since)
+    try:
+        rows = await fetch_all_managers.fn(since)
+    finally:
+        # The EDGAR adapter reused this loop's shared client; release its pool
+        # before the flow's event loop shuts down.
+        await aclose_http_client()
     log_outcome(
         logger,
         "Activism flow finished",
@@ -14,6 +14,7 @@ from prefect.schedules import Cron
 from adapters.base import (
     connect_db,
     get_placeholder,
+    init_usage_schema,
     is_postgres,
     is_sqlite,
     resolve_manager_id_column,
@@ -374,6 +375,8 @@ def daily_diff_flow(date: str | None = None) -> RunResult:
             conn.commit()
 
         _refresh_matview(conn)
+        # Creates monthly_usage on deployments without the migrations, then refreshes it.
+        init_usage_schema(conn)
 
         logger.info(
             "Daily diff flow finished",
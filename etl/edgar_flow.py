@@ -8,6 +8,7 @@ import json
 import logging
 import os
 import sqlite3
+from contextlib import aclosing
 from typing import Any, cast
 
 from prefect import flow, task
@@ -15,10 +16,12 @@ from prefect import flow, task
 import etl.ingest_flow as ingest_module
 from adapters.base import (
     DEFAULT_SQLITE_DB_PATH,
+    aclose_http_client,
     connect_db,
     get_adapter,
     get_placeholder,
     get_table_columns,
+    iter_downloads,
 )
 from adapters.openfigi import resolve_holding_identifiers
 from alerts.integration import build_new_filing_event, fire_alerts_for_event
@@ -382,55 +385,58 @@ async def fetch_and_store(cik: str, since: str):
         return []
 
     all_rows: list[dict[str, Any]] = []
-    for filing in filings:
-        raw = await ADAPTER.download(filing)
-        raw_bytes = raw.encode("utf-8") if isinstance(raw, str) else raw
-        raw_hash = hashlib.sha256(raw_bytes).hexdigest()[:16]
-        accession = str(filing.get("accession") or "unknown")
-        raw_key = f"raw/edgar/{raw_hash}_{accession}.xml"
-
-        S3.put_object(Bucket=BUCKET, Key=raw_key, Body=raw, ServerSideEncryption="AES256")
-        if isinstance(raw, str):
-            try:
-                store_document(
-                    raw,
-                    db_path=DB_PATH,
-                    manager_id=manager_id,
-                    kind="filing_text",
-                    filename=f"{accession}.xml",
-                )
-            except TypeError:
-                store_document(raw)
-
-        parsed_rows = await ADAPTER.parse(raw)
-        filing_id = _upsert_filing_legacy(
-            conn,
-            manager_id=manager_id,
-            filing_type=str(filing.get("form") or "13F-HR"),
-            filed_date=filing.get("filed"),
-            raw_key=raw_key,
-        )
-        _replace_holdings_for_filing(
-            conn,
-            filing_id=filing_id,
-            rows=parsed_rows,
-            manager_id=manager_id,
-            cik=cik,
-            accession=accession,
-            filed_date=filing.get("filed"),
-        )
-        conn.commit()
-        await fire_alerts_for_event(
-            conn,
-            build_new_filing_event(
-                filing_id=filing_id if filing_id > 0 else None,
+    # Prefetch a bounded window of bodies concurrently. Failures are raised in
+    # filing order so earlier filings are still stored, and cancel the rest.
+    window = getattr(ADAPTER, "DOWNLOAD_CONCURRENCY", 1)
+    async with aclosing(iter_downloads(ADAPTER.download, filings, window=window)) as downloads:
+        async for filing, raw in downloads:
+            raw_bytes = raw.encode("utf-8") if isinstance(raw, str) else raw
+            raw_hash = hashlib.sha256(raw_bytes).hexdigest()[:16]
+            accession = str(filing.get("accession") or "unknown")
+            raw_key = f"raw/edgar/{raw_hash}_{accession}.xml"
+
+            S3.put_object(Bucket=BUCKET, Key=raw_key, Body=raw, ServerSideEncryption="AES256")
+            if isinstance(raw, str):
+                try:
+                    store_document(
+                        raw,
+                        db_path=DB_PATH,
+                        manager_id=manager_id,
+                        kind="filing_text",
+                        filename=f"{accession}.xml",
+                    )
+                except TypeError:
+                    store_document(raw)
+
+            parsed_rows = await ADAPTER.parse(raw)
+            filing_id = _upsert_filing_legacy(
+                conn,
                 manager_id=manager_id,
                 filing_type=str(filing.get("form") or "13F-HR"),
                 filed_date=filing.get("filed"),
-                payload={"accession": accession, "source": "edgar"},
-            ),
-        )
-        all_rows.extend(parsed_rows)
+                raw_key=raw_key,
+            )
+            _replace_holdings_for_filing(
+                conn,
+                filing_id=filing_id,
+                rows=parsed_rows,
+                manager_id=manager_id,
+                cik=cik,
+                accession=accession,
+                filed_date=filing.get("filed"),
+            )
+            conn.commit()
+            await fire_alerts_for_event(
+                conn,
+                build_new_filing_event(
+                    filing_id=filing_id if filing_id > 0 else None,
+                    manager_id=manager_id,
+                    filing_type=str(filing.get("form") or "13F-HR"),
+                    filed_date=filing.get("filed"),
+                    payload={"accession": accession, "source": "edgar"},
+                ),
+            )
+            all_rows.extend(parsed_rows)
     conn.close()
     return all_rows
 
@@ -448,12 +454,17 @@ async def edgar_flow(cik_list: list[str] | None = None, since: str | None = None
         resolved_since = since or _latest_filed_date_for_cik(cik) or fallback_since
         return await fetch_and_store(cik, resolved_since)
 
-    all_rows = await ingest_callable(
-        jurisdiction="us",
-        identifiers=cik_list,
-        since=since,
-        fetcher=_fetch_with_watermark,
-    )
+    try:
+        all_rows = await ingest_callable(
+            jurisdiction="us",
+            identifiers=cik_list,
+            since=since,
+            fetcher=_fetch_with_watermark,
+        )
+    finally:
+        # Close this loop's shared adapter client even if ingest_flow is swapped
+        # out or fails before reaching its own cleanup.
+        await aclose_http_client()
     log_outcome(
         logger,
         "EDGAR flow finished",
@@ -7,6 +7,7 @@ import logging
 import os
 import sqlite3
 from collections.abc import Awaitable, Callable
+from contextlib import aclosing
 from pathlib import Path
 from typing import Any, cast
 
@@ -15,11 +16,13 @@ from prefect import flow, task
 
 from adapters.base import (
     DEFAULT_SQLITE_DB_PATH,
+    aclose_http_client,
     connect_db,
     get_adapter,
     get_placeholder,
     get_table_columns,
     is_sqlite,
+    iter_downloads,
 )
 from adapters.base import (
     manager_id_column as shared_manager_id_column,
@@ -660,57 +663,60 @@ async def fetch_and_store(
         row_count = 0
         max_results = _max_results_in_memory()
 
-        for filing in filings:
-            raw = await adapter.download(filing)
-            external_id = _filing_external_id(filing, jurisdiction)
-            ext = "xml" if isinstance(raw, str) else "pdf"
-            S3.put_object(
-                Bucket=BUCKET,
-                Key=f"raw/{external_id}.{ext}",
-                Body=raw,
-                ServerSideEncryption="AES256",
-            )
-            parsed_rows = await adapter.parse(raw)
-            if isinstance(raw, str):
-                store_document(raw)
-
-            manager_id = _lookup_manager_id(conn, jurisdiction, identifier)
-            if manager_id is None:
-                logger.warning(
-                    "Manager not found; skipping filing",
-                    extra={
-                        "jurisdiction": jurisdiction,
-                        "identifier": identifier,
-                        "external_id": external_id,
-                    },
+        # Prefetch a bounded window of documents (concurrently when the adapter
+        # supports it); failures surface in filing order and cancel the rest.
+        window = getattr(adapter, "DOWNLOAD_CONCURRENCY", 1)
+        async with aclosing(iter_downloads(adapter.download, filings, window=window)) as downloads:
+            async for filing, raw in downloads:
+                external_id = _filing_external_id(filing, jurisdiction)
+                ext = "xml" if isinstance(raw, str) else "pdf"
+                S3.put_object(
+                    Bucket=BUCKET,
+                    Key=f"raw/{external_id}.{ext}",
+                    Body=raw,
+                    ServerSideEncryption="AES256",
                 )
-                continue
-            filing_id = _insert_filing(
-                conn,
-                manager_id=manager_id,
-                source=jurisdiction,
-                external_id=external_id,
-                filed_date=_filing_date(filing, jurisdiction),
-                filing_type=_filing_type(parsed_rows, filing, jurisdiction),
-                parsed_rows=parsed_rows,
-            )
-
-            remaining_results = max(0, max_results - len(results))
-            # UK filings are metadata-driven (e.g., CS01/AR01) and should be
-            # stored as parsed payload on the filings row, not expanded holdings.
-            if jurisdiction != "uk" and _looks_like_holdings_rows(parsed_rows):
-                row_count += _replace_holdings_rows(
+                parsed_rows = await adapter.parse(raw)
+                if isinstance(raw, str):
+                    store_document(raw)
+
+                manager_id = _lookup_manager_id(conn, jurisdiction, identifier)
+                if manager_id is None:
+                    logger.warning(
+                        "Manager not found; skipping filing",
+                        extra={
+                            "jurisdiction": jurisdiction,
+                            "identifier": identifier,
+                            "external_id": external_id,
+                        },
+                    )
+                    continue
+                filing_id = _insert_filing(
                     conn,
-                    filing_id=filing_id,
                     manager_id=manager_id,
-                    identifier=identifier,
+                    source=jurisdiction,
                     external_id=external_id,
                     filed_date=_filing_date(filing, jurisdiction),
+                    filing_type=_filing_type(parsed_rows, filing, jurisdiction),
                     parsed_rows=parsed_rows,
-                    jurisdiction=jurisdiction,
                 )
-            if remaining_results:
-                results.extend(parsed_rows[:remaining_results])
+
+                remaining_results = max(0, max_results - len(results))
+                # UK filings are metadata-driven (e.g., CS01/AR01) and should be
+                # stored as parsed payload on the filings row, not expanded holdings.
+                if jurisdiction != "uk" and _looks_like_holdings_rows(parsed_rows):
+                    row_count += _replace_holdings_rows(
+                        conn,
+                        filing_id=filing_id,
+                        manager_id=manager_id,
+                        identifier=identifier,
+                        external_id=external_id,
+                        filed_date=_filing_date(filing, jurisdiction),
+                        parsed_rows=parsed_rows,
+                        jurisdiction=jurisdiction,
+                    )
+                if remaining_results:
+                    results.extend(parsed_rows[:remaining_results])
 
         conn.commit()
         logger.info(
@@ -760,26 +766,35 @@ async def ingest_flow(
         raise TypeError("fetcher must be callable")
 
     all_rows: list[dict[str, Any]] = []
-    for identifier in identifiers:
-        try:
-            rows = await resolved_fetcher(identifier, since)
-            all_rows.extend(rows)
-            log_outcome(
-                logger,
-                "Ingest flow completed",
-                has_data=bool(rows),
-                extra={"identifier": identifier, "rows": len(rows), "jurisdiction": jurisdiction},
-            )
-        except UserWarning:
-            logger.warning(
-                "No filings found",
-                extra={"identifier": identifier, "since": since, "jurisdiction": jurisdiction},
-            )
-        except Exception:
-            logger.exception(
-                "Ingest flow failed",
-                extra={"identifier": identifier, "since": since, "jurisdiction": jurisdiction},
-            )
+    try:
+        for identifier in identifiers:
+            try:
+                rows = await resolved_fetcher(identifier, since)
+                all_rows.extend(rows)
+                log_outcome(
+                    logger,
+                    "Ingest flow completed",
+                    has_data=bool(rows),
+                    extra={
+                        "identifier": identifier,
+                        "rows": len(rows),
+                        "jurisdiction": jurisdiction,
+                    },
+                )
+            except UserWarning:
+                logger.warning(
+                    "No filings found",
+                    extra={"identifier": identifier, "since": since, "jurisdiction": jurisdiction},
+                )
+            except Exception:
+                logger.exception(
+                    "Ingest flow failed",
+                    extra={"identifier": identifier, "since": since, "jurisdiction": jurisdiction},
+                )
+    finally:
+        # Every identifier reused the shared adapter client's connections; release
+        # them before the flow's event loop shuts down.
+        await aclose_http_client()
     (RAW_DIR / "parsed.json").write_text(json.dumps(all_rows))
     log_outcome(
         logger,
@@ -8,7 +8,8 @@ from typing import Any
 class StrictPostgresConn:
     """Fake DB connection that rejects SQLite-only SQL and ``?`` placeholders.
 
-    ``executed`` records ``(normalized_sql, params)`` for every call. The
+    ``executed`` records ``(normalized_sql, params)`` for every call and
+    ``copied`` records ``(normalized_copy_sql, rows)`` for cursor COPY blocks. The
     ``statements`` and ``params`` properties expose the same data in the shapes
     that pre-existing tests rely on.
     """
@@ -17,6 +18,7 @@ class StrictPostgresConn:
 
     def __init__(self) -> None:
         self.executed: list[tuple[str, Any]] = []
+        self.copied: list[tuple[str, list[Any]]] = []
         self.committed = False
         self.closed = False
 
@@ -42,3 +44,47 @@ class StrictPostgresConn:
 
     def close(self) -> None:
         self.closed = True
+
+    def cursor(self) -> StrictPostgresCursor:
+        return StrictPostgresCursor(self)
+
+
+class StrictPostgresCursor:
+    """Cursor double that records statements on its parent ``StrictPostgresConn``."""
+
+    def __init__(self, conn: StrictPostgresConn) -> None:
+        self.conn = conn
+
+    def __enter__(self) -> StrictPostgresCursor:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def execute(self, sql: str, params: Any = None) -> Any:
+        return self.conn.execute(sql, params)
+
+    def executemany(self, sql: str, params_seq: Any) -> None:
+        for params in params_seq:
+            self.conn.execute(sql, params)
+
+    def copy(self, sql: str) -> StrictPostgresCopy:
+        rows: list[Any] = []
+        self.conn.copied.append((" ".join(sql.split()), rows))
+        return StrictPostgresCopy(rows)
+
+
+class StrictPostgresCopy:
+    """``COPY ... FROM STDIN`` double collecting the rows written to it."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+
+    def __enter__(self) -> StrictPostgresCopy:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def write_row(self, row: Any) -> None:
+        self.rows.append(tuple(row))
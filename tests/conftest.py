@@ -9,7 +9,10 @@ from typing import Any, cast
 
 import pytest
 
+from adapters.base import close_usage_connections
+from api.chat import _clear_timeout_caches, _reset_db_health_cache
 from api.chat import app as chat_app
+from api.managers import _reset_manager_table_cache
 
 
 def _install_router_lifespan_shim() -> None:
@@ -42,6 +45,35 @@ def _install_router_lifespan_shim() -> None:
 _install_router_lifespan_shim()
 
 
+@pytest.fixture(autouse=True)
+def _reset_usage_connections(monkeypatch):
+    """Flush and drop usage-logging connections so tests never share DB handles.
+
+    Depends on ``monkeypatch`` so queued rows are written before patched env vars
+    and attributes are restored.
+    """
+    yield
+    close_usage_connections()
+
+
+@pytest.fixture(autouse=True)
+def _reset_manager_schema():
+    """Re-run managers DDL per test since each test points at a fresh database."""
+    _reset_manager_table_cache()
+    yield
+    _reset_manager_table_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_health_timeouts():
+    """Clear memoized health settings and results so each test pings afresh."""
+    _clear_timeout_caches()
+    _reset_db_health_cache()
+    yield
+    _clear_timeout_caches()
+    _reset_db_health_cache()
+
+
 def pytest_configure(config):
     """Register the nightly marker and configure auto-skip."""
     config.addinivalue_line(
@@ -26,7 +26,7 @@ class DummyClient:
 
 
 def _make_client(responder):
-    return lambda: DummyClient(responder)
+    return lambda **_kwargs: DummyClient(responder)
 
 
 def _seed_managers(db_path: Path) -> None:
@@ -292,3 +292,24 @@ async def test_fetch_activism_filings_stores_rows_and_raw_documents(monkeypatch,
         ("Activism Watch", "activism_event"),
     ]
     reset_logging()
+
+
+@pytest.mark.asyncio
+async def test_activism_flow_closes_shared_http_client_even_when_fetch_fails(monkeypatch):
+    import etl.activism_flow as activism_flow
+
+    closed = []
+
+    async def fake_aclose():
+        closed.append(True)
+
+    async def failing_fetch_all_managers(_since):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(activism_flow, "aclose_http_client", fake_aclose)
+    monkeypatch.setattr(activism_flow.fetch_all_managers, "fn", failing_fetch_all_managers)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await activism_flow.activism_flow.fn("2024-01-01")
+
+    assert closed == [True]
@@ -1,4 +1,8 @@
+import asyncio
 import sqlite3
+import sys
+import threading
+import types
 
 import pytest
 
@@ -136,6 +140,8 @@ def test_connect_db_postgres_retries_and_timeout(monkeypatch):
     monkeypatch.setattr(base, "psycopg", dummy_psycopg)
     monkeypatch.setenv("DB_URL", "postgres://user@localhost/db")
     monkeypatch.setattr(base.time, "sleep", lambda delay: sleep_calls.append(delay))
+    # Pin the jitter to its upper bound so the exponential ceiling is observable.
+    monkeypatch.setattr(base.random, "uniform", lambda _low, high: high)
 
     conn = connect_db(connect_timeout=5, retries=2, retry_delay=0.1)
     assert isinstance(conn, DummyConn)
@@ -144,6 +150,22 @@ def test_connect_db_postgres_retries_and_timeout(monkeypatch):
     assert dummy_psycopg.calls[0][1]["connect_timeout"] == 5
 
 
+def test_backoff_delay_uses_full_jitter_within_cap(monkeypatch):
+    bounds = []
+
+    def record_uniform(low, high):
+        bounds.append((low, high))
+        return high / 2
+
+    monkeypatch.setattr(base.random, "uniform", record_uniform)
+    monkeypatch.setenv("DB_BACKOFF_CAP", "1.5")
+
+    assert base.backoff_delay(0.5, 0) == 0.25
+    assert base.backoff_delay(0.5, 1) == 0.5
+    assert base.backoff_delay(0.5, 5) == 0.75
+    assert bounds == [(0.0, 0.5), (0.0, 1.0), (0.0, 1.5)]
+
+
 def test_connect_db_postgres_raises_after_retries(monkeypatch):
     class DummyPsycopg:
         class Error(Exception):
@@ -201,6 +223,70 @@ def test_get_adapter_unknown_module_raises():
         get_adapter("not_a_real_adapter")
 
 
+def test_get_adapter_returns_one_adapter_under_concurrent_first_calls(monkeypatch):
+    imported = []
+    barrier = threading.Barrier(8)
+
+    def fake_import(name):
+        imported.append(name)
+        return types.ModuleType(name)
+
+    monkeypatch.setattr(base, "ADAPTERS", {})
+    monkeypatch.setattr(base, "import_module", fake_import)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(get_adapter("concurrent_fake"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert set(imported) == {"adapters.concurrent_fake"}
+    assert len({id(module) for module in results}) == 1
+    assert results[0] is base.ADAPTERS["concurrent_fake"]
+
+
+def test_get_adapter_allows_nested_calls_during_import(monkeypatch):
+    def fake_import(name):
+        module = types.ModuleType(name)
+        if name == "adapters.outer_fake":
+            # An adapter that resolves another adapter while it is being imported.
+            module.inner = get_adapter("inner_fake")
+        return module
+
+    monkeypatch.setattr(base, "ADAPTERS", {})
+    monkeypatch.setattr(base, "import_module", fake_import)
+    results = []
+    thread = threading.Thread(target=lambda: results.append(get_adapter("outer_fake")))
+    thread.start()
+    thread.join(timeout=5.0)
+
+    assert not thread.is_alive()
+    assert results[0].inner is base.ADAPTERS["inner_fake"]
+
+
+def test_get_adapter_resolves_preloaded_module_through_import_module(monkeypatch):
+    module = types.ModuleType("adapters.preloaded_fake")
+    monkeypatch.setitem(sys.modules, "adapters.preloaded_fake", module)
+    monkeypatch.setattr(base, "ADAPTERS", {})
+    imported = []
+    real_import = base.import_module
+
+    def tracking_import(name):
+        imported.append(name)
+        return real_import(name)
+
+    monkeypatch.setattr(base, "import_module", tracking_import)
+
+    assert get_adapter("preloaded_fake") is module
+    assert imported == ["adapters.preloaded_fake"]
+    assert base.ADAPTERS["preloaded_fake"] is module
+
+
 @pytest.mark.asyncio
 async def test_tracked_call_writes_sqlite_usage(tmp_path):
     db_path = tmp_path / "usage.db"
@@ -211,6 +297,7 @@ async def test_tracked_call_writes_sqlite_usage(tmp_path):
 
     async with base.tracked_call("uk", "/filings", db_path=str(db_path)) as log:
         log(DummyResponse())
+    base.flush_api_usage()
 
     conn = sqlite3.connect(str(db_path))
     try:
@@ -237,6 +324,7 @@ async def test_tracked_call_postgres_uses_strict_backend_safe_sql(monkeypatch):
 
     async with base.tracked_call("edgar", "endpoint") as log:
         log(DummyResponse())
+    base.flush_api_usage()
 
     insert_sql = next(sql for sql in dummy_conn.statements if sql.startswith("INSERT"))
     assert "VALUES (%s,%s,%s,%s,%s,%s)" in insert_sql
@@ -244,6 +332,177 @@ async def test_tracked_call_postgres_uses_strict_backend_safe_sql(monkeypatch):
     assert dummy_conn.params[-1][4] >= 0
     assert dummy_conn.params[-1][5] == 0.0
     assert "SELECT to_regclass('api_usage')" in dummy_conn.statements
-    assert any("CREATE MATERIALIZED VIEW monthly_usage AS" in sql for sql in dummy_conn.statements)
+    assert not any("MATERIALIZED VIEW" in sql for sql in dummy_conn.statements)
     assert dummy_conn.committed is True
     assert dummy_conn.closed is True
+
+
+def test_init_usage_schema_creates_and_refreshes_postgres_rollup():
+    conn = StrictPostgresConn()
+
+    base.init_usage_schema(conn)
+
+    statements = conn.statements
+    create_view = next(
+        i for i, sql in enumerate(statements) if "CREATE MATERIALIZED VIEW IF NOT EXISTS" in sql
+    )
+    refresh = statements.index("REFRESH MATERIALIZED VIEW CONCURRENTLY monthly_usage")
+    assert any(sql.startswith("CREATE TABLE IF NOT EXISTS api_usage") for sql in statements)
+    assert (
+        "CREATE UNIQUE INDEX IF NOT EXISTS monthly_usage_idx ON monthly_usage (month, source)"
+        in statements
+    )
+    assert create_view < refresh
+
+
+def test_refresh_usage_view_skips_sqlite_and_missing_view():
+    sqlite_conn = sqlite3.connect(":memory:")
+    try:
+        base.refresh_usage_view(sqlite_conn)
+    finally:
+        sqlite_conn.close()
+
+    class MissingViewConn(StrictPostgresConn):
+        def execute(self, sql, params=None):
+            super().execute(sql, params)
+            raise RuntimeError('relation "monthly_usage" does not exist')
+
+    base.refresh_usage_view(MissingViewConn())
+
+
+def test_get_http_client_is_shared_per_event_loop():
+    async def _two_lookups():
+        return base.get_http_client(), base.get_http_client()
+
+    first, again = asyncio.run(_two_lookups())
+    second, _ = asyncio.run(_two_lookups())
+
+    assert first is again
+    assert second is not first
+    # The client of the finished loop is dropped once another loop asks for one.
+    assert first not in base._HTTP_CLIENTS.values()
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_configures_pool_timeout_and_http2(monkeypatch):
+    created = []
+
+    class RecordingClient:
+        is_closed = False
+
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+
+    monkeypatch.setattr(base.httpx, "AsyncClient", RecordingClient)
+    monkeypatch.setattr(base, "_HTTP2_AVAILABLE", True)
+    monkeypatch.setattr(base, "_HTTP_CLIENTS", {})
+
+    base.get_http_client()
+
+    assert created == [{"http2": True, "limits": base._HTTP_LIMITS, "timeout": base._HTTP_TIMEOUT}]
+
+
+@pytest.mark.asyncio
+async def test_aclose_http_client_closes_and_replaces_loop_client():
+    client = base.get_http_client()
+
+    await base.aclose_http_client()
+
+    assert client.is_closed
+    replacement = base.get_http_client()
+    assert replacement is not client
+    await base.aclose_http_client()
+
+
+@pytest.mark.asyncio
+async def test_iter_downloads_bounds_prefetch_and_keeps_order():
+    in_flight = 0
+    peak = 0
+
+    async def _download(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (5 - item))
+        return item * 10
+
+    seen = []
+    async for item, result in base.iter_downloads(_download, range(5), window=2):
+        # Finished-but-unconsumed downloads count against the window too.
+        in_flight -= 1
+        seen.append((item, result))
+
+    assert seen == [(0, 0), (1, 10), (2, 20), (3, 30), (4, 40)]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_downloads_raises_in_order_and_cancels_pending():
+    cancelled = []
+
+    async def _download(item):
+        if item == 0:
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+        return item
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _item, _result in base.iter_downloads(_download, range(10), window=3):
+            pass
+
+    # Only the window was ever started, and nothing is left running.
+    assert cancelled == [1, 2]
+
+
+def test_db_pool_timeout_matches_connect_retry_budget(monkeypatch):
+    monkeypatch.delenv("DB_POOL_TIMEOUT", raising=False)
+    monkeypatch.setenv("DB_CONNECT_RETRIES", "3")
+    monkeypatch.setenv("DB_CONNECT_RETRY_DELAY", "0.5")
+    monkeypatch.delenv("DB_BACKOFF_CAP", raising=False)
+    # Worst-case backoff before connect_db gives up: 0.5 + 1 + 2 seconds.
+    assert base.db_pool_timeout() == 3.5
+
+    monkeypatch.setenv("DB_CONNECT_RETRIES", "0")
+    assert base.db_pool_timeout() == 1.0
+
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "2.5")
+    assert base.db_pool_timeout() == 2.5
+
+
+def test_get_pool_is_none_for_sqlite(monkeypatch):
+    monkeypatch.delenv("DB_URL", raising=False)
+    assert base.get_pool() is None
+
+
+def test_get_pool_shares_one_autocommit_pool_per_url(monkeypatch):
+    created = []
+    closed = []
+
+    class FakePool:
+        def __init__(self, url, **kwargs):
+            created.append((url, kwargs))
+
+        def close(self):
+            closed.append(self)
+
+    monkeypatch.setenv("DB_URL", "postgresql://user@localhost/db")
+    monkeypatch.setenv("DB_POOL_MAX", "3")
+    monkeypatch.setattr(base, "ConnectionPool", FakePool)
+    monkeypatch.setattr(base, "_DB_POOLS", {})
+
+    pool = base.get_pool()
+    assert base.get_pool() is pool
+    assert len(created) == 1
+    url, kwargs = created[0]
+    assert url == "postgresql://user@localhost/db"
+    assert kwargs["min_size"] == 1
+    assert kwargs["max_size"] == 3
+    assert kwargs["kwargs"] == {"autocommit": True}
+
+    base.close_db_pools()
+    assert closed == [pool]
+    assert base.get_pool() is not pool
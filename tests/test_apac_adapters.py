@@ -21,6 +21,9 @@ async def test_mas_lists_metadata_records(monkeypatch):
     }
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -30,7 +33,7 @@ async def test_mas_lists_metadata_records(monkeypatch):
         async def get(self, *args, **kwargs):
             return httpx.Response(200, request=httpx.Request("GET", "x"), json=payload)
 
-    monkeypatch.setattr(mas.httpx, "AsyncClient", DummyClient)
+    monkeypatch.setattr(httpx, "AsyncClient", DummyClient)
     monkeypatch.setattr(mas, "tracked_call", dummy_tracked_call)
 
     records = await mas.list_new_filings("MAS-123", "2024-01-01")
@@ -78,6 +81,9 @@ async def test_asic_lists_register_snapshot(monkeypatch):
     requests: list[str] = []
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -98,7 +104,7 @@ async def test_asic_lists_register_snapshot(monkeypatch):
                 text="ACN,Name\n123,Example Pty Ltd\n",
             )
 
-    monkeypatch.setattr(asic.httpx, "AsyncClient", DummyClient)
+    monkeypatch.setattr(httpx, "AsyncClient", DummyClient)
     monkeypatch.setattr(asic, "tracked_call", dummy_tracked_call)
 
     records = await asic.list_new_filings("ASIC-123", "2024-01-01")
@@ -5,10 +5,12 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+import httpx
 import pytest
 
 from api import chat
 from api.chat import health_app, health_live, health_livez, healthz
+from api.health_interceptor import LIVENESS_PATHS, HealthCheckInterceptor
 
 
 def _configure_health_env(monkeypatch, tmp_path):
@@ -20,11 +22,6 @@ def _configure_health_env(monkeypatch, tmp_path):
     monkeypatch.setattr(chat, "_ping_minio", lambda _timeout_seconds: None)
 
 
-def _shutdown_health_executor():
-    # Avoid lingering worker threads after async health checks.
-    chat._HEALTH_EXECUTOR.shutdown(wait=False, cancel_futures=True)
-
-
 class _FakeClock:
     def __init__(self) -> None:
         self._lock = threading.Lock()
@@ -34,6 +31,10 @@ class _FakeClock:
         with self._lock:
             return self.now
 
+    def perf_counter_ns(self) -> int:
+        with self._lock:
+            return round(self.now * 1_000_000_000)
+
     def monotonic(self) -> float:
         with self._lock:
             return self.now
@@ -52,34 +53,40 @@ def _install_health_clock(monkeypatch, fake_clock: _FakeClock) -> chat.HealthClo
         perf_counter=fake_clock.perf_counter,
         monotonic=fake_clock.monotonic,
         sleep=fake_clock.sleep,
+        perf_counter_ns=fake_clock.perf_counter_ns,
     )
     monkeypatch.setattr(chat, "HEALTH_CLOCK", clock)
     monkeypatch.setattr(chat, "APP_START_TIME", clock.monotonic())
     return clock
 
 
+_RUN_DEPENDENCY_CHECK = chat._run_dependency_check
+_CHECK_DEPENDENCY = chat._check_dependency
+
+
 def _install_timeout_wait(monkeypatch, fake_clock: _FakeClock) -> None:
-    async def _fake_wait(fs, timeout=None, return_when=chat.asyncio.ALL_COMPLETED):
-        if timeout:
-            fake_clock.advance(timeout)
-        return set(), set(fs)
+    async def _hanging_check(*_args, **_kwargs):
+        # Never finish so the summary budget expires and cancels every ping.
+        await chat.asyncio.Event().wait()
 
-    monkeypatch.setattr(chat.asyncio, "wait", _fake_wait)
+    monkeypatch.setattr(chat, "_check_dependency", _hanging_check)
 
 
 def _install_immediate_wait(monkeypatch) -> None:
-    async def _fake_wait(fs, timeout=None, return_when=chat.asyncio.ALL_COMPLETED):
-        await chat.asyncio.gather(*fs, return_exceptions=True)
-        return set(fs), set()
+    monkeypatch.setattr(chat, "_check_dependency", _CHECK_DEPENDENCY)
 
-    monkeypatch.setattr(chat.asyncio, "wait", _fake_wait)
+
+async def _settle_cancelled_pings() -> None:
+    # Abandoned pings finish cancelling, and count against their breaker, a few
+    # loop iterations after the summary returns.
+    for _ in range(3):
+        await chat.asyncio.sleep(0)
 
 
 @pytest.mark.asyncio
 async def test_health_app_ok(tmp_path, monkeypatch):
     _configure_health_env(monkeypatch, tmp_path)
     resp = await health_app()
-    _shutdown_health_executor()
     payload = json.loads(resp.body)
     assert resp.status_code == 200
     assert payload["healthy"] is True
@@ -103,30 +110,113 @@ async def test_health_app_uptime_uses_injected_clock(tmp_path, monkeypatch):
     monkeypatch.setattr(chat, "_run_health_summary_checks", _fast_checks)
     fake_clock.advance(12.3)
     resp = await health_app()
-    _shutdown_health_executor()
     payload = json.loads(resp.body)
     assert payload["uptime_s"] == 12
 
 
-def test_health_live_ok():
-    payload = health_live()
+@pytest.mark.asyncio
+async def test_health_live_ok():
+    payload = await health_live()
     assert payload["healthy"] is True
     assert payload["uptime_s"] >= 0
 
 
-def test_healthz_ok():
+@pytest.mark.asyncio
+async def test_healthz_ok():
     # Probe aliases should mirror the base liveness payload.
-    payload = healthz()
+    payload = await healthz()
     assert payload["healthy"] is True
     assert payload["uptime_s"] >= 0
 
 
-def test_health_livez_ok():
-    payload = health_livez()
+@pytest.mark.asyncio
+async def test_health_livez_ok():
+    payload = await health_livez()
     assert payload["healthy"] is True
     assert payload["uptime_s"] >= 0
 
 
+def test_health_payload_is_rebuilt_only_when_uptime_changes(monkeypatch):
+    fake_clock = _FakeClock()
+    _install_health_clock(monkeypatch, fake_clock)
+    fake_clock.advance(5.2)
+    first = chat._health_payload()
+    fake_clock.advance(0.5)
+    assert chat._health_payload() is first
+
+    fake_clock.advance(0.5)
+    assert chat._health_payload() == {"healthy": True, "uptime_s": 6}
+    assert first == {"healthy": True, "uptime_s": 5}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", sorted(LIVENESS_PATHS))
+async def test_liveness_probes_are_answered_before_routing(monkeypatch, path):
+    fake_clock = _FakeClock()
+    _install_health_clock(monkeypatch, fake_clock)
+    fake_clock.advance(42.9)
+    transport = httpx.ASGITransport(app=chat.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        ok = await client.get(path)
+        rejected = await client.post(path)
+
+    assert ok.status_code == 200
+    assert ok.content == b'{"healthy":true,"uptime_s":42}'
+    assert ok.headers["content-type"] == "application/json"
+    assert rejected.status_code == 405
+    assert rejected.headers["allow"] == "GET"
+    assert rejected.json() == {"detail": "Method Not Allowed"}
+
+
+@pytest.mark.asyncio
+async def test_health_interceptor_passes_other_requests_through():
+    seen = []
+
+    async def downstream(scope, receive, send):
+        seen.append(scope["path"])
+
+    interceptor = HealthCheckInterceptor(downstream, uptime_seconds=lambda: 0)
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    await interceptor({"type": "http", "path": "/health", "method": "GET"}, None, send)
+    await interceptor({"type": "websocket", "path": "/healthz"}, None, send)
+    await interceptor({"type": "http", "path": "/healthz", "method": "GET"}, None, send)
+
+    assert seen == ["/health", "/healthz"]
+    assert [message["type"] for message in sent] == ["http.response.start", "http.response.body"]
+
+
+@pytest.mark.asyncio
+async def test_health_interceptor_rerenders_only_when_uptime_changes():
+    uptime = [7]
+
+    async def downstream(scope, receive, send):
+        raise AssertionError("liveness probes should not reach the app")
+
+    interceptor = HealthCheckInterceptor(downstream, uptime_seconds=lambda: uptime[0])
+    bodies = []
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            bodies.append(message["body"])
+
+    scope = {"type": "http", "path": "/livez", "method": "GET"}
+    await interceptor(scope, None, send)
+    await interceptor(scope, None, send)
+    uptime[0] = 123
+    await interceptor(scope, None, send)
+
+    assert bodies == [
+        b'{"healthy":true,"uptime_s":7}',
+        b'{"healthy":true,"uptime_s":7}',
+        b'{"healthy":true,"uptime_s":123}',
+    ]
+    assert bodies[0] is bodies[1]
+
+
 @pytest.mark.asyncio
 async def test_health_app_reports_failed_dependencies(tmp_path, monkeypatch):
     _configure_health_env(monkeypatch, tmp_path)
@@ -139,7 +229,6 @@ async def test_health_app_reports_failed_dependencies(tmp_path, monkeypatch):
 
     monkeypatch.setattr(chat, "_ping_minio", _raise_minio)
     resp = await health_app()
-    _shutdown_health_executor()
     payload = json.loads(resp.body)
     assert resp.status_code == 503
     assert payload["failed_checks"]["minio"] == "minio down"
@@ -165,7 +254,6 @@ async def test_health_app_responds_within_budget(tmp_path, monkeypatch, budget_s
 
     start = health_clock.perf_counter()
     resp = await health_app()
-    _shutdown_health_executor()
     elapsed = health_clock.perf_counter() - start
     assert resp.status_code == 200
     assert elapsed < 0.2
@@ -189,7 +277,6 @@ async def test_health_app_performance_with_mocked_timing(tmp_path, monkeypatch):
 
     start = health_clock.perf_counter()
     resp = await health_app()
-    _shutdown_health_executor()
     elapsed = health_clock.perf_counter() - start
     assert resp.status_code == 200
     assert elapsed < 0.2
@@ -215,13 +302,8 @@ async def test_health_app_parallel_dependency_checks(tmp_path, monkeypatch):
     monkeypatch.setattr(chat, "_ping_db", _slow_db)
     monkeypatch.setattr(chat, "_ping_minio", _slow_minio)
     monkeypatch.setattr(chat, "_ping_redis", _slow_redis)
-    # Warm executor threads so timing reflects steady-state performance.
-    executor = chat.get_health_executor()
-    for _ in range(3):
-        executor.submit(lambda: None).result()
     start = health_clock.perf_counter()
     resp = await health_app()
-    _shutdown_health_executor()
     elapsed = health_clock.perf_counter() - start
     assert resp.status_code == 200
     assert elapsed < 0.2
@@ -241,7 +323,6 @@ async def test_health_app_timeout_budget_caps_total_time(tmp_path, monkeypatch):
     monkeypatch.setattr(chat, "_ping_redis", lambda _redis_url, _timeout_seconds: None)
     start = health_clock.perf_counter()
     resp = await health_app()
-    _shutdown_health_executor()
     elapsed = health_clock.perf_counter() - start
     payload = json.loads(resp.body)
     assert resp.status_code == 503
@@ -260,19 +341,18 @@ async def test_health_app_wait_timeout_respects_budget(tmp_path, monkeypatch):
     monkeypatch.setattr(chat, "_ping_minio", lambda _timeout_seconds: None)
     monkeypatch.setattr(chat, "_ping_redis", lambda _redis_url, _timeout_seconds: None)
 
-    captured = {}
-    original_wait = chat.asyncio.wait
+    captured = []
+    original_timeout = chat.asyncio.timeout
 
-    async def _capture_wait(*args, **kwargs):
-        # Capture the timeout passed to asyncio.wait without changing behavior.
-        captured["timeout"] = kwargs.get("timeout")
-        return await original_wait(*args, **kwargs)
+    def _capture_timeout(delay):
+        # Capture each deadline without changing behavior; the summary's comes first.
+        captured.append(delay)
+        return original_timeout(delay)
 
-    monkeypatch.setattr(chat.asyncio, "wait", _capture_wait)
+    monkeypatch.setattr(chat.asyncio, "timeout", _capture_timeout)
     resp = await health_app()
-    _shutdown_health_executor()
     assert resp.status_code == 200
-    assert captured["timeout"] == pytest.approx(0.1)
+    assert captured[0] == pytest.approx(0.1)
 
 
 @pytest.mark.asyncio
@@ -289,6 +369,7 @@ async def test_health_app_circuit_breaker_opens_after_summary_timeouts(tmp_path,
     for _ in range(3):
         resp = await health_app()
         assert resp.status_code == 503
+        await _settle_cancelled_pings()
 
     _install_immediate_wait(monkeypatch)
 
@@ -298,12 +379,140 @@ async def test_health_app_circuit_breaker_opens_after_summary_timeouts(tmp_path,
     monkeypatch.setattr(chat, "_ping_minio", _unexpected_minio)
     resp = await health_app()
     payload = json.loads(resp.body)
-    _shutdown_health_executor()
     assert resp.status_code == 503
     assert payload["failed_checks"]["minio"] == "circuit_open"
     assert payload["components"]["minio"]["circuit_open"] is True
 
 
+@pytest.mark.asyncio
+async def test_summary_timeouts_count_against_each_enabled_breaker(tmp_path, monkeypatch):
+    _configure_health_env(monkeypatch, tmp_path)
+    fake_clock = _FakeClock()
+    _install_health_clock(monkeypatch, fake_clock)
+    minio = chat.CircuitBreaker(failure_threshold=1, reset_timeout_s=60.0)
+    redis = chat.CircuitBreaker(failure_threshold=1, reset_timeout_s=60.0)
+    monkeypatch.setattr(chat, "_MINIO_CIRCUIT", minio)
+    monkeypatch.setattr(chat, "_REDIS_CIRCUIT", redis)
+    _install_timeout_wait(monkeypatch, fake_clock)
+
+    results = await chat._run_health_summary_checks(0.05, 0.05, 0.05, 0.05, None)
+    await _settle_cancelled_pings()
+    assert results["minio"][1] == "timeout"
+    # Disabled Redis is reported as skipped rather than timed out.
+    assert results["redis"] == ({"healthy": True, "latency_ms": 0, "enabled": False}, None)
+    assert minio.is_open() is True
+    assert redis.is_open() is False
+
+    await chat._run_health_summary_checks(0.05, 0.05, 0.05, 0.05, "redis://localhost:6379/0")
+    await _settle_cancelled_pings()
+    assert redis.is_open() is True
+
+
+@pytest.mark.asyncio
+async def test_summary_timeout_keeps_results_of_finished_checks(tmp_path, monkeypatch):
+    _configure_health_env(monkeypatch, tmp_path)
+    redis = chat.CircuitBreaker(failure_threshold=1, reset_timeout_s=60.0)
+    monkeypatch.setattr(chat, "_REDIS_CIRCUIT", redis)
+
+    async def _redis_hangs(func, *args, **kwargs):
+        if func is chat._ping_redis:
+            await chat.asyncio.Event().wait()
+        return await _CHECK_DEPENDENCY(func, *args, **kwargs)
+
+    monkeypatch.setattr(chat, "_check_dependency", _redis_hangs)
+    results = await chat._run_health_summary_checks(
+        0.05, 0.05, 0.05, 0.05, "redis://localhost:6379/0"
+    )
+    await _settle_cancelled_pings()
+    assert results["database"][0]["healthy"] is True
+    assert results["database"][1] is None
+    assert results["minio"][0]["healthy"] is True
+    assert results["redis"][0]["enabled"] is True
+    assert results["redis"][1] == "timeout"
+    assert redis.is_open() is True
+
+
+@pytest.mark.asyncio
+async def test_concurrent_dependency_checks_share_one_ping(monkeypatch):
+    breaker = chat.CircuitBreaker(failure_threshold=3, reset_timeout_s=60.0)
+    release = threading.Event()
+    calls = []
+
+    def _slow_minio(_timeout_seconds):
+        calls.append("ping")
+        release.wait(1.0)
+
+    checks = [
+        chat.asyncio.create_task(
+            chat._run_dependency_check(_slow_minio, 1.0, 1.0, circuit_breaker=breaker)
+        )
+        for _ in range(5)
+    ]
+    await chat.asyncio.sleep(0.05)
+    # One waiter giving up must not cancel the ping the others are waiting on.
+    checks[0].cancel()
+    release.set()
+    results = await chat.asyncio.gather(*checks[1:])
+
+    assert calls == ["ping"]
+    assert all(reason is None for _payload, reason in results)
+    assert chat._INFLIGHT_CHECKS == {}
+
+    await chat._run_dependency_check(_slow_minio, 1.0, 1.0, circuit_breaker=breaker)
+    assert calls == ["ping", "ping"]
+
+
+@pytest.mark.asyncio
+async def test_abandoned_shared_ping_counts_one_breaker_failure(monkeypatch):
+    breaker = chat.CircuitBreaker(failure_threshold=3, reset_timeout_s=60.0)
+
+    async def _hanging_check(*_args, **_kwargs):
+        await chat.asyncio.Event().wait()
+
+    monkeypatch.setattr(chat, "_check_dependency", _hanging_check)
+    waiters = [
+        chat.asyncio.create_task(
+            chat._run_dependency_check(chat._ping_minio, 1.0, 1.0, circuit_breaker=breaker)
+        )
+        for _ in range(3)
+    ]
+    await chat.asyncio.sleep(0)
+    for waiter in waiters:
+        waiter.cancel()
+    await chat.asyncio.gather(*waiters, return_exceptions=True)
+    await _settle_cancelled_pings()
+
+    # Three callers gave up on one ping: that is one failure, not three.
+    assert breaker._consecutive_failures == 1
+    assert breaker.is_open() is False
+
+
+@pytest.mark.asyncio
+async def test_dependency_check_does_not_join_a_cancelled_ping(monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def _minio(_timeout_seconds):
+        calls.append("ping")
+        if len(calls) == 1:
+            release.wait(1.0)
+
+    abandoned = chat.asyncio.create_task(chat._run_dependency_check(_minio, 1.0, 1.0))
+    await chat.asyncio.sleep(0.05)
+    # The only waiter gives up, which cancels the shared ping.
+    abandoned.cancel()
+    await chat.asyncio.sleep(0)
+
+    try:
+        payload, reason = await chat._run_dependency_check(_minio, 1.0, 1.0)
+    finally:
+        release.set()
+
+    assert reason is None
+    assert payload["healthy"] is True
+    assert calls == ["ping", "ping"]
+
+
 @pytest.mark.asyncio
 async def test_circuit_breaker_opens_after_three_failures(monkeypatch):
     monkeypatch.setattr(chat, "_HEALTH_RETRY_BACKOFFS", ())
@@ -339,7 +548,6 @@ async def test_circuit_breaker_opens_after_three_failures(monkeypatch):
     )
     assert payload["circuit_open"] is True
     assert reason == "circuit_open"
-    _shutdown_health_executor()
 
 
 @pytest.mark.asyncio
@@ -388,7 +596,6 @@ async def test_circuit_breaker_opens_after_three_timeouts(monkeypatch):
     )
     assert payload["circuit_open"] is True
     assert reason == "circuit_open"
-    _shutdown_health_executor()
 
 
 def test_circuit_breaker_resets_after_timeout(monkeypatch):
@@ -423,6 +630,26 @@ def test_circuit_breaker_allows_calls_after_reset(monkeypatch):
     assert circuit.is_open() is True
 
 
+def test_circuit_breaker_closed_fast_paths_skip_the_lock():
+    class _NoLock:
+        def __enter__(self):
+            raise AssertionError("lock taken on the closed fast path")
+
+        def __exit__(self, *exc_info):
+            return False
+
+    circuit = chat.CircuitBreaker(failure_threshold=2, reset_timeout_s=5.0)
+    real_lock = circuit._lock
+    circuit._lock = _NoLock()
+    assert circuit.is_open() is False
+    circuit.record_success()
+
+    circuit._lock = real_lock
+    circuit.record_failure()
+    circuit.record_success()
+    assert circuit._consecutive_failures == 0
+
+
 @pytest.mark.asyncio
 async def test_circuit_breaker_allows_dependency_after_cooldown(monkeypatch):
     fake_clock = _FakeClock()
@@ -455,7 +682,6 @@ async def test_circuit_breaker_allows_dependency_after_cooldown(monkeypatch):
     assert payload["healthy"] is True
     assert reason is None
     assert calls["count"] == 1
-    _shutdown_health_executor()
 
 
 @pytest.mark.asyncio
@@ -483,7 +709,6 @@ async def test_health_app_reports_circuit_breaker_open(tmp_path, monkeypatch):
 
     monkeypatch.setattr(chat, "_ping_minio", _unexpected_minio)
     resp = await health_app()
-    _shutdown_health_executor()
     payload = json.loads(resp.body)
     assert resp.status_code == 503
     assert payload["failed_checks"]["minio"] == "circuit_open"
@@ -18,6 +18,9 @@ async def test_list_new_filings_returns_items(monkeypatch):
         yield _log
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -27,7 +30,7 @@ async def test_list_new_filings_returns_items(monkeypatch):
         async def get(self, *args, **kwargs):
             return httpx.Response(200, request=httpx.Request("GET", "x"), json=payload)
 
-    monkeypatch.setattr(canada.httpx, "AsyncClient", DummyClient)
+    monkeypatch.setattr(httpx, "AsyncClient", DummyClient)
     monkeypatch.setattr(canada, "tracked_call", dummy_tracked_call)
 
     # Ensure adapter maps JSON payloads into a list of filing items.
@@ -46,6 +49,9 @@ async def test_download_returns_bytes(monkeypatch):
         yield _log
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -55,7 +61,7 @@ async def test_download_returns_bytes(monkeypatch):
         async def get(self, *args, **kwargs):
             return httpx.Response(200, request=httpx.Request("GET", "x"), content=pdf_bytes)
 
-    monkeypatch.setattr(canada.httpx, "AsyncClient", DummyClient)
+    monkeypatch.setattr(httpx, "AsyncClient", DummyClient)
     monkeypatch.setattr(canada, "tracked_call", dummy_tracked_call)
 
     assert await canada.download({"id": "filing-1"}) == pdf_bytes
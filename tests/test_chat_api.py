@@ -1,6 +1,8 @@
 import asyncio
+import json
 import sqlite3
 import sys
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, cast
@@ -19,8 +21,44 @@ def test_chat_endpoint(tmp_path, monkeypatch):
     monkeypatch.setenv("DB_PATH", str(db_path))
     store_document("hello world", str(db_path))
     # Call the handler directly to avoid ASGI threadpool issues in tests.
-    payload = chat_api_module.chat(q="hello")
+    response = asyncio.run(chat_api_module.chat(q="hello"))
+    payload = json.loads(response.body)
     assert "hello world" in payload["answer"]
+    # The payload skips response_model validation, so it must already match ChatResponse.
+    assert payload == chat_api_module.ChatResponse(**payload).model_dump()
+    assert list(payload) == list(chat_api_module.ChatResponse.model_fields)
+
+
+def test_search_documents_is_resolved_once():
+    import embeddings
+
+    assert chat_api_module._get_search_documents() is embeddings.search_documents
+    assert chat_api_module._get_search_documents.cache_info().currsize == 1
+
+
+def test_chat_resolves_search_import_off_the_event_loop(monkeypatch):
+    resolved_on: list[int] = []
+
+    def _recording_getter():
+        resolved_on.append(threading.get_ident())
+        return lambda _q: []
+
+    monkeypatch.setattr(chat_api_module, "_get_search_documents", _recording_getter)
+
+    response = asyncio.run(chat_api_module.chat(q="hello"))
+
+    assert json.loads(response.body)["answer"] == "No documents found."
+    assert len(resolved_on) == 1
+    assert resolved_on[0] != threading.get_ident()
+
+
+def test_validation_error_response_encodes_error_list_once():
+    errors = [{"field": "q", "message": "Field required"}]
+    response = chat_api_module.ValidationErrorResponse(status_code=400, content=errors)
+    expected = chat_api_module.JSONResponse(content={"errors": errors, "error": errors})
+
+    assert response.body == expected.body
+    assert json.loads(response.body) == {"errors": errors, "error": errors}
 
 
 def test_build_chat_client_info_prefers_llm_client_module(monkeypatch):
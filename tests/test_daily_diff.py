@@ -326,5 +326,13 @@ def test_daily_diff_flow_refreshes_matview_on_postgres(monkeypatch):
         "ON mv_daily_report (report_date, manager_id, cusip, delta_type)"
     ) in executed_sql
     assert "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_report" in executed_sql
+    create_usage_view = next(
+        i
+        for i, sql in enumerate(executed_sql)
+        if "CREATE MATERIALIZED VIEW IF NOT EXISTS monthly_usage" in sql
+    )
+    assert create_usage_view < executed_sql.index(
+        "REFRESH MATERIALIZED VIEW CONCURRENTLY monthly_usage"
+    )
     assert all("AUTOINCREMENT" not in sql for sql in executed_sql)
     assert all("CREATE TABLE IF NOT EXISTS daily_diffs" not in sql for sql in executed_sql)
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import sys
+import time
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
@@ -78,6 +79,74 @@ def test_health_db_timeout_cap(monkeypatch):
     assert _db_timeout_seconds() == 5.0
 
 
+def test_health_timeouts_are_read_once_until_cleared(monkeypatch):
+    from api.chat import _clear_timeout_caches, _db_timeout_seconds
+
+    monkeypatch.setenv("DB_HEALTH_TIMEOUT_S", "1.5")
+    assert _db_timeout_seconds() == 1.5
+
+    monkeypatch.setenv("DB_HEALTH_TIMEOUT_S", "2.5")
+    assert _db_timeout_seconds() == 1.5
+
+    _clear_timeout_caches()
+    assert _db_timeout_seconds() == 2.5
+
+
+def test_health_db_result_is_reused_within_ttl(monkeypatch):
+    from api import chat
+
+    now = [100.0]
+    monkeypatch.setattr(
+        chat,
+        "HEALTH_CLOCK",
+        chat.HealthClock(time.perf_counter, lambda: now[0], chat.HEALTH_CLOCK.sleep),
+    )
+    monkeypatch.setenv("DB_HEALTH_TTL_S", "2")
+    pings = []
+    monkeypatch.setattr(chat, "_ping_db", lambda _timeout_seconds: pings.append("ping"))
+
+    async def _probe_burst():
+        responses = await asyncio.gather(*(health_db() for _ in range(5)))
+        ready = await chat.health_ready()
+        return responses, ready
+
+    responses, ready = asyncio.run(_probe_burst())
+    assert pings == ["ping"]
+    assert {resp.status_code for resp in responses} == {200}
+    assert ready.status_code == 200
+
+    now[0] += 2.5
+    asyncio.run(health_db())
+    assert pings == ["ping", "ping"]
+
+
+def test_ping_db_borrows_pooled_connection(monkeypatch):
+    from contextlib import nullcontext
+
+    from api import chat
+    from tests._pg_fakes import StrictPostgresConn
+
+    conn = StrictPostgresConn()
+    waits = []
+
+    class FakePool:
+        def connection(self, timeout=None):
+            waits.append(timeout)
+            return nullcontext(conn)
+
+    def _no_connect(*_args, **_kwargs):
+        raise AssertionError("ping should not open a new connection")
+
+    monkeypatch.setattr(chat, "get_pool", lambda: FakePool())
+    monkeypatch.setattr(chat, "connect_db", _no_connect)
+
+    chat._ping_db(0.5)
+
+    assert waits == [0.5]
+    assert conn.statements == ["SELECT 1"]
+    assert conn.closed is False
+
+
 # Commit-message checklist:
 # - [ ] type is accurate (test, fix, feat)
 # - [ ] scope is clear (health)
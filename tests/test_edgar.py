@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from pathlib import Path
 
@@ -28,6 +29,9 @@ async def test_download_handles_429(monkeypatch):
     attempts = {"count": 0}
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -57,6 +61,9 @@ async def test_list_new_filings_filters_13f(monkeypatch):
     }
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -72,11 +79,42 @@ async def test_list_new_filings_filters_13f(monkeypatch):
     assert filings == [{"accession": "0001-01", "cik": "1234", "filed": "2024-02-01"}]
 
 
+@pytest.mark.asyncio
+async def test_list_new_filings_normalizes_forms_and_skips_older_dates(monkeypatch):
+    payload = {
+        "filings": {
+            "recent": {
+                "form": ["13f-hr", "13-F", "13F-HR", "13F-HR  /A"],
+                "filingDate": ["2024-03-01", "2024-02-15", "2023-12-31", "2024-04-01"],
+                "accessionNumber": ["0001-01", "0002-02", "0003-03", "0004-04"],
+            }
+        }
+    }
+
+    class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
+        async def get(self, *a, **k):
+            return httpx.Response(200, request=httpx.Request("GET", "x"), json=payload)
+
+    monkeypatch.setattr(edgar.httpx, "AsyncClient", DummyClient)
+    filings = await edgar.list_new_filings("1234", "2024-01-01")
+
+    assert filings == [
+        {"accession": "0001-01", "cik": "1234", "filed": "2024-03-01"},
+        {"accession": "0002-02", "cik": "1234", "filed": "2024-02-15"},
+    ]
+
+
 @pytest.mark.asyncio
 async def test_list_new_filings_raises_when_empty(monkeypatch):
     payload = {"filings": {"recent": {"form": [], "filingDate": [], "accessionNumber": []}}}
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -95,6 +133,9 @@ async def test_list_new_filings_raises_when_empty(monkeypatch):
 @pytest.mark.asyncio
 async def test_download_returns_text(monkeypatch):
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -130,3 +171,102 @@ async def test_request_with_retry_recovers_from_request_error(monkeypatch):
 
     assert resp.status_code == 200
     assert attempts["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_request_with_retry_honours_retry_after(monkeypatch):
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "7"}, request=httpx.Request("GET", "x")),
+        httpx.Response(200, request=httpx.Request("GET", "x")),
+    ]
+    sleeps = []
+
+    class DummyClient:
+        async def get(self, *a, **k):
+            return responses.pop(0)
+
+    async def _record_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(edgar, "EDGAR_MIN_REQUEST_INTERVAL", 0.0)
+    monkeypatch.setattr(edgar.asyncio, "sleep", _record_sleep)
+    resp = await edgar._request_with_retry(
+        DummyClient(), "http://x", headers={"User-Agent": "ua"}, source="edgar"
+    )
+
+    assert resp.status_code == 200
+    assert sleeps == [7.0]
+
+
+@pytest.mark.asyncio
+async def test_request_with_retry_fails_fast_on_client_error(monkeypatch):
+    attempts = {"count": 0}
+
+    class DummyClient:
+        async def get(self, *a, **k):
+            attempts["count"] += 1
+            return httpx.Response(404, request=httpx.Request("GET", "x"))
+
+    async def _fail_sleep(_delay):
+        raise AssertionError("non-retryable status should not back off")
+
+    monkeypatch.setattr(edgar, "EDGAR_MIN_REQUEST_INTERVAL", 0.0)
+    monkeypatch.setattr(edgar.asyncio, "sleep", _fail_sleep)
+    with pytest.raises(httpx.HTTPStatusError):
+        await edgar._request_with_retry(
+            DummyClient(), "http://x", headers={"User-Agent": "ua"}, source="edgar"
+        )
+
+    assert attempts["count"] == 1
+
+
+def test_retry_after_parses_http_date_and_caps_delay():
+    future = "Wed, 21 Oct 2099 07:28:00 GMT"
+    past = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    def response(value):
+        return httpx.Response(503, headers={"Retry-After": value})
+
+    assert edgar._retry_after_seconds(response(future)) == edgar._MAX_RETRY_AFTER_SECONDS
+    assert edgar._retry_after_seconds(response(past)) == 0.0
+    assert edgar._retry_after_seconds(response("soon")) is None
+    assert edgar._retry_after_seconds(httpx.Response(503)) is None
+
+
+@pytest.mark.asyncio
+async def test_download_many_bounds_concurrency_and_keeps_order(monkeypatch):
+    in_flight = {"now": 0, "peak": 0}
+
+    async def fake_download(filing):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0)
+        in_flight["now"] -= 1
+        if filing["accession"] == "bad":
+            raise httpx.RequestError("boom", request=httpx.Request("GET", "x"))
+        return f"<xml>{filing['accession']}</xml>"
+
+    monkeypatch.setattr(edgar, "download", fake_download)
+    filings = [{"accession": str(i), "cik": "1"} for i in range(6)]
+    filings.insert(3, {"accession": "bad", "cik": "1"})
+
+    results = await edgar.download_many(filings, concurrency=2, return_exceptions=True)
+
+    assert in_flight["peak"] == 2
+    assert results[:3] == ["<xml>0</xml>", "<xml>1</xml>", "<xml>2</xml>"]
+    assert isinstance(results[3], httpx.RequestError)
+    assert results[4:] == ["<xml>3</xml>", "<xml>4</xml>", "<xml>5</xml>"]
+    with pytest.raises(httpx.RequestError):
+        await edgar.download_many(filings, concurrency=2)
+
+
+def test_sec_url_templates_pad_and_strip_identifiers():
+    assert edgar._SUBMISSIONS_URL(cik="1234") == (
+        "https://data.sec.gov/submissions/CIK0000001234.json"
+    )
+    assert edgar._filing_document_url({"cik": "0001234", "accession": "0001234-24-000001"}) == (
+        "https://www.sec.gov/Archives/edgar/data/1234/000123424000001/primary_doc.xml"
+    )
+    assert edgar._filing_document_url({"url": "/Archives/x.xml"}) == (
+        "https://www.sec.gov/Archives/x.xml"
+    )
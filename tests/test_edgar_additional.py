@@ -12,6 +12,9 @@ async def test_list_new_filings_filters(monkeypatch):
     data = json.loads(Path("tests/data/submissions.json").read_text())
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -30,6 +33,9 @@ async def test_list_new_filings_filters(monkeypatch):
 @pytest.mark.asyncio
 async def test_download_success(monkeypatch):
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -57,6 +63,9 @@ async def test_list_new_filings_raises_when_empty(monkeypatch):
     }
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -581,6 +581,26 @@ async def test_edgar_flow_uses_latest_stored_filed_date_when_since_missing(monke
     assert rows == [{"nameOfIssuer": "Corp", "cusip": "AAA", "value": 1, "sshPrnamt": 1}]
 
 
+@pytest.mark.asyncio
+async def test_edgar_flow_closes_shared_http_client_even_when_ingest_fails(monkeypatch, tmp_path):
+    closed = []
+
+    async def fake_aclose():
+        closed.append(True)
+
+    async def failing_ingest_flow(**_kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(flow, "aclose_http_client", fake_aclose)
+    monkeypatch.setattr(flow.ingest_module, "ingest_flow", failing_ingest_flow)
+    monkeypatch.setattr(flow, "RAW_DIR", tmp_path)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await flow.edgar_flow.fn(cik_list=["0"], since="2024-01-01")
+
+    assert closed == [True]
+
+
 @pytest.mark.asyncio
 async def test_edgar_flow_default_ciks(monkeypatch, tmp_path):
     seen = []
@@ -31,6 +31,9 @@ def seed_manager(db_path, cik, manager_id=1):
 
 def make_client(responder):
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -40,6 +43,9 @@ def make_client(responder):
         async def get(self, url, headers=None):
             return responder(url)
 
+        async def aclose(self):
+            return None
+
     return DummyClient
 
 
@@ -370,6 +376,61 @@ async def test_parse_step_with_mocked_input_multiple_rows():
     ]
 
 
+def test_legacy_parser_reads_namespaced_information_table_bytes():
+    raw = (
+        b'<?xml version="1.0" encoding="UTF-8"?>'
+        b'<informationTable xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable">'
+        b"<infoTable><nameOfIssuer>Alpha Inc</nameOfIssuer><cusip>111111111</cusip>"
+        b"<value>10</value><shrsOrPrnAmt><sshPrnamt>5</sshPrnamt></shrsOrPrnAmt></infoTable>"
+        b"<infoTable><nameOfIssuer>Beta Inc</nameOfIssuer><cusip>222222222</cusip>"
+        b"<value>20</value><shrsOrPrnAmt><sshPrnamt>7</sshPrnamt></shrsOrPrnAmt></infoTable>"
+        b"</informationTable>"
+    )
+
+    assert edgar._legacy_parse_13f(raw) == [
+        {"nameOfIssuer": "Alpha Inc", "cusip": "111111111", "value": 10, "sshPrnamt": 5},
+        {"nameOfIssuer": "Beta Inc", "cusip": "222222222", "value": 20, "sshPrnamt": 7},
+    ]
+
+
+def test_legacy_parser_defaults_missing_fields():
+    rows = edgar._legacy_parse_13f(sample_xml_multiple())
+
+    assert rows == [
+        {"nameOfIssuer": "Example Corp", "cusip": "123456789", "value": 1000, "sshPrnamt": 100},
+        {"nameOfIssuer": "Missing Fields", "cusip": "", "value": 0, "sshPrnamt": 0},
+    ]
+
+
+def test_legacy_parser_ignores_comments_and_unrelated_children():
+    raw = (
+        b'<informationTable xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable">'
+        b"<infoTable><!-- amended --><nameOfIssuer>Gamma Co</nameOfIssuer>"
+        b"<titleOfClass>COM</titleOfClass><cusip>333333333</cusip><value>30</value>"
+        b"<shrsOrPrnAmt><sshPrnamtType>SH</sshPrnamtType><sshPrnamt>9</sshPrnamt>"
+        b"</shrsOrPrnAmt><votingAuthority><Sole>9</Sole></votingAuthority></infoTable>"
+        b"</informationTable>"
+    )
+
+    assert edgar._legacy_parse_13f(raw) == [
+        {"nameOfIssuer": "Gamma Co", "cusip": "333333333", "value": 30, "sshPrnamt": 9}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_parse_accepts_undecoded_bytes():
+    rows = await edgar.parse(sample_xml().encode("utf-8"))
+
+    assert rows == [
+        {
+            "nameOfIssuer": "Example Corp",
+            "cusip": "123456789",
+            "value": 1000,
+            "sshPrnamt": 100,
+        }
+    ]
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_parse_step_with_mocked_input_fixture():
@@ -404,6 +465,9 @@ async def test_rate_limit_handling(monkeypatch, tmp_path):
         return None
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -510,6 +574,9 @@ async def test_network_timeout_handling(monkeypatch, tmp_path):
         return None
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -22,6 +22,9 @@ class _FakeClock:
     def perf_counter(self) -> float:
         return self.now
 
+    def perf_counter_ns(self) -> int:
+        return round(self.now * 1_000_000_000)
+
     def monotonic(self) -> float:
         return self.now
 
@@ -38,6 +41,7 @@ def _install_health_clock(monkeypatch, fake_clock: _FakeClock) -> chat.HealthClo
         perf_counter=fake_clock.perf_counter,
         monotonic=fake_clock.monotonic,
         sleep=fake_clock.sleep,
+        perf_counter_ns=fake_clock.perf_counter_ns,
     )
     monkeypatch.setattr(chat, "HEALTH_CLOCK", clock)
     monkeypatch.setattr(chat, "APP_START_TIME", clock.monotonic())
@@ -122,9 +126,9 @@ def test_health_detailed_minio_retries_with_backoff(tmp_path, monkeypatch):
     )
 
     async def _healthy_db():
-        return chat.JSONResponse(status_code=200, content={"healthy": True, "latency_ms": 0})
+        return {"healthy": True, "latency_ms": 0}, 200
 
-    monkeypatch.setattr(chat, "health_db", _healthy_db)
+    monkeypatch.setattr(chat, "_health_db_payload", _healthy_db)
 
     calls = []
 
@@ -305,3 +309,70 @@ def test_health_detailed_minio_circuit_breaker_resets_after_cooldown(tmp_path, m
 # - [ ] type is accurate (feat, fix, test)
 # - [ ] scope is clear (health)
 # - [ ] summary is concise and imperative
+
+
+def test_minio_client_reused_for_the_same_timeout(monkeypatch):
+    created = []
+    monkeypatch.setattr(
+        chat.boto3, "client", lambda *_a, **kwargs: created.append(kwargs) or object()
+    )
+    chat._cached_minio_client.cache_clear()
+    try:
+        first = chat._minio_client(0.1)
+        assert chat._minio_client(0.1) is first
+        # The configured budget is passed through unchanged, never rounded up.
+        assert created[0]["config"].connect_timeout == 0.1
+        assert created[0]["config"].read_timeout == 0.1
+        # A different budget or endpoint still gets its own client.
+        assert chat._minio_client(0.4) is not first
+        monkeypatch.setenv("MINIO_ENDPOINT", "http://minio.internal:9000")
+        assert chat._minio_client(0.1) is not first
+        assert len(created) == 3
+    finally:
+        chat._cached_minio_client.cache_clear()
+
+
+def test_redis_client_reused_between_pings(monkeypatch):
+    redis = pytest.importorskip("redis")
+    pings = []
+
+    class _FakeRedis:
+        def ping(self):
+            pings.append(self)
+
+    created = []
+    monkeypatch.setattr(
+        redis.Redis,
+        "from_url",
+        classmethod(lambda _cls, *a, **k: created.append(a) or _FakeRedis()),
+    )
+    chat._redis_client.cache_clear()
+    try:
+        chat._ping_redis("redis://cache:6379/0", 0.1)
+        chat._ping_redis("redis://cache:6379/0", 0.1)
+        assert len(created) == 1
+        assert pings[0] is pings[1]
+    finally:
+        chat._redis_client.cache_clear()
+
+
+def test_orjson_response_matches_stdlib_rendering():
+    payload = {"healthy": False, "components": {"minio": {"latency_ms": 12, "note": "é"}}}
+    fast = chat.ORJSONResponse(status_code=503, content=payload)
+    assert fast.body == chat.JSONResponse(status_code=503, content=payload).body
+    assert fast.headers["content-type"] == "application/json"
+    # orjson rejects non-string keys by default; the stdlib encoder handles them.
+    assert chat.ORJSONResponse(content={1: "one"}).body == b'{"1":"one"}'
+
+
+@pytest.mark.asyncio
+async def test_dependency_latency_uses_integer_clock(monkeypatch):
+    fake_clock = _FakeClock()
+    _install_health_clock(monkeypatch, fake_clock)
+
+    def _slow_ping(_timeout_seconds):
+        fake_clock.advance(0.0129)
+
+    payload, reason = await chat._run_dependency_check(_slow_ping, 1.0, 1.0)
+    assert reason is None
+    assert payload == {"healthy": True, "latency_ms": 12}
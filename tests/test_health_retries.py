@@ -1,4 +1,8 @@
+import asyncio
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -32,6 +36,89 @@ async def test_health_retry_backoff_timing():
         sleep_fn=_fake_sleep,
         perf_counter_fn=_fake_perf_counter,
     )
-    chat._HEALTH_EXECUTOR.shutdown(wait=False, cancel_futures=True)
     assert attempts == ["call", "call", "call", "call"]
     assert sleep_calls == [0.1, 0.2, 0.4]
+
+
+@pytest.mark.asyncio
+async def test_health_retry_backoff_releases_worker_slot(monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(chat, "_HEALTH_EXECUTOR", executor)
+    attempts = []
+    neighbours = []
+
+    def _flaky():
+        attempts.append("call")
+        if len(attempts) < 2:
+            raise RuntimeError("flaky dependency")
+
+    async def _sleep_while_neighbour_runs(_duration):
+        # With a single worker, this only completes if the retry is not holding it.
+        neighbours.append(await asyncio.wait_for(chat._run_ping(lambda: None), 1.0))
+
+    try:
+        await chat._run_health_check_with_retries(_flaky, 1.0, sleep_fn=_sleep_while_neighbour_runs)
+    finally:
+        executor.shutdown()
+    assert attempts == ["call", "call"]
+    assert neighbours == [None]
+
+
+@pytest.mark.asyncio
+async def test_health_retry_timeout_does_not_wait_for_hung_ping():
+    release = threading.Event()
+
+    def _hung():
+        release.wait(5.0)
+
+    started = time.perf_counter()
+    try:
+        with pytest.raises(TimeoutError):
+            await chat._run_health_check_with_retries(_hung, 0.05)
+    finally:
+        release.set()
+    assert time.perf_counter() - started < 1.0
+
+
+@pytest.mark.asyncio
+async def test_hung_pings_keep_their_worker_until_they_return(monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="health-test")
+    monkeypatch.setattr(chat, "_HEALTH_EXECUTOR", executor)
+    release = threading.Event()
+    started = []
+
+    def _hung():
+        started.append(threading.current_thread().name)
+        release.wait(5.0)
+
+    try:
+        for _ in range(5):
+            with pytest.raises(TimeoutError):
+                await chat._run_health_check_with_retries(_hung, 0.05)
+        # Timed-out pings still occupy their threads, so no extra ones were started.
+        assert len(started) == 2
+        assert len(set(started)) == 2
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_shutdown_drops_queued_health_pings(monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(chat, "_HEALTH_EXECUTOR", executor)
+    release = threading.Event()
+    ran = []
+
+    running = executor.submit(release.wait, 5.0)
+    queued = executor.submit(ran.append, "queued")
+    try:
+        chat._shutdown_health_executor()
+    finally:
+        release.set()
+    running.result(timeout=1.0)
+
+    assert queued.cancelled()
+    assert ran == []
+    # A later app start still gets a usable executor.
+    assert chat._HEALTH_EXECUTOR is not executor
+    assert chat._HEALTH_EXECUTOR.submit(lambda: "ok").result(timeout=1.0) == "ok"
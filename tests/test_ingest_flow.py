@@ -745,3 +745,24 @@ async def test_uk_flow_is_uk_wrapper(monkeypatch):
     assert captured["identifiers"] == ["12345678"]
     assert captured["since"] == "2024-01-01"
     assert captured["fetcher"] is None
+
+
+@pytest.mark.asyncio
+async def test_ingest_flow_closes_shared_http_client_even_when_fetch_fails(tmp_path, monkeypatch):
+    closed = []
+
+    async def fake_aclose():
+        closed.append(True)
+
+    async def failing_fetcher(_identifier, _since):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(ingest_flow, "RAW_DIR", tmp_path)
+    monkeypatch.setattr(ingest_flow, "aclose_http_client", fake_aclose)
+
+    rows = await ingest_flow.ingest_flow.fn(
+        jurisdiction="uk", identifiers=["12345678"], since="2024-01-01", fetcher=failing_fetcher
+    )
+
+    assert rows == []
+    assert closed == [True]
@@ -1,15 +1,18 @@
 import asyncio
 import sqlite3
 import sys
+import threading
 from pathlib import Path
 from typing import Any, cast
 
 import httpx
+import pytest
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from api import managers as managers_module
 from api.chat import app
+from config import load_runtime_config
 
 
 async def _post_manager(payload: dict):
@@ -124,6 +127,30 @@ def test_manager_invalid_cik_returns_400(tmp_path, monkeypatch):
     assert "10-digit" in payload["errors"][0]["message"].lower()
 
 
+def test_manager_non_ascii_digit_cik_returns_400(tmp_path, monkeypatch):
+    db_path = tmp_path / "dev.db"
+    monkeypatch.setenv("DB_PATH", str(db_path))
+    # Arabic-Indic digits satisfy a Unicode ``\d`` but are not a valid CIK.
+    resp = asyncio.run(_post_manager({"name": "Ada Lovelace", "cik": "\u0660" * 10}))
+    assert resp.status_code == 400
+    assert resp.json()["errors"][0]["field"] == "cik"
+
+
+@pytest.mark.parametrize(
+    ("cik", "valid"),
+    [
+        ("0001791786", True),
+        ("000179178", False),
+        ("00017917860", False),
+        ("000179178a", False),
+        ("0001791786\n", False),
+        ("\u0660" * 10, False),
+    ],
+)
+def test_is_valid_cik(cik, valid):
+    assert managers_module._is_valid_cik(cik) is valid
+
+
 def test_manager_valid_record_is_stored(tmp_path, monkeypatch):
     db_path = tmp_path / "dev.db"
     monkeypatch.setenv("DB_PATH", str(db_path))
@@ -880,6 +907,197 @@ def test_manager_delete_removes_record(tmp_path, monkeypatch):
     assert fetch_resp.status_code == 404
 
 
+def test_manager_routes_run_schema_ddl_once_per_database(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "dev.db"))
+    original = managers_module._ensure_manager_table
+    calls: list[object] = []
+
+    def _counting_ensure(conn):
+        calls.append(conn)
+        original(conn)
+
+    monkeypatch.setattr(managers_module, "_ensure_manager_table", _counting_ensure)
+
+    first = asyncio.run(_post_manager({"name": "Elliott Investment Management L.P."}))
+    second = asyncio.run(_post_manager({"name": "Pershing Square Capital Management"}))
+    assert first.status_code == 201
+    assert second.status_code == 201
+    manager_id = first.json()["manager_id"]
+    assert asyncio.run(_get_managers()).status_code == 200
+    assert asyncio.run(_get_manager(manager_id)).status_code == 200
+    assert asyncio.run(_patch_manager(manager_id, {"tags": ["activist"]})).status_code == 200
+    assert asyncio.run(_delete_manager(manager_id)).status_code == 204
+    assert len(calls) == 1
+
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "other.db"))
+    third = asyncio.run(_post_manager({"name": "Trian Fund Management"}))
+    assert third.status_code == 201
+    assert len(calls) == 2
+
+
+def test_manager_schema_memo_follows_connect_db_resolution(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DB_URL", raising=False)
+    monkeypatch.delenv("DB_PATH", raising=False)
+    # connect_db falls back to the runtime config default, so the memo key must too.
+    assert managers_module._db_identity() == load_runtime_config().db_path
+
+    monkeypatch.setenv("DB_URL", "postgresql://user@localhost/db")
+    assert managers_module._db_identity() == "postgresql://user@localhost/db"
+
+
+def test_manager_schema_memo_is_dropped_after_a_database_error(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "dev.db"))
+    created = asyncio.run(_post_manager({"name": "Elliott Investment Management L.P."}))
+    assert created.status_code == 201
+    assert str(tmp_path / "dev.db") in managers_module._MANAGER_TABLE_READY
+
+    conn = sqlite3.connect(tmp_path / "dev.db")
+    conn.execute("DROP TABLE managers")
+    conn.commit()
+    conn.close()
+
+    # The stale memo skips the DDL once, fails, and is forgotten so the next
+    # request recreates the table.
+    assert asyncio.run(_get_managers()).status_code == 503
+    assert str(tmp_path / "dev.db") not in managers_module._MANAGER_TABLE_READY
+    recovered = asyncio.run(_get_managers())
+    assert recovered.status_code == 200
+    assert recovered.json()["total"] == 0
+
+
+def test_manager_connections_are_borrowed_from_pool(monkeypatch):
+    conn = _PostgresLikeConn()
+    events: list[str] = []
+
+    timeouts: list[float] = []
+
+    class FakePool:
+        def getconn(self, timeout=None):
+            events.append("get")
+            timeouts.append(timeout)
+            return conn
+
+        def putconn(self, returned):
+            assert returned is conn
+            events.append("put")
+
+    pool = FakePool()
+    monkeypatch.setattr(managers_module, "get_pool", lambda: pool)
+
+    borrowed, owner = managers_module._open_connection()
+    # A later DB_URL switch must not redirect the connection to another pool.
+    monkeypatch.setattr(managers_module, "get_pool", lambda: None)
+    managers_module._close_connection(borrowed, owner)
+
+    assert borrowed is conn
+    assert owner is pool
+    assert events == ["get", "put"]
+    assert timeouts == [managers_module.db_pool_timeout()]
+
+
+def test_manager_connections_fall_back_to_connect_db(tmp_path, monkeypatch):
+    monkeypatch.delenv("DB_URL", raising=False)
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "dev.db"))
+
+    conn, pool = managers_module._open_connection()
+    assert isinstance(conn, sqlite3.Connection)
+    assert pool is None
+    managers_module._close_connection(conn, pool)
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+
+def test_manager_create_writes_off_the_event_loop_thread(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "dev.db"))
+    original = managers_module._insert_manager
+    insert_threads: list[int] = []
+
+    def _recording_insert(conn, payload):
+        insert_threads.append(threading.get_ident())
+        return original(conn, payload)
+
+    monkeypatch.setattr(managers_module, "_insert_manager", _recording_insert)
+
+    resp = asyncio.run(_post_manager({"name": "Elliott Investment Management L.P."}))
+
+    assert resp.status_code == 201
+    assert resp.json()["name"] == "Elliott Investment Management L.P."
+    assert len(insert_threads) == 1
+    assert insert_threads[0] != threading.get_ident()
+
+
+def test_manager_reads_borrow_connections_off_the_event_loop_thread(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "dev.db"))
+    original = managers_module._open_connection
+    open_threads: list[int] = []
+
+    def _recording_open():
+        open_threads.append(threading.get_ident())
+        return original()
+
+    monkeypatch.setattr(managers_module, "_open_connection", _recording_open)
+
+    created = asyncio.run(_post_manager({"name": "Elliott Investment Management L.P."}))
+    manager_id = created.json()["manager_id"]
+    open_threads.clear()
+
+    async def _read_all():
+        loop_thread = threading.get_ident()
+        await managers_module.list_managers(limit=25, offset=0, jurisdiction=None, tag=None)
+        await managers_module.get_manager_stats()
+        await managers_module.get_manager(id=manager_id)
+        await managers_module.get_similar_managers(id=manager_id, limit=10, basis="jaccard")
+        return loop_thread
+
+    loop_thread = asyncio.run(_read_all())
+
+    assert len(open_threads) == 4
+    assert loop_thread not in open_threads
+
+
+def test_manager_writes_borrow_connections_off_the_event_loop_thread(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_PATH", str(tmp_path / "dev.db"))
+    created = asyncio.run(_post_manager({"name": "Elliott Investment Management L.P."}))
+    manager_id = created.json()["manager_id"]
+
+    original = managers_module._open_connection
+    open_threads: list[int] = []
+
+    def _recording_open():
+        open_threads.append(threading.get_ident())
+        return original()
+
+    monkeypatch.setattr(managers_module, "_open_connection", _recording_open)
+
+    async def _write_all():
+        await cast(Any, app.router).startup()
+        try:
+            transport = httpx.ASGITransport(app=cast(Any, app))
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test", timeout=5.0
+            ) as client:
+                responses = [
+                    await client.patch(f"/managers/{manager_id}", json={"tags": ["activist"]}),
+                    await client.patch(f"/managers/{manager_id}/tags", json={"add": ["macro"]}),
+                    await client.post("/api/managers/bulk", json=[{"name": "Trian"}]),
+                    await client.post(
+                        "/managers/import/universe",
+                        json=[{"name": "Cevian", "cik": "0001365341", "jurisdiction": "us"}],
+                    ),
+                    await client.delete(f"/managers/{manager_id}"),
+                ]
+        finally:
+            await cast(Any, app.router).shutdown()
+        return threading.get_ident(), responses
+
+    loop_thread, responses = asyncio.run(_write_all())
+
+    assert [resp.status_code for resp in responses] == [200, 200, 200, 200, 204]
+    assert len(open_threads) == 5
+    assert loop_thread not in open_threads
+
+
 def test_manager_delete_returns_404_for_missing_id(tmp_path, monkeypatch):
     db_path = tmp_path / "dev.db"
     monkeypatch.setenv("DB_PATH", str(db_path))
@@ -1,10 +1,12 @@
 import asyncio
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, cast
 
 import fakeredis
 import httpx
+from prometheus_client import REGISTRY
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
@@ -81,3 +83,220 @@ def test_manager_cache_invalidation_on_write(tmp_path, monkeypatch):
 
     after = cache_module.get_cache_stats("managers.list")
     assert after["misses"] > before["misses"]
+
+
+def test_make_cache_key_memoizes_scalar_arguments():
+    cache_module._key_from_hashable.cache_clear()
+    args = ("sqlite:dev.db", 10, 0, None, "activist")
+
+    first = cache_module._make_cache_key("managers.list", args, {})
+    second = cache_module._make_cache_key("managers.list", args, {})
+
+    assert first == second
+    assert first == cache_module._digest_cache_key("managers.list", args, {})
+    assert cache_module._key_from_hashable.cache_info().hits == 1
+
+
+def test_make_cache_key_keeps_equal_scalars_of_different_types_apart():
+    as_int = cache_module._make_cache_key("managers.item", ("db", 1), {})
+    as_bool = cache_module._make_cache_key("managers.item", ("db", True), {})
+    as_float = cache_module._make_cache_key("managers.item", ("db", 1.0), {})
+
+    assert len({as_int, as_bool, as_float}) == 3
+
+
+def test_make_cache_key_falls_back_for_unhashable_arguments():
+    cache_module._key_from_hashable.cache_clear()
+    args = ("db", ["us", "uk"])
+
+    key = cache_module._make_cache_key("managers.list", args, {"tag": {"a": 1}})
+
+    assert key == cache_module._digest_cache_key("managers.list", args, {"tag": {"a": 1}})
+    assert cache_module._key_from_hashable.cache_info().currsize == 0
+
+
+def test_make_cache_key_uses_128_bit_digest():
+    key = cache_module._make_cache_key("managers.count", ("db", None, None), {})
+
+    namespace, digest = key.split(":", 1)
+    assert namespace == "managers.count"
+    assert len(digest) == 32
+    int(digest, 16)
+
+
+def test_cache_round_trip_matches_stdlib_payload_shape(monkeypatch):
+    import datetime as dt
+    import json
+
+    _configure_cache(monkeypatch)
+    value = {"created_at": dt.datetime(2024, 1, 2, 3, 4, 5), "ids": (1, 2), "name": "A"}
+    expected = json.loads(json.dumps(value, default=str))
+
+    wide = {"id": 2**70, "created_at": value["created_at"]}
+    cache_module.cache_set("managers.item:fast", value)
+    # Integers wider than 64 bits fall back to the stdlib encoder.
+    cache_module.cache_set("managers.item:wide", wide)
+
+    assert cache_module.cache_get("managers.item", "managers.item:fast") == expected
+    assert cache_module.cache_get("managers.item", "managers.item:wide") == json.loads(
+        json.dumps(wide, default=str)
+    )
+
+
+def test_cache_payloads_encode_float_edge_cases_enums_and_non_str_keys(monkeypatch):
+    import enum
+
+    class Color(enum.Enum):
+        RED = "red"
+
+    _configure_cache(monkeypatch)
+    value = {
+        "nan": float("nan"),
+        "inf": float("inf"),
+        "ninf": float("-inf"),
+        "tiny": 5e-324,
+        "color": Color.RED,
+        "by_id": {1: "a", 2.5: "b", None: "c"},
+    }
+    cache_module.cache_set("managers.item:edge", value)
+
+    # Non-finite floats become null and plain enums their value; non-str keys
+    # are stringified exactly as json.dumps does.
+    assert cache_module.cache_get("managers.item", "managers.item:edge") == {
+        "nan": None,
+        "inf": None,
+        "ninf": None,
+        "tiny": 5e-324,
+        "color": "red",
+        "by_id": {"1": "a", "2.5": "b", "null": "c"},
+    }
+
+
+def test_make_cache_key_keeps_non_finite_floats_apart_from_none():
+    keys = {
+        cache_module._make_cache_key("managers.list", (value,), {})
+        for value in (None, float("nan"), float("inf"), float("-inf"))
+    }
+
+    assert len(keys) == 4
+
+
+def test_make_cache_key_encodes_none_arguments_once(monkeypatch):
+    def fail_stdlib(*_args, **_kwargs):
+        raise AssertionError("finite keys should not be re-encoded with the stdlib")
+
+    monkeypatch.setattr(cache_module, "json", SimpleNamespace(dumps=fail_stdlib))
+
+    key = cache_module._make_cache_key("managers.list", (None, "null"), {"role": None})
+
+    assert key.startswith("managers.list:")
+
+
+def test_make_cache_key_falls_back_to_stdlib_for_wide_integers():
+    key = cache_module._make_cache_key("managers.item", ("db", [2**70]), {})
+
+    assert key.startswith("managers.item:")
+
+
+def test_cache_stats_match_exported_prometheus_metrics():
+    cache_module.reset_cache_stats()
+    for hit in (True, True, False):
+        cache_module._record_cache_metric("managers.count", hit=hit)
+
+    stats = cache_module.get_cache_stats("managers.count")
+
+    assert stats == {"hits": 2, "misses": 1, "hit_ratio": 2 / 3}
+    labels = {"namespace": "managers.count"}
+    assert REGISTRY.get_sample_value("cache_hits_total", labels) == 2
+    assert REGISTRY.get_sample_value("cache_misses_total", labels) == 1
+    assert REGISTRY.get_sample_value("cache_hit_ratio", labels) == 2 / 3
+
+    cache_module.reset_cache_stats()
+    assert cache_module.get_cache_stats("managers.count")["hits"] == 0
+
+
+def test_backend_is_built_once_until_reset(monkeypatch):
+    _configure_cache(monkeypatch)
+    built: list[str] = []
+    monkeypatch.setattr(
+        cache_module, "_build_redis_client", lambda url: built.append(url) or fakeredis.FakeRedis()
+    )
+
+    first = cache_module._get_backend()
+    assert cache_module._get_backend() is first
+    assert len(built) == 1
+
+    cache_module.reset_cache_backend()
+    assert cache_module._get_backend() is not first
+    assert len(built) == 2
+
+
+def test_redis_invalidate_prefix_unlinks_in_batches(monkeypatch):
+    fake_redis = fakeredis.FakeRedis()
+    _configure_cache(monkeypatch)
+    monkeypatch.setattr(cache_module, "_build_redis_client", lambda _url: fake_redis)
+    monkeypatch.setattr(cache_module, "_REDIS_DELETE_BATCH", 2)
+    cache_module.reset_cache_backend()
+    for index in range(5):
+        cache_module.cache_set(f"managers.list:{index}", index)
+    cache_module.cache_set("managers.item:keep", 1)
+    unlink_sizes: list[int] = []
+    original_unlink = fake_redis.unlink
+
+    def _recording_unlink(*keys):
+        unlink_sizes.append(len(keys))
+        return original_unlink(*keys)
+
+    monkeypatch.setattr(fake_redis, "unlink", _recording_unlink)
+
+    cache_module.invalidate_cache_prefix("managers.list:")
+    cache_module.invalidate_cache_prefix("managers.missing:")
+
+    # Each batch is sent as soon as it fills instead of queueing one big pipeline.
+    assert sum(unlink_sizes) == 5
+    assert max(unlink_sizes) <= 2
+    assert fake_redis.keys("managers.list:*") == []
+    assert fake_redis.get("managers.item:keep") == b"1"
+
+
+def _configure_memory_cache(monkeypatch, *, max_items: int = 512) -> None:
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    monkeypatch.setenv("CACHE_MAX_ITEMS", str(max_items))
+    cache_module.reset_cache_backend()
+    cache_module.reset_cache_stats()
+
+
+def test_memory_backend_expires_entries_by_ttl(monkeypatch):
+    _configure_memory_cache(monkeypatch)
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    cache_module.cache_set("managers.item:1", {"id": 1}, ttl=5)
+    assert cache_module.cache_get("managers.item", "managers.item:1") == {"id": 1}
+
+    now[0] = 105.0
+    assert cache_module.cache_get("managers.item", "managers.item:1") is None
+    cache_module.reset_cache_backend()
+
+
+def test_memory_backend_evicts_least_recently_used_when_full(monkeypatch):
+    _configure_memory_cache(monkeypatch, max_items=2)
+    now = [0.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    cache_module.cache_set("ns:a", 1, ttl=60)
+    cache_module.cache_set("ns:b", 2, ttl=60)
+    # Reading "a" makes "b" the least recently used entry.
+    assert cache_module.cache_get("ns", "ns:a") == 1
+    cache_module.cache_set("ns:c", 3, ttl=60)
+    assert cache_module.cache_get("ns", "ns:b") is None
+    assert cache_module.cache_get("ns", "ns:a") == 1
+    assert cache_module.cache_get("ns", "ns:c") == 3
+
+    # Rewriting an existing key refreshes it without evicting anything.
+    cache_module.cache_set("ns:a", 10, ttl=60)
+    cache_module.cache_set("ns:d", 4, ttl=60)
+    assert cache_module.cache_get("ns", "ns:c") is None
+    assert cache_module.cache_get("ns", "ns:a") == 10
+    assert cache_module.cache_get("ns", "ns:d") == 4
+    cache_module.reset_cache_backend()
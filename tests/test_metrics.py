@@ -1,18 +1,67 @@
 import sys
+import threading
+import time
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+import pytest
+
+from api import chat
 from api.chat import metrics
 
 
-def test_metrics_exposes_health_check_histogram():
+@pytest.mark.asyncio
+async def test_metrics_exposes_health_check_histogram():
     # Ensure Prometheus can scrape the health check duration histogram.
-    response = metrics()
+    response = await metrics()
     assert response.status_code == 200
     assert "health_check_duration_seconds" in response.body.decode("utf-8")
 
 
+def test_metrics_exposition_is_reused_within_ttl(monkeypatch):
+    now = [1000.0]
+    renders = []
+
+    def fake_generate_latest():
+        renders.append(now[0])
+        return f"render {len(renders)}".encode()
+
+    monkeypatch.setattr(
+        chat, "HEALTH_CLOCK", chat.HealthClock(time.perf_counter, lambda: now[0], time.sleep)
+    )
+    monkeypatch.setattr(chat, "generate_latest", fake_generate_latest)
+    monkeypatch.setattr(chat, "_METRICS_CACHE", None)
+
+    assert chat._metrics_exposition() == b"render 1"
+    now[0] += 0.5
+    assert chat._metrics_exposition() == b"render 1"
+    now[0] += 0.5
+    assert chat._metrics_exposition() == b"render 2"
+    assert renders == [1000.0, 1001.0]
+
+
+@pytest.mark.asyncio
+async def test_metrics_renders_off_the_event_loop(monkeypatch):
+    render_threads = []
+
+    def fake_generate_latest():
+        render_threads.append(threading.get_ident())
+        return b"rendered"
+
+    monkeypatch.setattr(chat, "generate_latest", fake_generate_latest)
+    monkeypatch.setattr(chat, "_METRICS_CACHE", None)
+
+    response = await metrics()
+    assert response.body == b"rendered"
+    assert render_threads and render_threads[0] != threading.get_ident()
+
+    # A fresh cache entry is served inline without another render.
+    response = await metrics()
+    assert response.body == b"rendered"
+    assert len(render_threads) == 1
+
+
 # Commit-message checklist:
 # - [ ] type is accurate (feat, fix, test)
 # - [ ] scope is clear (health)
@@ -21,6 +21,9 @@ class _FakeClock:
     def perf_counter(self) -> float:
         return self.now
 
+    def perf_counter_ns(self) -> int:
+        return round(self.now * 1_000_000_000)
+
     def monotonic(self) -> float:
         return self.now
 
@@ -37,6 +40,7 @@ def _install_health_clock(monkeypatch, fake_clock: _FakeClock) -> chat.HealthClo
         perf_counter=fake_clock.perf_counter,
         monotonic=fake_clock.monotonic,
         sleep=fake_clock.sleep,
+        perf_counter_ns=fake_clock.perf_counter_ns,
     )
     monkeypatch.setattr(chat, "HEALTH_CLOCK", clock)
     monkeypatch.setattr(chat, "APP_START_TIME", clock.monotonic())
@@ -110,3 +114,19 @@ def test_health_ready_timeout(monkeypatch):
     assert resp.status_code == 503
     payload = _payload_from_response(resp)
     assert payload["healthy"] is False
+
+
+def test_health_ready_uses_db_payload_without_route_response(monkeypatch):
+    async def _unexpected_route():
+        raise AssertionError("readiness should not render the /health/db response")
+
+    async def _unhealthy_db():
+        return {"healthy": False, "latency_ms": 42}, 503
+
+    monkeypatch.setattr(chat, "health_db", _unexpected_route)
+    monkeypatch.setattr(chat, "_health_db_payload", _unhealthy_db)
+    resp = asyncio.run(health_ready())
+    assert resp.status_code == 503
+    payload = _payload_from_response(resp)
+    assert payload["healthy"] is False
+    assert payload["db_latency_ms"] == 42
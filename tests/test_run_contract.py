@@ -133,7 +133,7 @@ async def test_cost_not_constant_zero(tmp_path):
 
     Fails against the previous implementation, which hard-coded ``cost_usd=0.0``.
     """
-    from adapters.base import tracked_call
+    from adapters.base import flush_api_usage, tracked_call
 
     db_path = tmp_path / "usage.db"
 
@@ -149,6 +149,7 @@ async def test_cost_not_constant_zero(tmp_path):
         cost_usd=lambda resp: len(resp.content) * 0.001,
     ) as log:
         log(DummyResp())
+    flush_api_usage()
 
     conn = sqlite3.connect(db_path)
     cost = conn.execute("SELECT cost_usd FROM api_usage").fetchone()[0]
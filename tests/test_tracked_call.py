@@ -1,6 +1,8 @@
+import gzip
 import sqlite3
 from pathlib import Path
 
+import httpx
 import pytest
 
 from adapters import base
@@ -19,6 +21,7 @@ async def test_tracked_call_writes(tmp_path: Path):
     db_path = tmp_path / "dev.db"
     async with tracked_call("test", "http://x", db_path=str(db_path)) as log:
         log(DummyResp())
+    base.flush_api_usage()
     conn = sqlite3.connect(db_path)
     row = conn.execute("SELECT source, endpoint, status FROM api_usage").fetchone()
     view_row = conn.execute("SELECT month, source, calls FROM monthly_usage").fetchone()
@@ -32,6 +35,7 @@ async def test_tracked_call_defaults_when_no_response(tmp_path: Path):
     db_path = tmp_path / "dev.db"
     async with tracked_call("empty", "http://none", db_path=str(db_path)):
         pass
+    base.flush_api_usage()
     conn = sqlite3.connect(db_path)
     row = conn.execute("SELECT source, endpoint, status, bytes FROM api_usage").fetchone()
     conn.close()
@@ -53,6 +57,7 @@ async def test_tracked_call_callable_cost_preserves_error_without_response(tmp_p
             cost_usd=cost_from_response,
         ):
             raise RuntimeError("request failed before response")
+    base.flush_api_usage()
 
     conn = sqlite3.connect(db_path)
     row = conn.execute("SELECT source, endpoint, status, bytes, cost_usd FROM api_usage").fetchone()
@@ -60,6 +65,63 @@ async def test_tracked_call_callable_cost_preserves_error_without_response(tmp_p
     assert row == ("empty", "http://none", 0, 0, 0.0)
 
 
+@pytest.mark.asyncio
+async def test_tracked_call_sizes_from_headers_without_reading_body(tmp_path: Path):
+    db_path = tmp_path / "dev.db"
+
+    class HeaderOnlyResp:
+        status_code = 200
+        headers = {"content-length": "4096"}
+
+        @property
+        def content(self):
+            # Mirrors httpx: an unread body raises rather than being fetched.
+            raise httpx.ResponseNotRead()
+
+    class StreamedResp:
+        status_code = 200
+        headers: dict[str, str] = {}
+        num_bytes_downloaded = 321
+
+        @property
+        def content(self):
+            raise httpx.ResponseNotRead()
+
+    async with tracked_call("hdr", "http://hdr", db_path=str(db_path)) as log:
+        log(HeaderOnlyResp())
+    async with tracked_call("stream", "http://stream", db_path=str(db_path)) as log:
+        log(StreamedResp())
+    base.flush_api_usage()
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT source, bytes FROM api_usage ORDER BY source").fetchall()
+    conn.close()
+    assert rows == [("hdr", 4096), ("stream", 321)]
+
+
+@pytest.mark.asyncio
+async def test_tracked_call_sizes_compressed_bodies_by_decoded_length(tmp_path: Path):
+    db_path = tmp_path / "dev.db"
+    body = gzip.compress(b"x" * 1000)
+    headers = {"content-encoding": "gzip", "content-length": str(len(body))}
+    read = httpx.Response(200, headers=headers, content=body)
+    read.read()
+    unread = httpx.Response(200, headers=headers, stream=httpx.ByteStream(body))
+
+    async with tracked_call("read", "http://gz", db_path=str(db_path)) as log:
+        log(read)
+    async with tracked_call("unread", "http://gz", db_path=str(db_path)) as log:
+        log(unread)
+    base.flush_api_usage()
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT source, bytes FROM api_usage ORDER BY source").fetchall()
+    conn.close()
+    # A read body counts decoded bytes; the compressed Content-Length is ignored.
+    # An unread compressed stream has no decoded size, so it reports wire bytes.
+    assert rows == [("read", 1000), ("unread", 0)]
+
+
 @pytest.mark.asyncio
 async def test_tracked_call_postgres_uses_strict_backend_safe_sql(monkeypatch):
     dummy = StrictPostgresConn()
@@ -67,6 +129,7 @@ async def test_tracked_call_postgres_uses_strict_backend_safe_sql(monkeypatch):
 
     async with tracked_call("pg", "http://pg") as log:
         log(DummyResp(status_code=201, content=b"abc"))
+    base.flush_api_usage()
 
     insert_calls = [call for call in dummy.executed if call[0].startswith("INSERT INTO")]
     assert len(insert_calls) == 1
@@ -76,7 +139,8 @@ async def test_tracked_call_postgres_uses_strict_backend_safe_sql(monkeypatch):
     assert params[3] == 3
     assert params[5] == 0.0
     assert any(call[0] == "SELECT to_regclass('api_usage')" for call in dummy.executed)
-    assert any("CREATE MATERIALIZED VIEW monthly_usage AS" in call[0] for call in dummy.executed)
+    # The monthly rollup is created at startup, never on the usage write path.
+    assert not any("MATERIALIZED VIEW" in call[0] for call in dummy.executed)
     assert dummy.committed is True
     assert dummy.closed is True
 
@@ -104,6 +168,7 @@ async def test_tracked_call_metrics_execute_failure_preserves_response_and_close
 
     async with tracked_call("pg", "http://pg") as log:
         log(response)
+    base.flush_api_usage()
 
     assert conn.closed is True
 
@@ -132,6 +197,173 @@ async def test_tracked_call_cost_callback_failure_is_non_fatal(monkeypatch):
 
     async with tracked_call("pg", "http://pg", cost_usd=cost_from_response) as log:
         log(DummyResp())
+    base.flush_api_usage()
 
     assert conn.executed == []
     assert conn.closed is False
+
+
+@pytest.mark.asyncio
+async def test_tracked_call_reuses_sqlite_connection_and_schema(tmp_path: Path, monkeypatch):
+    db_path = tmp_path / "dev.db"
+    opened = []
+    real_connect_db = base.connect_db
+
+    def counting_connect_db(path=None):
+        opened.append(path)
+        return real_connect_db(path)
+
+    ddl_calls = []
+    real_ensure = base.ensure_api_usage_schema
+
+    def counting_ensure(conn):
+        ddl_calls.append(conn)
+        real_ensure(conn)
+
+    monkeypatch.setattr(base, "connect_db", counting_connect_db)
+    monkeypatch.setattr(base, "ensure_api_usage_schema", counting_ensure)
+
+    for _ in range(3):
+        async with tracked_call("test", "http://x", db_path=str(db_path)) as log:
+            log(DummyResp())
+        base.flush_api_usage()
+
+    conn = sqlite3.connect(db_path)
+    count = conn.execute("SELECT COUNT(*) FROM api_usage").fetchone()[0]
+    conn.close()
+    assert count == 3
+    assert opened == [str(db_path)]
+    assert len(ddl_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_tracked_call_postgres_uses_process_pool(monkeypatch):
+    conn = StrictPostgresConn()
+    created = []
+
+    class FakePool:
+        def __init__(self, url, **kwargs):
+            created.append((url, kwargs))
+
+        def connection(self):
+            from contextlib import nullcontext
+
+            return nullcontext(conn)
+
+    monkeypatch.setenv("DB_URL", "postgresql://user@localhost/db")
+    monkeypatch.setenv("DB_POOL_MAX", "4")
+    monkeypatch.setattr(base, "ConnectionPool", FakePool)
+    monkeypatch.setattr(base, "_USAGE_POOLS", {})
+    monkeypatch.setattr(base, "_SCHEMA_READY", set())
+
+    for _ in range(2):
+        async with tracked_call("pg", "http://pg") as log:
+            log(DummyResp())
+        base.flush_api_usage()
+
+    assert len(created) == 1
+    url, kwargs = created[0]
+    assert url == "postgresql://user@localhost/db"
+    assert kwargs["max_size"] == 4
+    assert "kwargs" not in kwargs
+    create_calls = [sql for sql in conn.statements if sql.startswith("CREATE TABLE")]
+    insert_calls = [sql for sql in conn.statements if sql.startswith("INSERT INTO")]
+    assert len(create_calls) == 1
+    assert len(insert_calls) == 2
+    assert conn.closed is False
+
+
+@pytest.mark.asyncio
+async def test_tracked_call_batches_queued_rows_into_one_transaction(tmp_path: Path, monkeypatch):
+    db_path = tmp_path / "dev.db"
+    monkeypatch.setenv("API_USAGE_FLUSH_MS", "60000")
+    batches = []
+    real_insert = base._insert_usage_rows
+
+    def recording_insert(conn, rows):
+        batches.append(list(rows))
+        real_insert(conn, rows)
+
+    monkeypatch.setattr(base, "_insert_usage_rows", recording_insert)
+
+    for idx in range(5):
+        async with tracked_call("batch", f"http://x/{idx}", db_path=str(db_path)) as log:
+            log(DummyResp())
+    base.flush_api_usage()
+
+    conn = sqlite3.connect(db_path)
+    endpoints = [row[0] for row in conn.execute("SELECT endpoint FROM api_usage ORDER BY id")]
+    conn.close()
+    assert endpoints == [f"http://x/{idx}" for idx in range(5)]
+    assert [len(batch) for batch in batches] == [5]
+
+
+@pytest.mark.asyncio
+async def test_close_usage_connections_drains_queue_and_stops_flusher(tmp_path: Path, monkeypatch):
+    db_path = tmp_path / "dev.db"
+    monkeypatch.setenv("API_USAGE_FLUSH_MS", "60000")
+
+    async with tracked_call("close", "http://x", db_path=str(db_path)) as log:
+        log(DummyResp())
+    flusher = base._USAGE_FLUSHER
+    base.close_usage_connections()
+
+    conn = sqlite3.connect(db_path)
+    count = conn.execute("SELECT COUNT(*) FROM api_usage").fetchone()[0]
+    conn.close()
+    assert count == 1
+    assert flusher is not None and not flusher.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_tracked_call_postgres_batch_uses_copy(monkeypatch):
+    dummy = StrictPostgresConn()
+    monkeypatch.setattr(base, "connect_db", lambda _db_path=None: dummy)
+    monkeypatch.setenv("API_USAGE_FLUSH_MS", "60000")
+
+    for idx in range(base._USAGE_COPY_MIN_ROWS):
+        async with tracked_call("pg", f"http://pg/{idx}") as log:
+            log(DummyResp(status_code=200, content=b"abc"))
+    base.flush_api_usage()
+
+    assert not [sql for sql in dummy.statements if sql.startswith("INSERT INTO")]
+    assert len(dummy.copied) == 1
+    sql, rows = dummy.copied[0]
+    assert sql == (
+        "COPY api_usage (source, endpoint, status, bytes, latency_ms, cost_usd) FROM STDIN"
+    )
+    assert [row[1] for row in rows] == [
+        f"http://pg/{idx}" for idx in range(base._USAGE_COPY_MIN_ROWS)
+    ]
+    assert rows[0][2:4] == (200, 3)
+    assert dummy.committed is True
+
+
+@pytest.mark.asyncio
+async def test_tracked_call_sqlite_uses_wal_journal(tmp_path: Path):
+    db_path = tmp_path / "dev.db"
+    async with tracked_call("wal", "http://x", db_path=str(db_path)) as log:
+        log(DummyResp())
+    base.flush_api_usage()
+
+    conn = sqlite3.connect(db_path)
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    conn.close()
+    assert journal_mode == "wal"
+
+
+@pytest.mark.asyncio
+async def test_tracked_call_sqlite_journal_mode_env_override(tmp_path: Path, monkeypatch):
+    db_path = tmp_path / "dev.db"
+    monkeypatch.setenv("SQLITE_JOURNAL_MODE", "delete")
+    monkeypatch.setenv("SQLITE_SYNCHRONOUS", "not-a-mode")
+    async with tracked_call("wal", "http://x", db_path=str(db_path)) as log:
+        log(DummyResp())
+    base.flush_api_usage()
+
+    conn = sqlite3.connect(db_path)
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    count = conn.execute("SELECT COUNT(*) FROM api_usage").fetchone()[0]
+    conn.close()
+    assert journal_mode == "delete"
+    assert count == 1
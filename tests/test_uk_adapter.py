@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import zlib
 from contextlib import asynccontextmanager
 
@@ -123,6 +125,18 @@ async def test_parse_date_label_variants():
     assert ar01_result["filing_date"] == "2024-11-01"
 
 
+@pytest.mark.asyncio
+async def test_parse_accepts_downloaded_bytearray():
+    raw = _make_flate_pdf_bytes(
+        "Confirmation Statement",
+        "Company Name: Example Holdings Ltd",
+        "Company Number: 12345678",
+        "Date of filing: 2024-01-31",
+    )
+
+    assert await uk.parse(bytearray(raw)) == await uk.parse(raw)
+
+
 @pytest.mark.asyncio
 async def test_parse_empty_pdf_returns_error():
     result = _single_result(await uk.parse(b""))
@@ -145,6 +159,30 @@ async def test_parse_unreadable_pdf_returns_error():
     assert result["status"] == "error"
 
 
+def test_looks_like_pdf_accepts_header_within_first_kilobyte():
+    assert uk._looks_like_pdf(b"%PDF-1.7\n")
+    assert uk._looks_like_pdf(b"\x00" * 1020 + b"%PDF-1.4")
+    assert not uk._looks_like_pdf(b"\x00" * 1021 + b"%PDF-1.4")
+
+
+@pytest.mark.asyncio
+async def test_parse_runs_on_dedicated_executor_and_recovers_after_shutdown(monkeypatch):
+    threads = []
+    parse_sync = uk._parse_sync
+
+    def recording_parse_sync(raw):
+        threads.append(threading.current_thread().name)
+        return parse_sync(raw)
+
+    monkeypatch.setattr(uk, "_parse_sync", recording_parse_sync)
+    await uk.parse(b"not a pdf")
+    uk.close_parse_executor()
+    await uk.parse(b"not a pdf")
+
+    assert len(threads) == 2
+    assert all(name.startswith("uk-parse") for name in threads)
+
+
 @pytest.mark.asyncio
 async def test_parse_non_pdf_bytes_returns_error():
     # Non-PDF bytes should be treated as unreadable input.
@@ -190,6 +228,9 @@ async def test_list_new_filings_filters_and_maps(monkeypatch):
         yield _log
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -201,7 +242,7 @@ async def test_list_new_filings_filters_and_maps(monkeypatch):
             return httpx.Response(200, request=httpx.Request("GET", "x"), json=payload)
 
     monkeypatch.setenv("COMPANIES_HOUSE_API_KEY", "test-key")
-    monkeypatch.setattr(uk.httpx, "AsyncClient", DummyClient)
+    monkeypatch.setattr(httpx, "AsyncClient", DummyClient)
     monkeypatch.setattr(uk, "tracked_call", dummy_tracked_call)
 
     filings = await uk.list_new_filings("12345678", "2024-01-01")
@@ -227,11 +268,14 @@ async def test_list_new_filings_filters_and_maps(monkeypatch):
 @pytest.mark.asyncio
 async def test_list_new_filings_requires_companies_house_api_key(monkeypatch):
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             raise AssertionError("network client should not be opened without credentials")
 
     monkeypatch.delenv("COMPANIES_HOUSE_API_KEY", raising=False)
-    monkeypatch.setattr(uk.httpx, "AsyncClient", DummyClient)
+    monkeypatch.setattr(httpx, "AsyncClient", DummyClient)
 
     with pytest.raises(uk.CompaniesHouseConfigError, match="COMPANIES_HOUSE_API_KEY"):
         await uk.list_new_filings("12345678", "2024-01-01")
@@ -250,18 +294,26 @@ async def test_download_returns_pdf_bytes(monkeypatch):
         yield _log
 
     class DummyClient:
+        def __init__(self, **_kwargs):
+            pass
+
         async def __aenter__(self):
             return self
 
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        async def get(self, *args, **kwargs):
+        @asynccontextmanager
+        async def stream(self, *args, **kwargs):
             calls.append((args, kwargs))
-            return httpx.Response(200, request=httpx.Request("GET", "x"), content=pdf_bytes)
+            yield httpx.Response(
+                200,
+                request=httpx.Request("GET", "x"),
+                stream=httpx.ByteStream(pdf_bytes),
+            )
 
     monkeypatch.setenv("COMPANIES_HOUSE_API_KEY", "test-key")
-    monkeypatch.setattr(uk.httpx, "AsyncClient", DummyClient)
+    monkeypatch.setattr(httpx, "AsyncClient", DummyClient)
     monkeypatch.setattr(uk, "tracked_call", dummy_tracked_call)
 
     result = await uk.download({"transaction_id": "t1"})
@@ -269,12 +321,137 @@ async def test_download_returns_pdf_bytes(monkeypatch):
     assert result == pdf_bytes
     assert calls == [
         (
-            (f"{uk.BASE_URL}/filing-history/t1/document?format=pdf",),
+            ("GET", f"{uk.BASE_URL}/filing-history/t1/document?format=pdf"),
             {"auth": ("test-key", "")},
         )
     ]
 
 
+@pytest.mark.asyncio
+async def test_list_new_filings_trims_dates_and_skips_old_or_undated_items(monkeypatch):
+    @asynccontextmanager
+    async def dummy_tracked_call(*args, **kwargs):
+        yield lambda _resp: None
+
+    items = [
+        {"transaction_id": "new", "date": "2024-03-01T00:00:00"},
+        {"transaction_id": "same-day", "date": "2024-01-01"},
+        {"transaction_id": "undated", "date": None},
+        {"transaction_id": "missing"},
+        {"transaction_id": "short", "date": "2024-02"},
+    ]
+
+    class DummyClient:
+        async def get(self, *args, **kwargs):
+            return httpx.Response(200, request=httpx.Request("GET", "x"), json={"items": items})
+
+    monkeypatch.setenv("COMPANIES_HOUSE_API_KEY", "test-key")
+    monkeypatch.setattr(uk, "tracked_call", dummy_tracked_call)
+    monkeypatch.setattr(uk, "get_http_client", DummyClient)
+
+    filings = await uk.list_new_filings("01234567", "2024-01-01")
+
+    assert filings == [
+        {"transaction_id": "new", "company_number": "01234567", "date": "2024-03-01"},
+        {"transaction_id": "short", "company_number": "01234567", "date": "2024-02"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_download_streams_chunks_and_logs_failed_responses(monkeypatch):
+    logged = []
+
+    @asynccontextmanager
+    async def dummy_tracked_call(*args, **kwargs):
+        yield logged.append
+
+    class DummyClient:
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+        @asynccontextmanager
+        async def stream(self, *args, **kwargs):
+            yield httpx.Response(
+                self.status_code,
+                request=httpx.Request("GET", "x"),
+                stream=httpx.ByteStream(b"%PDF-" + b"x" * 10),
+            )
+
+    monkeypatch.setenv("COMPANIES_HOUSE_API_KEY", "test-key")
+    monkeypatch.setattr(uk, "tracked_call", dummy_tracked_call)
+
+    monkeypatch.setattr(uk, "get_http_client", lambda: DummyClient(200))
+    body = await uk.download({"transaction_id": "t1"}, chunk_size=4)
+    assert isinstance(body, bytearray)
+    assert body == b"%PDF-" + b"x" * 10
+
+    monkeypatch.setattr(uk, "get_http_client", lambda: DummyClient(404))
+    with pytest.raises(httpx.HTTPStatusError):
+        await uk.download({"transaction_id": "t2"})
+    assert [resp.status_code for resp in logged] == [200, 404]
+
+
+@pytest.mark.asyncio
+async def test_download_many_bounds_concurrency_and_keeps_order(monkeypatch):
+    in_flight = {"now": 0, "peak": 0}
+
+    async def fake_download(filing):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0)
+        in_flight["now"] -= 1
+        if filing["transaction_id"] == "bad":
+            raise httpx.RequestError("boom", request=httpx.Request("GET", "x"))
+        return f"%PDF-{filing['transaction_id']}".encode()
+
+    monkeypatch.setattr(uk, "download", fake_download)
+    filings = [{"transaction_id": str(i)} for i in range(4)]
+    filings.insert(2, {"transaction_id": "bad"})
+
+    results = await uk.download_many(filings, concurrency=2, return_exceptions=True)
+
+    assert in_flight["peak"] == 2
+    assert results[:2] == [b"%PDF-0", b"%PDF-1"]
+    assert isinstance(results[2], httpx.RequestError)
+    assert results[3:] == [b"%PDF-2", b"%PDF-3"]
+    with pytest.raises(httpx.RequestError):
+        await uk.download_many(filings, concurrency=2)
+
+
+def test_find_labeled_value_matches_any_label_with_a_value():
+    lines = ["Company No.: 555555", "Company number"]
+    assert uk._find_company_number(lines) == "555555"
+
+    lines = ["Name of company: Foo Ltd / Company name", "Other"]
+    assert uk._find_labeled_value(lines, uk._COMPANY_NAME_LABELS) == "Foo Ltd / Company name"
+    assert uk._find_labeled_value(["Company name", "Bar Ltd"], uk._COMPANY_NAME_LABELS) == "Bar Ltd"
+
+
+def test_parse_skips_content_streams_when_top_level_text_is_complete(monkeypatch):
+    calls = []
+    original = uk._extract_stream_chunks
+
+    def _recording(raw):
+        calls.append(raw)
+        return original(raw)
+
+    monkeypatch.setattr(uk, "_extract_stream_chunks", _recording)
+    complete = _make_pdf_bytes(
+        "Confirmation Statement CS01",
+        "Company name: Acme Ltd",
+        "Company number: 01234567",
+        "Made up to 7 October 2023",
+    )
+    missing_date = _make_pdf_bytes(
+        "Confirmation Statement CS01", "Company name: Acme Ltd", "Company number: 01234567"
+    )
+
+    assert uk._parse_sync(complete)[0]["status"] == "ok"
+    assert calls == []
+    assert uk._parse_sync(missing_date)[0]["filing_date"] is None
+    assert calls == [missing_date]
+
+
 def test_unescape_pdf_string_and_date_helpers_cover_branches():
     assert uk._unescape_pdf_string(r"Hello\040World\041") == "Hello World!"
     assert uk._unescape_pdf_string(r"Line\(") == "Line("
@@ -390,6 +567,97 @@ def test_iter_pdf_streams_accepts_windows_line_endings():
     assert streams[0][1] == compressed
 
 
+def test_iter_pdf_streams_balances_nested_dicts_and_skips_malformed_input():
+    raw = (
+        b"%PDF-1.4\n1 0 obj << /Type /Catalog >> endobj\n"
+        b"2 0 obj << /Length 4 /DecodeParms << /Columns 2 >> >>\nstream\nDATA\nendstream\n"
+        b"3 0 obj >> stream\nnot a dict\nendstream\n" + b"<< /Unclosed " * 1000
+    )
+
+    streams = uk._iter_pdf_streams(raw)
+
+    assert streams == [(b" /Length 4 /DecodeParms << /Columns 2 >> ", b"DATA")]
+
+
+def test_flate_decode_rejects_truncated_or_corrupt_streams():
+    compressed = zlib.compress(b"(Company name: Acme Ltd) " * 4000)
+    raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    deflated = raw_deflate.compress(b"(raw)") + raw_deflate.flush()
+
+    assert uk._flate_decode(compressed, b"") == b"(Company name: Acme Ltd) " * 4000
+    assert uk._flate_decode(compressed + b"trailing", b"") == b"(Company name: Acme Ltd) " * 4000
+    assert uk._flate_decode(compressed[:-200], b"") is None
+    corrupt = compressed[:100] + b"\xff" * 50 + compressed[150:]
+    assert uk._flate_decode(corrupt, b"") is None
+    assert uk._flate_decode(deflated, b"") == b"(raw)"
+    assert uk._flate_decode(deflated[:-2], b"") is None
+    assert uk._flate_decode(b"", b"") is None
+
+
+def test_inflate_catches_the_active_backend_error(monkeypatch):
+    class BackendError(Exception):
+        pass
+
+    class FailingDecompressor:
+        eof = False
+
+        def decompress(self, _data):
+            raise BackendError("bad block")
+
+    class Backend:
+        error = BackendError
+
+        @staticmethod
+        def decompressobj(_wbits):
+            return FailingDecompressor()
+
+    monkeypatch.setattr(uk, "_zlib", Backend)
+
+    assert uk._flate_decode(b"x\x9c\x00", b"") is None
+
+
+def test_extract_stream_chunks_inflates_large_batches_on_threads_in_order(monkeypatch):
+    streams = []
+    for index in range(3):
+        compressed = zlib.compress(f"(Stream {index})".encode("ascii"))
+        header = b"<< /Length " + str(len(compressed)).encode("ascii") + b" /Filter /FlateDecode >>"
+        streams.append(b"%d 0 obj\n" % (index + 1) + header + b"\nstream\n" + compressed)
+    raw = b"%PDF-1.4\n" + b"\nendstream\nendobj\n".join(streams) + b"\nendstream\nendobj\n%%EOF"
+    pools = []
+    threads = []
+    decode = uk._decode_pdf_stream
+
+    class RecordingExecutor(uk.ThreadPoolExecutor):
+        def __init__(self, max_workers, **kwargs):
+            pools.append(max_workers)
+            super().__init__(max_workers, **kwargs)
+
+    def recording_decode(stream_dict, stream_data):
+        threads.append(threading.current_thread().name)
+        return decode(stream_dict, stream_data)
+
+    uk.close_parse_executor()
+    monkeypatch.setattr(uk, "ThreadPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(uk, "_decode_pdf_stream", recording_decode)
+    monkeypatch.setattr(uk.os, "cpu_count", lambda: 8)
+    serial = list(uk._extract_stream_chunks(raw))
+    assert pools == []
+    assert threads == [threading.current_thread().name] * 3
+
+    monkeypatch.setattr(uk, "_PARALLEL_INFLATE_MIN_BYTES", 1)
+    threads.clear()
+    try:
+        for _ in range(2):
+            chunks = list(uk._extract_stream_chunks(raw))
+            assert chunks == serial == ["Stream 0", "Stream 1", "Stream 2"]
+    finally:
+        uk.close_parse_executor()
+    # One shared pool serves every large document.
+    assert pools == [uk._PARALLEL_INFLATE_WORKERS]
+    assert len(threads) == 6
+    assert all(name.startswith("uk-inflate") for name in threads)
+
+
 def test_extract_pdf_text_handles_multiple_filters_with_flate():
     content = b"(Multi filter stream)"
     compressed = zlib.compress(content)
@@ -453,3 +721,127 @@ def test_extract_pdf_text_handles_object_streams():
     text = uk._extract_pdf_text(raw)
 
     assert "Orbit Labs PLC" in text
+
+
+def test_extract_strings_from_bytes_decodes_only_literal_bodies():
+    raw = b"%PDF-1.4\n(Caf\xe9 Ltd) Tj (Line\\(1\\)) Tj (\\101BC) Tj () Tj\n%%EOF"
+
+    assert list(uk._extract_strings_from_bytes(raw)) == ["Caf\xe9 Ltd", "Line(1)", "ABC"]
+
+
+def test_unescape_pdf_string_handles_control_and_malformed_escapes():
+    assert uk._unescape_pdf_string("plain text") == "plain text"
+    assert uk._unescape_pdf_string(r"a\nb\tc\\d") == "a\nb\tc\\d"
+    assert uk._unescape_pdf_string(r"\1234") == "S4"
+    assert uk._unescape_pdf_string(r"bad\9x") == "badx"
+    assert uk._unescape_pdf_string("trailing\\") == "trailing"
+
+
+def _png_encode_rows(rows: list[bytes], filters: list[int]) -> bytes:
+    def paeth(left, up, up_left):
+        p = left + up - up_left
+        pa, pb, pc = abs(p - left), abs(p - up), abs(p - up_left)
+        if pa <= pb and pa <= pc:
+            return left
+        return up if pb <= pc else up_left
+
+    encoded = bytearray()
+    prev = bytes(len(rows[0]))
+    for row, filter_type in zip(rows, filters, strict=True):
+        encoded.append(filter_type)
+        for i, value in enumerate(row):
+            left = row[i - 1] if i else 0
+            up_left = prev[i - 1] if i else 0
+            predicted = (
+                0,
+                left,
+                prev[i],
+                (left + prev[i]) // 2,
+                paeth(left, prev[i], up_left),
+            )[filter_type]
+            encoded.append((value - predicted) % 256)
+        prev = row
+    return bytes(encoded)
+
+
+def test_png_predictor_round_trips_mixed_filters_and_short_tail():
+    rows = [bytes((i * 37 + j * 11) % 256 for j in range(6)) for i in range(5)]
+    encoded = _png_encode_rows(rows, [0, 1, 2, 3, 4])
+    # Drop the last two bytes to exercise a truncated final row.
+    assert uk._apply_png_predictor(encoded[:-2], 6) == b"".join(rows)[:-2]
+    uniform_up = _png_encode_rows(rows, [2] * 5)
+    assert uk._apply_png_predictor(uniform_up, 6) == b"".join(rows)
+    assert uk._apply_png_predictor(b"\x09abc", 3) == b"\x09abc"
+
+
+def test_tiff_predictor_accumulates_rows_with_partial_tail():
+    assert uk._apply_tiff_predictor(b"\x01\x01\x01\xff\x02\x05", 4) == b"\x01\x02\x03\x02\x02\x07"
+
+
+def test_date_formatting_is_memoized_per_distinct_date():
+    uk._format_named_date.cache_clear()
+
+    for _ in range(3):
+        assert uk._parse_date_from_line("Made up to 7 October 2023") == "2023-10-07"
+
+    info = uk._format_named_date.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_find_company_number_fallbacks_keep_their_precedence_in_one_pass():
+    lines = ["Batch AB1234CD printed", "SC123456", "Company registered number 01234567"]
+
+    assert uk._find_company_number(lines) == "01234567"
+    assert uk._find_company_number(lines[:2]) == "SC123456"
+    assert uk._find_company_number(lines[:1]) == "AB1234CD"
+    assert uk._find_company_number(["Form 12345678", "Payment ref 87654321"]) == ""
+
+
+def test_find_company_number_reuses_precomputed_lowered_lines():
+    lines = ["Company registered number 0999999X here", "SC123456"]
+    lowered_lines = [line.lower() for line in lines]
+
+    assert uk._find_company_number(lines, candidates=()) == "0999999X"
+    assert uk._find_company_number(lines, candidates=(), lowered_lines=lowered_lines) == "0999999X"
+    # The supplied lower-cased lines are used as given rather than recomputed.
+    assert uk._find_company_number(lines, candidates=(), lowered_lines=["", ""]) == "SC123456"
+
+
+def test_iter_label_lines_yields_fields_in_document_order():
+    lines = [
+        "COMPANY NAME IN FULL: Acme Ltd",
+        "Nothing to see",
+        "Company number 01234567 made up to 1 May 2024",
+        "Registration number: SC123456",
+    ]
+
+    assert list(uk._iter_label_lines("\n".join(lines).lower())) == [
+        ("company_name", 0),
+        ("company_number", 2),
+        ("filing_date", 2),
+        ("company_number", 3),
+    ]
+    assert uk._find_company_number(lines, candidates=[3]) == "SC123456"
+
+
+def test_find_labeled_fields_stops_scanning_once_all_fields_resolve(monkeypatch):
+    lines = [
+        "Company name: Acme Ltd",
+        "Company number: 01234567",
+        "Made up to 1 May 2024",
+        "Company name: Later Ltd",
+    ]
+    seen: list[tuple[str, int]] = []
+    original = uk._iter_label_lines
+
+    def _recording(lowered):
+        for hit in original(lowered):
+            seen.append(hit)
+            yield hit
+
+    monkeypatch.setattr(uk, "_iter_label_lines", _recording)
+
+    fields = uk._find_labeled_fields(lines, "\n".join(lines).lower())
+
+    assert fields == ("Acme Ltd", "01234567", "2024-05-01")
+    assert seen == [("company_name", 0), ("company_number", 1), ("filing_date", 2)]
@@ -42,6 +42,9 @@ class MockCompaniesHouseAdapter:
 
 
 class _MockCompaniesHouseClient:
+    def __init__(self, **_kwargs):
+        pass
+
     async def __aenter__(self):
         return self
 
@@ -83,6 +86,14 @@ class _MockCompaniesHouseClient:
             return httpx.Response(200, request=request, content=pdf)
         return httpx.Response(404, request=request)
 
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs):
+        assert method == "GET"
+        yield await self.get(url, **kwargs)
+
+    async def aclose(self):
+        return None
+
 
 @pytest.mark.asyncio
 async def test_uk_flow_inserts_uk_filing_with_payload_keys(tmp_path, monkeypatch):
@@ -173,7 +184,7 @@ async def test_uk_flow_mocks_companies_house_api_and_inserts_filing(tmp_path, mo
     monkeypatch.setattr(ingest_flow, "DB_PATH", str(db_path))
     monkeypatch.setattr(ingest_flow, "RAW_DIR", raw_dir)
     monkeypatch.setattr(ingest_flow, "get_adapter", lambda _name: uk_adapter)
-    monkeypatch.setattr(uk_adapter.httpx, "AsyncClient", _MockCompaniesHouseClient)
+    monkeypatch.setattr(httpx, "AsyncClient", _MockCompaniesHouseClient)
     monkeypatch.setattr(uk_adapter, "tracked_call", dummy_tracked_call)
     monkeypatch.setenv("COMPANIES_HOUSE_API_KEY", "test-key")
     monkeypatch.setattr(ingest_flow.S3, "put_object", lambda **_kwargs: None)